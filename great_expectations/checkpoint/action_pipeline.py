@@ -0,0 +1,231 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from great_expectations.checkpoint.actions import (
+    EmailAction,
+    MicrosoftTeamsNotificationAction,
+    OpsgenieAlertAction,
+    PagerdutyAlertAction,
+    SlackNotificationAction,
+    UpdateDataDocsAction,
+    ValidationAction,
+)
+from great_expectations.checkpoint.util import send_slack_notification
+from great_expectations.data_context.types.resource_identifiers import (
+    ValidationResultIdentifier,
+)
+
+logger = logging.getLogger(__name__)
+
+# Slack rejects messages of more than 50 blocks
+MAX_SLACK_MESSAGE_BLOCKS = 50
+
+
+class ActionPipeline:
+    """Defers the slow actions of validation operators (building Data Docs, sending notifications) to the end of a run,
+    so that validations do not wait for them.
+
+    * Store actions, and actions the pipeline does not know, run at once: later actions and validations may depend on
+      what they store.
+    * UpdateDataDocsAction return the URLs of the pages they would build right away, and the pages of all of them are
+      built by a single build_data_docs call per Data Context and list of sites when the pipeline is flushed.
+    * SlackNotificationAction render their message right away; the messages to the same webhook are sent together, in as
+      few Slack messages as possible, when the pipeline is flushed.
+    * Other notifications are sent on a background executor.
+
+    The result of a deferred action is a dict that is filled in when the pipeline is flushed.
+
+    Args:
+        max_workers: the number of threads sending notifications in the background
+    """
+
+    _background_action_classes = (
+        EmailAction,
+        MicrosoftTeamsNotificationAction,
+        OpsgenieAlertAction,
+        PagerdutyAlertAction,
+    )
+
+    def __init__(self, max_workers: int = 4):
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._futures: List[Tuple[Future, dict]] = []
+        # Identifiers of the resources to build, by data context and site names
+        self._data_docs_builds: Dict[
+            tuple, Tuple[object, Optional[list], list]
+        ] = OrderedDict()
+        # Rendered messages and the results to fill in once they are sent, by webhook
+        self._slack_messages: Dict[str, List[Tuple[dict, dict]]] = OrderedDict()
+
+    def run_action(
+        self,
+        action: ValidationAction,
+        validation_result_suite,
+        validation_result_suite_identifier,
+        data_asset,
+        payload=None,
+    ) -> Optional[dict]:
+        """Runs (or defers) an action on a validation result, and returns its (possibly pending) result."""
+        if validation_result_suite is None or not isinstance(
+            validation_result_suite_identifier, ValidationResultIdentifier
+        ):
+            # The action reports or ignores these itself
+            return action.run(
+                validation_result_suite=validation_result_suite,
+                validation_result_suite_identifier=validation_result_suite_identifier,
+                data_asset=data_asset,
+                payload=payload,
+            )
+
+        if type(action) is UpdateDataDocsAction:
+            self._add_data_docs_build(action, validation_result_suite_identifier)
+            return action._get_data_docs_validation_results(
+                validation_result_suite_identifier
+            )
+
+        if type(action) is SlackNotificationAction:
+            query = action._render_query(validation_result_suite, payload=payload)
+            result = {"slack_notification_result": ""}
+            if query is not None:
+                with self._lock:
+                    self._slack_messages.setdefault(action.slack_webhook, []).append(
+                        (query, result)
+                    )
+            return result
+
+        if type(action) in self._background_action_classes:
+            result = {}
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="ge_action_pipeline",
+                    )
+                future = self._executor.submit(
+                    action.run,
+                    validation_result_suite=validation_result_suite,
+                    validation_result_suite_identifier=validation_result_suite_identifier,
+                    data_asset=data_asset,
+                    payload=payload,
+                )
+                self._futures.append((future, result))
+            return result
+
+        return action.run(
+            validation_result_suite=validation_result_suite,
+            validation_result_suite_identifier=validation_result_suite_identifier,
+            data_asset=data_asset,
+            payload=payload,
+        )
+
+    def _add_data_docs_build(
+        self,
+        action: UpdateDataDocsAction,
+        validation_result_suite_identifier: ValidationResultIdentifier,
+    ) -> None:
+        site_names = action._site_names
+        key = (
+            id(action.data_context),
+            None if site_names is None else tuple(site_names),
+        )
+        with self._lock:
+            _, _, resource_identifiers = self._data_docs_builds.setdefault(
+                key, (action.data_context, site_names, [])
+            )
+            for resource_identifier in (
+                validation_result_suite_identifier,
+                validation_result_suite_identifier.expectation_suite_identifier,
+            ):
+                if resource_identifier not in resource_identifiers:
+                    resource_identifiers.append(resource_identifier)
+
+    @staticmethod
+    def _combine_slack_messages(queries: List[dict]) -> List[Tuple[dict, List[int]]]:
+        """Combines Slack messages into as few messages of at most MAX_SLACK_MESSAGE_BLOCKS blocks as possible.
+
+        Returns:
+            Each combined message, with the indexes of the messages it combines
+        """
+        messages = []
+        for idx, query in enumerate(queries):
+            blocks = query.get("blocks", [])
+            if (
+                messages
+                and len(messages[-1][0]["blocks"]) + len(blocks)
+                <= MAX_SLACK_MESSAGE_BLOCKS
+            ):
+                message, idxs = messages[-1]
+                message["blocks"].extend(blocks)
+                message["text"] = "\n".join(
+                    text for text in (message["text"], query.get("text")) if text
+                )
+                idxs.append(idx)
+            else:
+                messages.append(
+                    ({"blocks": list(blocks), "text": query.get("text")}, [idx])
+                )
+        return messages
+
+    def flush(self) -> None:
+        """Builds the deferred Data Docs, sends the pending notifications and fills in the results of the deferred
+        actions. All of them are run even if some fail; the first exception is raised once they are done."""
+        with self._lock:
+            data_docs_builds = list(self._data_docs_builds.values())
+            self._data_docs_builds.clear()
+            slack_messages = list(self._slack_messages.items())
+            self._slack_messages.clear()
+            futures = self._futures
+            self._futures = []
+
+        exceptions = []
+        for data_context, site_names, resource_identifiers in data_docs_builds:
+            try:
+                data_context.build_data_docs(
+                    site_names=site_names, resource_identifiers=resource_identifiers
+                )
+            except Exception as e:
+                logger.exception("Error building Data Docs")
+                exceptions.append(e)
+
+        for slack_webhook, queries_and_results in slack_messages:
+            for message, idxs in self._combine_slack_messages(
+                [query for query, _ in queries_and_results]
+            ):
+                slack_notif_result = send_slack_notification(
+                    message, slack_webhook=slack_webhook
+                )
+                for idx in idxs:
+                    queries_and_results[idx][1][
+                        "slack_notification_result"
+                    ] = slack_notif_result
+
+        for future, result in futures:
+            try:
+                result.update(future.result() or {})
+            except Exception as e:
+                logger.exception("Error running validation action")
+                exceptions.append(e)
+
+        if exceptions:
+            raise exceptions[0]
+
+    def close(self) -> None:
+        """Flushes the pipeline and stops its executor."""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                executor = self._executor
+                self._executor = None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ActionPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -166,6 +166,21 @@ class SlackNotificationAction(ValidationAction):
                 )
             )
 
+        query = self._render_query(validation_result_suite, payload=payload)
+        if query is not None:
+            # this will actually sent the POST request to the Slack webapp server
+            slack_notif_result = send_slack_notification(
+                query, slack_webhook=self.slack_webhook
+            )
+
+            # sending payload back as dictionary
+            return {"slack_notification_result": slack_notif_result}
+        else:
+            return {"slack_notification_result": ""}
+
+    def _render_query(self, validation_result_suite, payload=None):
+        """Returns the Slack message to send for the validation result, or None if its status does not trigger a
+        notification."""
         validation_success = validation_result_suite.success
         data_docs_pages = None
 
@@ -182,18 +197,10 @@ class SlackNotificationAction(ValidationAction):
             or self.notify_on == "failure"
             and not validation_success
         ):
-            query = self.renderer.render(
+            return self.renderer.render(
                 validation_result_suite, data_docs_pages, self.notify_with
             )
-            # this will actually sent the POST request to the Slack webapp server
-            slack_notif_result = send_slack_notification(
-                query, slack_webhook=self.slack_webhook
-            )
-
-            # sending payload back as dictionary
-            return {"slack_notification_result": slack_notif_result}
-        else:
-            return {"slack_notification_result": ""}
+        return None
 
 
 class PagerdutyAlertAction(ValidationAction):
@@ -940,6 +947,12 @@ class UpdateDataDocsAction(ValidationAction):
             ],
         )
 
+        return self._get_data_docs_validation_results(
+            validation_result_suite_identifier
+        )
+
+    def _get_data_docs_validation_results(self, validation_result_suite_identifier):
+        """Returns the URL of the validation result page in each of the sites, by site name."""
         # get the URL for the validation result
         docs_site_urls_list = self.data_context.get_docs_sites_urls(
             resource_identifier=validation_result_suite_identifier,
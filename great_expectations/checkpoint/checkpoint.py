@@ -3,10 +3,13 @@ import datetime
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.checkpoint.action_pipeline import ActionPipeline
 from great_expectations.checkpoint.configurator import SimpleCheckpointConfigurator
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
 from great_expectations.checkpoint.util import get_substituted_validation_dict
@@ -26,6 +29,16 @@ from great_expectations.validator.validator import Validator
 logger = logging.getLogger(__name__)
 
 
+def _contains_callable(value) -> bool:
+    if callable(value):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_callable(item) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return any(_contains_callable(item) for item in value)
+    return False
+
+
 class Checkpoint:
     """
     --ge-feature-maturity-info--
@@ -246,50 +259,255 @@ class Checkpoint:
 
         run_id = run_id or RunIdentifier(run_name=run_name, run_time=run_time)
 
+        max_concurrent_validations: Optional[
+            int
+        ] = substituted_runtime_config.runtime_configuration.get(
+            "max_concurrent_validations"
+        )
+        # Actions (storing results, building Data Docs, notifications) write to shared resources, so validations that
+        # run concurrently take turns running them.
+        action_lock = threading.Lock()
+        # With async_actions, Data Docs are built and notifications sent once all of the validations are done
+        action_pipeline: Optional[ActionPipeline] = (
+            ActionPipeline()
+            if substituted_runtime_config.runtime_configuration.get("async_actions")
+            else None
+        )
+
+        def run_validations(
+            idxs: List[int], close_session_connections: bool = False
+        ) -> ValidationOperatorResult:
+            return self._run_validations(
+                substituted_runtime_config=substituted_runtime_config,
+                validations=validations,
+                idxs=idxs,
+                run_id=run_id,
+                result_format=result_format,
+                action_lock=action_lock,
+                action_pipeline=action_pipeline,
+                close_session_connections=close_session_connections,
+            )
+
+        validations_failed = True
+        try:
+            validation_groups: List[List[int]] = self._get_validation_groups(
+                substituted_runtime_config=substituted_runtime_config,
+                validations=validations,
+            )
+            if (
+                len(validation_groups) <= 1
+                or max_concurrent_validations is None
+                or max_concurrent_validations <= 1
+            ):
+                for idxs in validation_groups:
+                    val_op_run_result = run_validations(idxs)
+                    run_results.update(val_op_run_result.run_results)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=max_concurrent_validations,
+                    thread_name_prefix="ge_checkpoint_validation",
+                ) as executor:
+                    # The threads of the pool close the connections they bound their batches to, which no other
+                    # thread may use
+                    futures = [
+                        executor.submit(
+                            run_validations, idxs, close_session_connections=True
+                        )
+                        for idxs in validation_groups
+                    ]
+                # A failed validation does not prevent the others from completing (and running their actions); the first
+                # failure is raised once all of them are done, and results are gathered in the order of the validations.
+                exceptions = []
+                for idxs, future in zip(validation_groups, futures):
+                    try:
+                        run_results.update(future.result().run_results)
+                    except Exception as e:
+                        logger.error(
+                            f"Exception occurred while running validation[{idxs[0]}] of checkpoint '{self.name}': {str(e)}"
+                        )
+                        exceptions.append(e)
+                if exceptions:
+                    raise exceptions[0]
+            validations_failed = False
+        finally:
+            if action_pipeline is not None:
+                try:
+                    action_pipeline.close()
+                except Exception:
+                    if not validations_failed:
+                        raise
+                    # The error of the validations takes precedence over errors running the deferred actions
+                    logger.exception(
+                        f"Exception occurred while running deferred actions of checkpoint '{self.name}'"
+                    )
+
+        return CheckpointResult(
+            run_id=run_id, run_results=run_results, checkpoint_config=self.config
+        )
+
+    @staticmethod
+    def _get_validation_groups(
+        substituted_runtime_config: CheckpointConfig, validations: List[dict]
+    ) -> List[List[int]]:
+        """Groups consecutive validations of the same batch request against different expectation suites (with the
+        same actions and evaluation parameters), so that each group loads its batch once and validates all of its
+        suites in a single pass over it.
+
+        Returns:
+            The indexes of the validations of each group, in order
+        """
+        validation_groups: List[List[int]] = []
+        group_key = None
+        group_expectation_suite_names = set()
         for idx, validation_dict in enumerate(validations):
+            key = None
+            expectation_suite_name = None
             try:
                 substituted_validation_dict: dict = get_substituted_validation_dict(
                     substituted_runtime_config=substituted_runtime_config,
                     validation_dict=validation_dict,
                 )
-                batch_request: BatchRequest = substituted_validation_dict.get(
+                batch_request: BatchRequest = substituted_validation_dict[
                     "batch_request"
-                )
-                expectation_suite_name: str = substituted_validation_dict.get(
+                ]
+                expectation_suite_name = substituted_validation_dict[
                     "expectation_suite_name"
-                )
-                action_list: list = substituted_validation_dict.get("action_list")
-
-                validator: Validator = self.data_context.get_validator(
-                    batch_request=batch_request,
-                    expectation_suite_name=expectation_suite_name,
-                )
-                action_list_validation_operator: ActionListValidationOperator = (
-                    ActionListValidationOperator(
-                        data_context=self.data_context,
-                        action_list=action_list,
-                        result_format=result_format,
-                        name=f"{self.name}-checkpoint-validation[{idx}]",
+                ]
+                # In-memory batch data cannot be compared, so runtime batches are never shared; neither are requests
+                # with callables (such as a custom_filter_function), which batch request ids only identify by name.
+                if batch_request.batch_data is None and not any(
+                    _contains_callable(value)
+                    for value in (
+                        batch_request.partition_request,
+                        batch_request.batch_spec_passthrough,
+                        substituted_validation_dict["action_list"],
+                        substituted_validation_dict["evaluation_parameters"],
                     )
-                )
-                val_op_run_result: ValidationOperatorResult = (
-                    action_list_validation_operator.run(
-                        assets_to_validate=[validator],
-                        run_id=run_id,
-                        evaluation_parameters=substituted_validation_dict.get(
-                            "evaluation_parameters"
+                ):
+                    key = (
+                        batch_request.id,
+                        json.dumps(
+                            substituted_validation_dict["action_list"],
+                            sort_keys=True,
+                            default=str,
+                        ),
+                        json.dumps(
+                            substituted_validation_dict["evaluation_parameters"],
+                            sort_keys=True,
+                            default=str,
                         ),
-                        result_format=result_format,
+                    )
+            except CheckpointError:
+                # Reported when the validation is run
+                pass
+            except (TypeError, ValueError) as e:
+                # The validation cannot be compared with others: it is validated on its own
+                logger.debug(
+                    f"Unable to group validation[{idx}] of checkpoint with others: {str(e)}"
+                )
+                key = None
+
+            if (
+                key is not None
+                and key == group_key
+                and expectation_suite_name not in group_expectation_suite_names
+            ):
+                validation_groups[-1].append(idx)
+            else:
+                validation_groups.append([idx])
+                group_expectation_suite_names = set()
+            group_key = key
+            group_expectation_suite_names.add(expectation_suite_name)
+        return validation_groups
+
+    def _run_validations(
+        self,
+        substituted_runtime_config: CheckpointConfig,
+        validations: List[dict],
+        idxs: List[int],
+        run_id: RunIdentifier,
+        result_format: Optional[dict],
+        action_lock: Optional[threading.Lock] = None,
+        action_pipeline: Optional[ActionPipeline] = None,
+        close_session_connections: bool = False,
+    ) -> ValidationOperatorResult:
+        substituted_validation_dicts: List[dict] = []
+        for idx in idxs:
+            try:
+                substituted_validation_dicts.append(
+                    get_substituted_validation_dict(
+                        substituted_runtime_config=substituted_runtime_config,
+                        validation_dict=validations[idx],
                     )
                 )
-                run_results.update(val_op_run_result.run_results)
             except CheckpointError as e:
                 raise CheckpointError(
                     f"Exception occurred while running validation[{idx}] of checkpoint '{self.name}': {e.message}"
                 )
-        return CheckpointResult(
-            run_id=run_id, run_results=run_results, checkpoint_config=self.config
+
+        # Loading only the columns the expectation suites reference is opt-in
+        column_projection: bool = bool(
+            substituted_runtime_config.runtime_configuration.get(
+                "column_projection", False
+            )
         )
+        validators: List[Validator] = []
+        try:
+            # The validations of a group share their batch request, actions and evaluation parameters
+            substituted_validation_dict: dict = substituted_validation_dicts[0]
+            batch_request: BatchRequest = substituted_validation_dict.get(
+                "batch_request"
+            )
+            action_list: list = substituted_validation_dict.get("action_list")
+
+            if len(substituted_validation_dicts) == 1:
+                validators = [
+                    self.data_context.get_validator(
+                        batch_request=batch_request,
+                        expectation_suite_name=substituted_validation_dict.get(
+                            "expectation_suite_name"
+                        ),
+                        column_projection=column_projection,
+                    )
+                ]
+            else:
+                validators = self.data_context.get_validators(
+                    batch_request=batch_request,
+                    expectation_suite_names=[
+                        validation_dict.get("expectation_suite_name")
+                        for validation_dict in substituted_validation_dicts
+                    ],
+                    column_projection=column_projection,
+                )
+            action_list_validation_operator: ActionListValidationOperator = ActionListValidationOperator(
+                data_context=self.data_context,
+                action_list=action_list,
+                result_format=result_format,
+                name=f"{self.name}-checkpoint-validation[{','.join(str(idx) for idx in idxs)}]",
+                action_lock=action_lock,
+                action_pipeline=action_pipeline,
+            )
+            return action_list_validation_operator.run(
+                assets_to_validate=validators,
+                run_id=run_id,
+                evaluation_parameters=substituted_validation_dict.get(
+                    "evaluation_parameters"
+                ),
+                result_format=result_format,
+            )
+        except CheckpointError as e:
+            raise CheckpointError(
+                f"Exception occurred while running validation[{idxs[0]}] of checkpoint '{self.name}': {e.message}"
+            )
+        finally:
+            if close_session_connections:
+                execution_engines = {
+                    id(validator.execution_engine): validator.execution_engine
+                    for validator in validators
+                }
+                for execution_engine in execution_engines.values():
+                    if hasattr(execution_engine, "close_session_connections"):
+                        execution_engine.close_session_connections()
 
     def self_check(self, pretty_print=True) -> dict:
         # Provide visibility into parameters that Checkpoint was instantiated with.
@@ -2,8 +2,11 @@ import copy
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
+from functools import lru_cache
+from typing import Tuple
 
 from pyparsing import (
     CaselessKeyword,
@@ -209,6 +212,47 @@ def build_evaluation_parameters(
 
 expr = EvaluationParameterParser()
 
+# Parsers keep the expression stack of the last expression they parsed, so each thread parses with its own
+_thread_local_parsers = threading.local()
+
+# The number of distinct expressions whose parse results are cached
+EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE = 8192
+
+
+def _parse_evaluation_parameter_expression(parameter_expression) -> Tuple[tuple, tuple]:
+    """Parses a parameter expression, returning its parse results and its expression stack, which evaluate_stack
+    evaluates once its variables are substituted. The parse results of an expression that cannot be parsed are
+    ("Parse Failure", parameter_expression, (error, line, column))."""
+    parser = getattr(_thread_local_parsers, "parser", None)
+    if parser is None:
+        parser = EvaluationParameterParser()
+        _thread_local_parsers.parser = parser
+    try:
+        # Calling get_parser clears the stack
+        L = parser.get_parser().parseString(parameter_expression, parseAll=True)
+    except ParseException as err:
+        return (
+            "Parse Failure",
+            parameter_expression,
+            (str(err), err.line, err.column),
+        ), ()
+    return tuple(L), tuple(parser.exprStack)
+
+
+_compile_evaluation_parameter_expression = lru_cache(
+    maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE
+)(_parse_evaluation_parameter_expression)
+
+
+def compile_evaluation_parameter_expression(
+    parameter_expression,
+) -> Tuple[tuple, tuple]:
+    """Returns the parse results and the expression stack of a parameter expression, parsing each distinct expression
+    only once."""
+    if not isinstance(parameter_expression, str):
+        return _parse_evaluation_parameter_expression(parameter_expression)
+    return _compile_evaluation_parameter_expression(parameter_expression)
+
 
 def find_evaluation_parameter_dependencies(parameter_expression):
     """Parse a parameter expression to identify dependencies including GE URNs.
@@ -222,23 +266,20 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
-        )
+        L, expr_stack = compile_evaluation_parameter_expression(parameter_expression)
     except AttributeError as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
+    if len(L) > 0 and L[0] == "Parse Failure":
+        err_str, err_line, err_col = L[-1]
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
 
-    for word in expr.exprStack:
+    for word in expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -292,12 +333,7 @@ def parse_evaluation_parameter(
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
-    try:
-        L = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
+    L, expr_stack = compile_evaluation_parameter_expression(parameter_expression)
 
     if len(L) == 1 and L[0] not in evaluation_parameters:
         # In this special case there were no operations to find, so only one value, but we don't have something to
@@ -333,9 +369,12 @@ def parse_evaluation_parameter(
         return evaluation_parameters[L[0]]
 
     elif len(L) == 0 or L[0] != "Parse Failure":
-        for i, ob in enumerate(expr.exprStack):
-            if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
+        expr_stack = [
+            str(evaluation_parameters[ob])
+            if isinstance(ob, str) and ob in evaluation_parameters
+            else ob
+            for ob in expr_stack
+        ]
 
     else:
         err_str, err_line, err_col = L[-1]
@@ -344,7 +383,7 @@ def parse_evaluation_parameter(
         )
 
     try:
-        result = expr.evaluate_stack(expr.exprStack)
+        result = expr.evaluate_stack(list(expr_stack))
     except Exception as e:
         exception_traceback = traceback.format_exc()
         exception_message = (
@@ -2,7 +2,7 @@ import datetime
 import json
 import logging
 from copy import deepcopy
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.evaluation_parameters import (
@@ -33,6 +33,194 @@ from great_expectations.types import SerializableDictDot
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value) -> Any:
+    """Returns a hashable value that is equal for equal values (and possibly for some unequal ones, such as a list and
+    a tuple of the same items); raises TypeError if value holds an unhashable object."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+class _ExpectationIndex:
+    """The positions of the expectations of a suite, by expectation type and domain kwargs and by expectation type and
+    success kwargs.
+
+    Keys are a hashable form of the kwargs, so an index lookup returns the candidates that may match a configuration,
+    which are then compared with ExpectationConfiguration.isEquivalentTo. Expectations whose kwargs are not hashable
+    are candidates for any lookup.
+    """
+
+    def __init__(self):
+        self._domain_positions: Dict[tuple, List[int]] = dict()
+        self._success_positions: Dict[tuple, List[int]] = dict()
+        # The keys each position was indexed under (None for unhashable kwargs)
+        self._keys: Dict[int, Optional[Tuple[tuple, tuple]]] = dict()
+        self._unindexed_positions: Set[int] = set()
+
+    @staticmethod
+    def _get_keys(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Optional[Tuple[tuple, tuple]]:
+        expectation_type = expectation_configuration.expectation_type
+        try:
+            return (
+                (
+                    expectation_type,
+                    _freeze(expectation_configuration.get_domain_kwargs()),
+                ),
+                (
+                    expectation_type,
+                    _freeze(expectation_configuration.get_success_kwargs()),
+                ),
+            )
+        except TypeError:
+            return None
+
+    def add(
+        self, position: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        keys = self._get_keys(expectation_configuration)
+        self._keys[position] = keys
+        if keys is None:
+            self._unindexed_positions.add(position)
+            return
+        domain_key, success_key = keys
+        self._domain_positions.setdefault(domain_key, []).append(position)
+        self._success_positions.setdefault(success_key, []).append(position)
+
+    def discard(self, position: int) -> None:
+        keys = self._keys.pop(position, None)
+        self._unindexed_positions.discard(position)
+        if keys is None:
+            return
+        for positions_by_key, key in zip(
+            (self._domain_positions, self._success_positions), keys
+        ):
+            positions = positions_by_key[key]
+            positions.remove(position)
+            if not positions:
+                del positions_by_key[key]
+
+    def get_candidates(
+        self, expectation_configuration: ExpectationConfiguration, match_type: str
+    ) -> Optional[List[int]]:
+        """Returns the sorted positions of the expectations that may match expectation_configuration, or None if it
+        cannot be looked up (and all of the expectations must be compared with it)."""
+        keys = self._get_keys(expectation_configuration)
+        if keys is None:
+            return None
+        domain_key, success_key = keys
+        if match_type == "domain":
+            positions = self._domain_positions.get(domain_key, [])
+        else:
+            # Expectations with equal kwargs also have equal success kwargs
+            positions = self._success_positions.get(success_key, [])
+        return sorted(self._unindexed_positions.union(positions))
+
+
+class _ExpectationList(list):
+    """The list of expectations of an ExpectationSuite, along with an _ExpectationIndex of them.
+
+    The index is built on the first lookup, kept up to date as expectations are appended or replaced, and rebuilt after
+    any other change to the list. Expectations whose kwargs are changed in place must be re-indexed with reindex
+    (ExpectationSuite.patch_expectation does so).
+    """
+
+    # A class attribute, since unpickling appends the items of a list before restoring its attributes
+    _index: Optional[_ExpectationIndex] = None
+
+    def _get_index(self) -> _ExpectationIndex:
+        if self._index is None:
+            index = _ExpectationIndex()
+            for position, expectation_configuration in enumerate(self):
+                index.add(position, expectation_configuration)
+            self._index = index
+        return self._index
+
+    def _invalidate_index(self) -> None:
+        self._index = None
+
+    def find_indexes(
+        self, expectation_configuration: ExpectationConfiguration, match_type: str
+    ) -> List[int]:
+        """Returns the positions of the expectations that are equivalent to expectation_configuration."""
+        candidates = self._get_index().get_candidates(
+            expectation_configuration, match_type
+        )
+        if candidates is None:
+            candidates = range(len(self))
+        return [
+            position
+            for position in candidates
+            if self[position].isEquivalentTo(expectation_configuration, match_type)
+        ]
+
+    def reindex(self, position: int) -> None:
+        """Updates the index for the expectation at position, after its kwargs were changed."""
+        if self._index is not None:
+            self._index.discard(position)
+            self._index.add(position, self[position])
+
+    def append(self, expectation_configuration) -> None:
+        super().append(expectation_configuration)
+        if self._index is not None:
+            self._index.add(len(self) - 1, expectation_configuration)
+
+    def extend(self, expectation_configurations) -> None:
+        for expectation_configuration in expectation_configurations:
+            self.append(expectation_configuration)
+
+    def __iadd__(self, expectation_configurations) -> "_ExpectationList":
+        self.extend(expectation_configurations)
+        return self
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        if isinstance(key, int):
+            self.reindex(key if key >= 0 else len(self) + key)
+        else:
+            self._invalidate_index()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._invalidate_index()
+
+    def __imul__(self, n) -> "_ExpectationList":
+        result = super().__imul__(n)
+        self._invalidate_index()
+        return result
+
+    def insert(self, position, expectation_configuration) -> None:
+        super().insert(position, expectation_configuration)
+        self._invalidate_index()
+
+    def pop(self, position=-1):
+        expectation_configuration = super().pop(position)
+        self._invalidate_index()
+        return expectation_configuration
+
+    def remove(self, expectation_configuration) -> None:
+        super().remove(expectation_configuration)
+        self._invalidate_index()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate_index()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._invalidate_index()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._invalidate_index()
+
+
 class ExpectationSuite(SerializableDictDot):
     """
     This ExpectationSuite object has create, read, update, and delete functionality for its expectations:
@@ -40,6 +228,9 @@ class ExpectationSuite(SerializableDictDot):
         -read: self.find_expectation_indexes()
         -update: self.add_expectation() or self.patch_expectation()
         -delete: self.remove_expectation()
+
+    Expectations are indexed by expectation type and domain kwargs and by expectation type and success kwargs, so that
+    finding, adding and replacing an expectation takes constant time rather than a scan of the suite.
     """
 
     def __init__(
@@ -54,12 +245,12 @@ class ExpectationSuite(SerializableDictDot):
         self.expectation_suite_name = expectation_suite_name
         if expectations is None:
             expectations = []
-        self.expectations = [
+        self.expectations = _ExpectationList(
             ExpectationConfiguration(**expectation)
             if isinstance(expectation, dict)
             else expectation
             for expectation in expectations
-        ]
+        )
         if evaluation_parameters is None:
             evaluation_parameters = {}
         self.evaluation_parameters = evaluation_parameters
@@ -76,6 +267,16 @@ class ExpectationSuite(SerializableDictDot):
         ensure_json_serializable(meta)
         self.meta = meta
 
+    @property
+    def expectations(self) -> List[ExpectationConfiguration]:
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations: List[ExpectationConfiguration]) -> None:
+        if not isinstance(expectations, _ExpectationList):
+            expectations = _ExpectationList(expectations)
+        self._expectations = expectations
+
     def add_citation(
         self,
         comment,
@@ -308,12 +509,9 @@ class ExpectationSuite(SerializableDictDot):
             raise InvalidExpectationConfigurationError(
                 "Ensure that expectation configuration is valid."
             )
-        match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if expectation.isEquivalentTo(expectation_configuration, match_type):
-                match_indexes.append(idx)
-
-        return match_indexes
+        if match_type not in ["domain", "success", "runtime"]:
+            return []
+        return self.expectations.find_indexes(expectation_configuration, match_type)
 
     def find_expectations(
         self,
@@ -323,14 +521,7 @@ class ExpectationSuite(SerializableDictDot):
         found_expectation_indexes = self.find_expectation_indexes(
             expectation_configuration, match_type
         )
-        if len(found_expectation_indexes) > 0:
-            return [
-                expectation
-                for idx, expectation in enumerate(self.expectations)
-                if idx in found_expectation_indexes
-            ]
-        else:
-            return []
+        return [self.expectations[idx] for idx in found_expectation_indexes]
 
     def patch_expectation(
         self,
@@ -370,6 +561,7 @@ class ExpectationSuite(SerializableDictDot):
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        self.expectations.reindex(found_expectation_indexes[0])
         return self.expectations[found_expectation_indexes[0]]
 
     def add_expectation(
@@ -1,5 +1,7 @@
+import copy
 import hashlib
 import json
+import sys
 
 
 class IDDict(dict):
@@ -43,5 +45,83 @@ class PartitionDefinition(PartitionDefinitionSubset):
     pass
 
 
+def _freeze(value):
+    """Return value with its dicts, lists and sets (including nested ones) replaced by immutable equivalents."""
+    if isinstance(value, dict):
+        return value if isinstance(value, MetricKwargs) else MetricKwargs(value)
+    if isinstance(value, list):
+        return value if isinstance(value, _FrozenList) else _FrozenList(value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value):
+    """Return a mutable deep copy of a value frozen by _freeze."""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    if isinstance(value, frozenset):
+        return set(copy.deepcopy(list(value)))
+    return copy.deepcopy(value)
+
+
+def _raise_immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} cannot be modified")
+
+
+class _FrozenList(list):
+    """A list nested in a MetricKwargs, which cannot be modified."""
+
+    def __init__(self, iterable=()):
+        super().__init__(_freeze(item) for item in iterable)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _raise_immutable
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return _thaw(self)
+
+    def __reduce__(self):
+        return _FrozenList, (list(self),)
+
+
 class MetricKwargs(IDDict):
-    pass
+    """The domain or value kwargs of a metric.
+
+    MetricKwargs cannot be modified: the dicts, lists and sets they contain are frozen when they are created, so that
+    their id can be computed once and interned, and metric ids compared and hashed cheaply. Copies (copy.copy and
+    copy.deepcopy) are plain, modifiable dicts.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(
+            {key: _freeze(value) for key, value in dict(*args, **kwargs).items()}
+        )
+
+    def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is not None or id_ignore_keys is not None:
+            return super().to_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+        memoized_id = self.__dict__.get("_memoized_id")
+        if memoized_id is None:
+            memoized_id = super().to_id()
+            if isinstance(memoized_id, str):
+                memoized_id = sys.intern(memoized_id)
+            self._memoized_id = memoized_id
+        return memoized_id
+
+    __setitem__ = __delitem__ = __ior__ = _raise_immutable
+    clear = pop = popitem = setdefault = update = _raise_immutable
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return _thaw(self)
+
+    def __reduce__(self):
+        return MetricKwargs, (dict(self),)
@@ -0,0 +1,78 @@
+import logging
+import threading
+from typing import Dict, Tuple
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.engine.url import URL, make_url
+except ImportError:
+    sa = None
+    URL = None
+    make_url = None
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyEngineRegistry:
+    """A process-wide registry of SqlAlchemy engines, so that datasources, execution engines and stores that connect to
+    the same database with the same credentials share one engine, and hence one connection pool.
+
+    Engines are keyed by their url (including its credentials) and by the keyword arguments they are created with, which
+    is where pool options (pool_size, max_overflow, pool_pre_ping, pool_recycle, ...) are given. In-memory sqlite
+    databases are private to the engine that created them, so their engines are never shared.
+    """
+
+    def __init__(self):
+        self._engines: Dict[Tuple[str, str], "sa.engine.Engine"] = dict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(url: "URL", create_engine_kwargs: dict) -> Tuple[str, str]:
+        if hasattr(url, "render_as_string"):
+            url_string = url.render_as_string(hide_password=False)
+        else:
+            url_string = url.__to_string__(hide_password=False)
+        return url_string, repr(sorted(create_engine_kwargs.items()))
+
+    @staticmethod
+    def _is_shareable(url: "URL") -> bool:
+        return not (
+            url.get_backend_name() == "sqlite"
+            and url.database in (None, "", ":memory:")
+        )
+
+    def get_engine(self, url, **create_engine_kwargs) -> "sa.engine.Engine":
+        """Returns the engine registered for url and create_engine_kwargs, creating it with sa.create_engine if there
+        is none yet.
+
+        Args:
+            url: a sqlalchemy URL, or a connection string
+            **create_engine_kwargs: passed to sa.create_engine
+        """
+        url = make_url(url)
+        if not self._is_shareable(url):
+            return sa.create_engine(url, **create_engine_kwargs)
+
+        key = self._get_key(url, create_engine_kwargs)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = sa.create_engine(url, **create_engine_kwargs)
+                self._engines[key] = engine
+                logger.debug(f"Registered a SqlAlchemy engine for {repr(url)}")
+            return engine
+
+    def dispose(self) -> None:
+        """Closes the connection pools of all of the registered engines, and forgets them."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+
+
+sqlalchemy_engine_registry = SqlAlchemyEngineRegistry()
+
+
+def get_sqlalchemy_engine(url, **create_engine_kwargs) -> "sa.engine.Engine":
+    """Returns the shared engine of the process-wide SqlAlchemyEngineRegistry for url and create_engine_kwargs."""
+    return sqlalchemy_engine_registry.get_engine(url, **create_engine_kwargs)
@@ -0,0 +1,241 @@
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+logger = logging.getLogger(__name__)
+
+# The number of seconds for which reflected metadata is reused by default
+DEFAULT_SCHEMA_CACHE_TTL = 300
+
+
+class SqlAlchemySchemaCache:
+    """A cache of the metadata (schema, table and view names, and columns of tables) that SqlAlchemy reflects from
+    databases, which can take seconds per table on warehouses such as Snowflake or Redshift.
+
+    Metadata is keyed by a hash of the url of the engine it was reflected through (credentials included), the schema
+    and the table, and is reflected again once it is older than ttl seconds or has been invalidated. Tables altered
+    during the ttl keep their cached columns until then. In-memory sqlite databases are private to their engine, so
+    their metadata is never cached.
+
+    Args:
+        ttl: the number of seconds for which metadata is reused; None to reuse it until it is invalidated, and 0 not to
+            cache metadata at all
+        persist_path: a file the cache is loaded from, and saved to (by save, and when the process exits), so that
+            other processes reuse its metadata. The file is pickled: only point it at a location that untrusted users
+            cannot write to.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = DEFAULT_SCHEMA_CACHE_TTL,
+        persist_path: Optional[str] = None,
+    ):
+        self._ttl = ttl
+        self._persist_path = persist_path
+        # (created_at, metadata) by (url, kind of metadata, schema name, table name)
+        self._entries: Dict[Tuple, Tuple[float, object]] = dict()
+        self._loaded = persist_path is None
+        self._dirty = False
+        self._lock = threading.RLock()
+        if persist_path is not None:
+            atexit.register(self.save)
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def persist_path(self) -> Optional[str]:
+        return self._persist_path
+
+    @staticmethod
+    def _get_url(engine) -> Optional[str]:
+        """Returns a hash of the url (including its credentials) that the metadata reflected through engine (or a
+        connection) is cached by, or None if it must not be cached."""
+        url = getattr(engine, "url", None)
+        if url is None:
+            url = engine.engine.url
+        if url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            return None
+        # Users with different passwords may see different metadata, but repr(url) masks the password
+        if hasattr(url, "render_as_string"):
+            url_string = url.render_as_string(hide_password=False)
+        else:
+            url_string = url.__to_string__(hide_password=False)
+        return hashlib.sha256(url_string.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self._persist_path, "rb") as infile:
+                self._entries.update(pickle.load(infile))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(
+                f"Unable to load the schema cache from {self._persist_path}: {str(e)}"
+            )
+
+    def save(self) -> None:
+        """Saves the metadata reflected since the cache was last saved to its persist_path, if any."""
+        with self._lock:
+            if self._persist_path is None or not self._dirty:
+                return
+            self._dirty = False
+            self._save()
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(
+                os.path.dirname(os.path.abspath(self._persist_path)), exist_ok=True
+            )
+            temp_path = f"{self._persist_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as outfile:
+                pickle.dump(self._entries, outfile)
+            os.replace(temp_path, self._persist_path)
+        except Exception as e:
+            logger.warning(
+                f"Unable to save the schema cache to {self._persist_path}: {str(e)}"
+            )
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self._ttl is not None and time.time() - created_at > self._ttl
+
+    def _get(
+        self,
+        engine,
+        kind: str,
+        schema_name: Optional[str],
+        table_name: Optional[str],
+        reflect: Callable,
+    ):
+        if self._ttl == 0:
+            return reflect()
+        url = self._get_url(engine)
+        if url is None:
+            return reflect()
+
+        key = (
+            url,
+            kind,
+            None if schema_name is None else str(schema_name),
+            table_name,
+        )
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_expired(entry[0]):
+                return entry[1]
+
+        metadata = reflect()
+        # Reflection finds no columns at all in some cases (such as temporary tables on mssql), which callers work
+        # around: do not keep such results.
+        if metadata:
+            with self._lock:
+                self._entries[key] = (time.time(), metadata)
+                self._dirty = True
+        return metadata
+
+    def get_schema_names(self, engine) -> List[str]:
+        """Returns the names of the schemas of the database of engine."""
+        return list(
+            self._get(
+                engine,
+                "schema_names",
+                None,
+                None,
+                lambda: sa.inspect(engine).get_schema_names(),
+            )
+        )
+
+    def get_table_names(self, engine, schema_name: Optional[str] = None) -> List[str]:
+        """Returns the names of the tables of a schema (of the default schema if None)."""
+        return list(
+            self._get(
+                engine,
+                "table_names",
+                schema_name,
+                None,
+                lambda: sa.inspect(engine).get_table_names(schema=schema_name),
+            )
+        )
+
+    def get_view_names(self, engine, schema_name: Optional[str] = None) -> List[str]:
+        """Returns the names of the views of a schema (of the default schema if None)."""
+        return list(
+            self._get(
+                engine,
+                "view_names",
+                schema_name,
+                None,
+                lambda: sa.inspect(engine).get_view_names(schema=schema_name),
+            )
+        )
+
+    def get_columns(
+        self,
+        engine,
+        table_name: str,
+        schema_name: Optional[str] = None,
+        reflect: Optional[Callable[[], List[Dict]]] = None,
+    ) -> List[Dict]:
+        """Returns the columns of a table, as returned by sqlalchemy's Inspector.get_columns.
+
+        Args:
+            reflect: a function returning the columns of the table, to use instead of the Inspector
+        """
+        if reflect is None:
+
+            def reflect():
+                return sa.inspect(engine).get_columns(table_name, schema=schema_name)
+
+        columns = self._get(engine, "columns", schema_name, str(table_name), reflect)
+        return [dict(column) for column in columns]
+
+    def invalidate(
+        self,
+        engine=None,
+        schema_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> None:
+        """Forgets the cached metadata of a table (and the names of the tables and views of its schema), of a schema,
+        of the database of engine, or of all databases if engine is None."""
+        with self._lock:
+            self._load()
+            if engine is None:
+                self._entries.clear()
+            else:
+                url = self._get_url(engine)
+                for key in list(self._entries.keys()):
+                    entry_url, kind, entry_schema_name, entry_table_name = key
+                    if entry_url != url:
+                        continue
+                    if schema_name is not None and entry_schema_name not in (
+                        schema_name,
+                        None,
+                    ):
+                        continue
+                    if table_name is not None and entry_table_name not in (
+                        str(table_name),
+                        None,
+                    ):
+                        continue
+                    del self._entries[key]
+            self._dirty = True
+            self.save()
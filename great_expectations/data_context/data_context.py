@@ -9,6 +9,7 @@ import logging
 import os
 import shutil
 import sys
+import threading
 import traceback
 import uuid
 import warnings
@@ -83,7 +84,11 @@ from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
 )
-from great_expectations.validator.validator import BridgeValidator, Validator
+from great_expectations.validator.validator import (
+    BridgeValidator,
+    Validator,
+    get_column_projection,
+)
 
 try:
     from sqlalchemy.exc import SQLAlchemyError
@@ -96,6 +101,8 @@ logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.indent(mapping=2, sequence=4, offset=2)
 yaml.default_flow_style = False
+# A YAML instance cannot parse several documents at once; config variables are loaded by concurrent validations
+_yaml_load_lock = threading.Lock()
 
 
 class BaseDataContext:
@@ -835,7 +842,7 @@ class BaseDataContext:
                 else:
                     root_directory = ""
                 var_path = os.path.join(root_directory, defined_path)
-                with open(var_path) as config_variables_file:
+                with open(var_path) as config_variables_file, _yaml_load_lock:
                     return yaml.load(config_variables_file) or {}
             except OSError as e:
                 if e.errno != errno.ENOENT:
@@ -1519,21 +1526,12 @@ class BaseDataContext:
                 partition_request = PartitionRequest(partition_request)
 
             if batch_spec_passthrough is None:
-                batch_spec_passthrough = {}
-                if sampling_method is not None:
-                    sampling_params: dict = {
-                        "sampling_method": sampling_method,
-                    }
-                    if sampling_kwargs is not None:
-                        sampling_params["sampling_kwargs"] = sampling_kwargs
-                    batch_spec_passthrough.update(sampling_params)
-                if splitter_method is not None:
-                    splitter_params: dict = {
-                        "splitter_method": splitter_method,
-                    }
-                    if splitter_kwargs is not None:
-                        splitter_params["splitter_kwargs"] = splitter_kwargs
-                    batch_spec_passthrough.update(splitter_params)
+                batch_spec_passthrough = self._build_batch_spec_passthrough(
+                    sampling_method=sampling_method,
+                    sampling_kwargs=sampling_kwargs,
+                    splitter_method=splitter_method,
+                    splitter_kwargs=splitter_kwargs,
+                )
 
             batch_request: BatchRequest = BatchRequest(
                 datasource_name=datasource_name,
@@ -1547,6 +1545,30 @@ class BaseDataContext:
                 batch_request=batch_request
             )
 
+    @staticmethod
+    def _build_batch_spec_passthrough(
+        sampling_method: Optional[str] = None,
+        sampling_kwargs: Optional[dict] = None,
+        splitter_method: Optional[str] = None,
+        splitter_kwargs: Optional[dict] = None,
+    ) -> dict:
+        batch_spec_passthrough: dict = {}
+        if sampling_method is not None:
+            sampling_params: dict = {
+                "sampling_method": sampling_method,
+            }
+            if sampling_kwargs is not None:
+                sampling_params["sampling_kwargs"] = sampling_kwargs
+            batch_spec_passthrough.update(sampling_params)
+        if splitter_method is not None:
+            splitter_params: dict = {
+                "splitter_method": splitter_method,
+            }
+            if splitter_kwargs is not None:
+                splitter_params["splitter_kwargs"] = splitter_kwargs
+            batch_spec_passthrough.update(splitter_params)
+        return batch_spec_passthrough
+
     def get_validator(
         self,
         datasource_name: Optional[str] = None,
@@ -1568,10 +1590,15 @@ class BaseDataContext:
         sampling_kwargs: Optional[dict] = None,
         splitter_method: Optional[str] = None,
         splitter_kwargs: Optional[dict] = None,
+        column_projection: bool = False,
         **kwargs,
     ) -> Validator:
         """
         This method applies only to the new (V3) Datasource schema.
+
+        If column_projection is True, the batch is loaded with only the columns referenced by the expectation suite
+        (see great_expectations.validator.validator.get_column_projection), which is much faster for wide files.
+        Expectations on any other column cannot be evaluated by the returned Validator.
         """
 
         if (
@@ -1597,6 +1624,28 @@ class BaseDataContext:
                 expectation_suite_name=create_expectation_suite_with_name
             )
 
+        if column_projection:
+            projected_columns: Optional[List[str]] = get_column_projection(
+                expectation_suite
+            )
+            if projected_columns is not None:
+                if batch_request is not None:
+                    batch_request = self._get_column_projection_batch_request(
+                        batch_request=batch_request, projected_columns=projected_columns
+                    )
+                else:
+                    if batch_spec_passthrough is None:
+                        batch_spec_passthrough = self._build_batch_spec_passthrough(
+                            sampling_method=sampling_method,
+                            sampling_kwargs=sampling_kwargs,
+                            splitter_method=splitter_method,
+                            splitter_kwargs=splitter_kwargs,
+                        )
+                    batch_spec_passthrough = {
+                        **batch_spec_passthrough,
+                        "column_projection": projected_columns,
+                    }
+
         batch: Batch = cast(
             Batch,
             self.get_batch(
@@ -1634,6 +1683,73 @@ class BaseDataContext:
 
         return validator
 
+    def get_validators(
+        self,
+        batch_request: BatchRequest,
+        expectation_suite_names: List[str],
+        column_projection: bool = False,
+    ) -> List[Validator]:
+        """
+        This method applies only to the new (V3) Datasource schema.
+
+        Returns one Validator per expectation suite, all of them sharing a single load of the batch. Validating them
+        together (see Validator.validate_suites) computes the metrics that the suites share only once.
+
+        If column_projection is True, the batch is loaded with the columns referenced by any of the suites (or in full
+        if any of them needs all of its columns).
+        """
+        expectation_suites: List[ExpectationSuite] = [
+            self.get_expectation_suite(expectation_suite_name)
+            for expectation_suite_name in expectation_suite_names
+        ]
+
+        if column_projection:
+            suites_projected_columns: List[Optional[List[str]]] = [
+                get_column_projection(expectation_suite)
+                for expectation_suite in expectation_suites
+            ]
+            if all(
+                projected_columns is not None
+                for projected_columns in suites_projected_columns
+            ):
+                batch_request = self._get_column_projection_batch_request(
+                    batch_request=batch_request,
+                    projected_columns=sorted(set().union(*suites_projected_columns)),
+                )
+
+        batch: Batch = cast(Batch, self.get_batch(batch_request=batch_request))
+        execution_engine = self.datasources[
+            batch.batch_definition.datasource_name
+        ].execution_engine
+
+        return [
+            Validator(
+                execution_engine=execution_engine,
+                interactive_evaluation=True,
+                expectation_suite=expectation_suite,
+                data_context=self,
+                batches=[batch],
+            )
+            for expectation_suite in expectation_suites
+        ]
+
+    @staticmethod
+    def _get_column_projection_batch_request(
+        batch_request: BatchRequest, projected_columns: List[str]
+    ) -> BatchRequest:
+        return BatchRequest(
+            datasource_name=batch_request.datasource_name,
+            data_connector_name=batch_request.data_connector_name,
+            data_asset_name=batch_request.data_asset_name,
+            partition_request=batch_request.partition_request,
+            batch_data=batch_request.batch_data,
+            limit=batch_request.limit,
+            batch_spec_passthrough={
+                **(batch_request.batch_spec_passthrough or {}),
+                "column_projection": projected_columns,
+            },
+        )
+
     def list_validation_operator_names(self):
         if not self.validation_operators:
             return []
@@ -2052,6 +2168,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -2073,19 +2190,21 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
-                                ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
+                        metrics.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -2094,6 +2213,10 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        # Store all of the metrics at once, so that database stores write them in a handful of statements
+        if metrics:
+            self.stores[target_store_name].set_many(metrics)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
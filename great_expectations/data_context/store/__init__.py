@@ -13,6 +13,7 @@ from .tuple_store_backend import (  # isort:skip
     TupleAzureBlobStoreBackend,
 )
 from .database_store_backend import DatabaseStoreBackend  # isort:skip
+from .parquet_store_backend import ParquetStoreBackend  # isort:skip
 from .configuration_store import ConfigurationStore  # isort:skip
 from .checkpoint_store import CheckpointStore  # isort:skip
 from .metric_store import (  # isort:skip
@@ -35,5 +36,6 @@ for module_name, package_name in [
     (".store_backend", "great_expectations.data_context.store"),
     (".tuple_store_backend", "great_expectations.data_context.store"),
     (".database_store_backend", "great_expectations.data_context.store"),
+    (".parquet_store_backend", "great_expectations.data_context.store"),
 ]:
     verify_dynamic_loading_support(module_name=module_name, package_name=package_name)
@@ -1,10 +1,11 @@
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.sqlalchemy_engine_registry import get_sqlalchemy_engine
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.util import filter_properties_dict
 
@@ -18,6 +19,7 @@ try:
         and_,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -31,6 +33,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Some databases (such as sqlite) accept at most 999 parameters in a statement
+MAX_QUERY_PARAMETERS = 900
+
 
 class DatabaseStoreBackend(StoreBackend):
     def __init__(
@@ -78,10 +83,10 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = get_sqlalchemy_engine(url, **kwargs)
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
@@ -120,6 +125,11 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {str(e)}"
                 )
         self._table = table
+        # Upserts rely on a unique constraint on the key columns, which the tables created by the store have (their
+        # primary key), but tables created by hand may not.
+        self._key_columns_are_unique = {
+            str(col.name).lower() for col in table.primary_key.columns
+        } == {str(key_col).lower() for key_col in key_columns}
         # Initialize with store_backend_id
         self._store_backend_id = None
         self._store_backend_id = self.store_backend_id
@@ -183,7 +193,7 @@ class DatabaseStoreBackend(StoreBackend):
 
         self.drivername = drivername
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -255,22 +265,232 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug("Error fetching value: " + str(e))
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
 
-    def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
+    def get_all(self, prefix=()) -> dict:
+        sel = (
+            select([column(col) for col in self.key_columns] + [column("value")])
+            .select_from(self._table)
+            .where(
+                and_(
+                    *[
+                        getattr(self._table.columns, key_col) == val
+                        for key_col, val in zip(self.key_columns[: len(prefix)], prefix)
+                    ]
+                )
+            )
+        )
+        try:
+            return {
+                tuple(row[:-1]): row[-1] for row in self.engine.execute(sel).fetchall()
+            }
+        except SQLAlchemyError as e:
+            logger.debug("Error fetching values: " + str(e))
+            raise ge_exceptions.StoreError(
+                "Unable to fetch values for prefix: " + str(prefix)
+            )
 
-        if allow_update:
-            if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
+    def get_many(
+        self, keys: Iterable[tuple], max_workers: Optional[int] = None
+    ) -> list:
+        """Returns the values of keys, in the order of the keys, fetching as many of them as fit in each query.
+
+        max_workers is ignored.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        values = {}
+        keys_per_query = max(MAX_QUERY_PARAMETERS // len(self.key_columns), 1)
+        for start in range(0, len(keys), keys_per_query):
+            sel = (
+                select([column(col) for col in self.key_columns] + [column("value")])
+                .select_from(self._table)
+                .where(
+                    or_(
+                        *[
+                            and_(
+                                *[
+                                    getattr(self._table.columns, key_col) == val
+                                    for key_col, val in zip(self.key_columns, key)
+                                ]
+                            )
+                            for key in keys[start : start + keys_per_query]
+                        ]
+                    )
                 )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+            )
+            try:
+                for row in self.engine.execute(sel).fetchall():
+                    values[tuple(row[:-1])] = row[-1]
+            except SQLAlchemyError as e:
+                logger.debug("Error fetching values: " + str(e))
+                raise ge_exceptions.StoreError(
+                    f"Unable to fetch values for {len(keys)} keys"
+                )
+
+        errors = {
+            key: ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
+            for key in keys
+            if key not in values
+        }
+        return self._check_bulk_results([values.get(key) for key in keys], errors)
+
+    def query(
+        self,
+        filters: Optional[Dict[int, str]] = None,
+        ranges: Optional[Dict[int, Tuple[Optional[str], Optional[str]]]] = None,
+        order_by: Optional[int] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[tuple, object]]:
+        """Returns the (key, value) pairs whose keys match filters and ranges with a single query; see
+        StoreBackend.query."""
+        key_cols = [
+            getattr(self._table.columns, key_col) for key_col in self.key_columns
+        ]
+        conditions = [
+            key_cols[position] == value for position, value in (filters or {}).items()
+        ]
+        for position, (start, end) in (ranges or {}).items():
+            if start is not None:
+                conditions.append(key_cols[position] >= start)
+            if end is not None:
+                conditions.append(key_cols[position] <= end)
+
+        sel = select(key_cols + [self._table.columns.value]).where(and_(*conditions))
+        if order_by is not None:
+            sel = sel.order_by(
+                key_cols[order_by].desc() if descending else key_cols[order_by]
+            )
+        if limit is not None:
+            sel = sel.limit(limit)
+        try:
+            return [
+                (tuple(row[:-1]), row[-1])
+                for row in self.engine.execute(sel).fetchall()
+            ]
+        except SQLAlchemyError as e:
+            logger.debug("Error querying values: " + str(e))
+            raise ge_exceptions.StoreError("Unable to query values from the store")
+
+    def set_many(
+        self,
+        items: Iterable[Tuple[tuple, object]],
+        max_workers: Optional[int] = None,
+        allow_update=True,
+    ) -> list:
+        """Sets the value of each (key, value) pair of items with a single (executemany) statement per batch of rows.
+
+        max_workers is ignored. Unlike with other backends, a failure fails the whole batch of rows, and is raised as a
+        StoreBackendError.
+        """
+        items = list(items)
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+        if not allow_update:
+            # Keys that already exist are reported one by one
+            return super().set_many(items, allow_update=False)
+
+        self._upsert([self._get_row(key, value) for key, value in items])
+        return [None] * len(items)
+
+    def _get_row(self, key, value) -> dict:
+        row = {k: v for (k, v) in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
+    def _upsert(self, rows: List[dict]) -> None:
+        """Inserts rows, or updates the value of those whose key already exists, in a single transaction."""
+        if not rows:
+            return
+        dialect_name = self.engine.dialect.name.lower()
+        try:
+            with self.engine.begin() as connection:
+                if not self._key_columns_are_unique:
+                    self._update_or_insert(connection, rows)
+                elif dialect_name == "postgresql":
+                    from sqlalchemy.dialects.postgresql import insert
+
+                    ins = insert(self._table)
+                    connection.execute(
+                        ins.on_conflict_do_update(
+                            index_elements=[
+                                getattr(self._table.columns, key_col)
+                                for key_col in self.key_columns
+                            ],
+                            set_={"value": ins.excluded.value},
+                        ),
+                        rows,
+                    )
+                elif dialect_name == "mysql":
+                    from sqlalchemy.dialects.mysql import insert
+
+                    ins = insert(self._table)
+                    connection.execute(
+                        ins.on_duplicate_key_update(value=ins.inserted.value), rows
+                    )
+                elif dialect_name == "sqlite":
+                    # The table has no other column than the key and the value: replacing a row updates its value
+                    connection.execute(
+                        self._table.insert().prefix_with("OR REPLACE"), rows
+                    )
+                elif dialect_name == "mssql":
+                    connection.execute(self._get_merge_statement(), rows)
+                else:
+                    self._update_or_insert(connection, rows)
+        except SQLAlchemyError as e:
+            raise ge_exceptions.StoreBackendError(
+                f"Unable to store {len(rows)} values: got sqlalchemy error {str(e)}"
+            )
+
+    def _get_merge_statement(self):
+        preparer = self.engine.dialect.identifier_preparer
+        cols = [preparer.quote(col) for col in self.key_columns]
+        value_col = preparer.quote("value")
+        return text(
+            f"MERGE INTO {preparer.format_table(self._table)} WITH (HOLDLOCK) AS target "
+            f"USING (SELECT {', '.join(f':{key_col} AS {col}' for key_col, col in zip(self.key_columns, cols))}, "
+            f":value AS {value_col}) AS source "
+            f"ON {' AND '.join(f'target.{col} = source.{col}' for col in cols)} "
+            f"WHEN MATCHED THEN UPDATE SET {value_col} = source.{value_col} "
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(cols)}, {value_col}) "
+            f"VALUES ({', '.join(f'source.{col}' for col in cols)}, source.{value_col});"
+        )
+
+    def _update_or_insert(self, connection, rows: List[dict]) -> None:
+        """Updates the rows whose key exists, then inserts the others at once, for databases without upserts."""
+        upd = (
+            self._table.update()
+            .where(
+                and_(
+                    *[
+                        getattr(self._table.columns, key_col)
+                        == sa.bindparam(f"key_{idx}")
+                        for idx, key_col in enumerate(self.key_columns)
+                    ]
+                )
+            )
+            .values(value=sa.bindparam("new_value"))
+        )
+        new_rows = []
+        for row in rows:
+            params = {
+                f"key_{idx}": row[key_col]
+                for idx, key_col in enumerate(self.key_columns)
+            }
+            params["new_value"] = row["value"]
+            if connection.execute(upd, params).rowcount == 0:
+                new_rows.append(row)
+        if new_rows:
+            connection.execute(self._table.insert(), new_rows)
+
+    def _set(self, key, value, allow_update=True):
+        if allow_update:
+            self._upsert([self._get_row(key, value)])
+            return
 
+        ins = self._table.insert().values(**self._get_row(key, value))
         try:
             self.engine.execute(ins)
         except IntegrityError as e:
@@ -1,4 +1,5 @@
 import inspect
+import json
 import logging
 import os
 from mimetypes import guess_type
@@ -13,7 +14,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -24,6 +29,9 @@ from .tuple_store_backend import TupleStoreBackend
 
 logger = logging.getLogger(__name__)
 
+SITE_MANIFEST_FILEPATH = ".ge_site_manifest.json"
+SITE_MANIFEST_VERSION = 1
+
 
 class HtmlSiteStore:
     """
@@ -194,11 +202,29 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        filepath_template = SITE_MANIFEST_FILEPATH
+        site_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_template": filepath_template,
+                "suppress_store_backend_id": True,
+            },
+        )
+        if not site_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         self.store_backends = {
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
             "static_assets": static_assets_obj,
+            "site_manifest": site_manifest_obj,
         }
 
         # NOTE: Instead of using the filesystem as the source of record for keys,
@@ -211,6 +237,10 @@ class HtmlSiteStore:
         # can't necessarily set and list_keys like most other Stores.
         self.keys = set()
 
+        # The site manifest records, for every rendered page, a hash of the resource it was rendered from and the
+        # metadata the index page needs, so that builds can skip unchanged resources. It is loaded lazily.
+        self._site_manifest = None
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
         self._config = {
@@ -340,11 +370,55 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_site_manifest(self) -> dict:
+        """
+        Return the site manifest, loading it from the store backend the first time it is requested.
+
+        The manifest maps each site section name to a dictionary of entries keyed by the rendered resource's key
+        (see manifest_key_for_resource). A missing, unreadable or outdated manifest is replaced by an empty one, which
+        results in every resource being rendered again.
+        """
+        if self._site_manifest is None:
+            site_manifest = None
+            try:
+                site_manifest = json.loads(self.store_backends["site_manifest"].get(()))
+            except InvalidKeyError:
+                pass
+            except ValueError:
+                logger.warning(
+                    "Unable to read the data docs site manifest; ignoring it."
+                )
+            if (
+                not isinstance(site_manifest, dict)
+                or site_manifest.get("version") != SITE_MANIFEST_VERSION
+            ):
+                site_manifest = {"version": SITE_MANIFEST_VERSION, "sections": {}}
+            self._site_manifest = site_manifest
+        return self._site_manifest
+
+    def get_site_section_manifest(self, site_section_name) -> dict:
+        return self.get_site_manifest()["sections"].setdefault(site_section_name, {})
+
+    def write_site_manifest(self):
+        if self._site_manifest is None:
+            return
+        return self.store_backends["site_manifest"].set(
+            (),
+            json.dumps(self._site_manifest, sort_keys=True),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
+    @staticmethod
+    def manifest_key_for_resource(resource_identifier):
+        return "/".join(resource_identifier.to_tuple())
+
     def clean_site(self):
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
             for key in keys:
                 target_store_backend.remove_key(key)
+        self._site_manifest = None
 
     def copy_static_assets(self, static_assets_source_dir=None):
         """
@@ -1,10 +1,17 @@
 import json
+from typing import Optional
+
+import pandas as pd
 
 from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.util import ensure_json_serializable
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
+from great_expectations.data_context.store.parquet_store_backend import (
+    ParquetStoreBackend,
+)
 from great_expectations.data_context.store.store import Store
 from great_expectations.util import (
     filter_properties_dict,
@@ -20,7 +27,7 @@ class MetricStore(Store):
 
     _key_class = ValidationMetricIdentifier
 
-    def __init__(self, store_backend=None, store_name=None):
+    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -39,6 +46,14 @@ class MetricStore(Store):
                     store_backend["table_name"] = store_backend.get(
                         "table_name", "ge_metrics"
                     )
+            if issubclass(store_backend_class, ParquetStoreBackend):
+                if "base_directory" not in store_backend:
+                    store_backend["base_directory"] = "uncommitted/metrics/"
+                if "partition_by" not in store_backend:
+                    store_backend["partition_by"] = "metric_name"
+            if issubclass(
+                store_backend_class, (DatabaseStoreBackend, ParquetStoreBackend)
+            ):
                 if "key_columns" not in store_backend:
                     store_backend["key_columns"] = store_backend.get(
                         "key_columns",
@@ -52,7 +67,11 @@ class MetricStore(Store):
                         ],
                     )
 
-        super().__init__(store_backend=store_backend, store_name=store_name)
+        super().__init__(
+            store_backend=store_backend,
+            runtime_environment=runtime_environment,
+            store_name=store_name,
+        )
 
     # noinspection PyMethodMayBeStatic
     def _validate_value(self, value):
@@ -66,9 +85,99 @@ class MetricStore(Store):
         if value:
             return json.loads(value)["value"]
 
+    def get_metric_history(
+        self,
+        metric_name: Optional[str] = None,
+        data_asset_name: Optional[str] = None,
+        expectation_suite_name: Optional[str] = None,
+        metric_kwargs_id: Optional[str] = None,
+        run_name: Optional[str] = None,
+        start_time=None,
+        end_time=None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Returns the stored metrics that match all of the given criteria, ordered by run time.
+
+        The store backend filters the metrics itself where it can (DatabaseStoreBackend and ParquetStoreBackend do), so
+        that months of history are read in a single query.
+
+        Args:
+            start_time: the earliest run time (a datetime, or a string RunIdentifier can parse) of the metrics
+            end_time: the latest run time of the metrics
+            limit: the number of metrics to return at most: the most recent ones are returned
+
+        Returns:
+            a DataFrame with the run_name, run_time, data_asset_name, expectation_suite_name, metric_name,
+            metric_kwargs_id and value of each metric
+        """
+        # Expectation suite names are split into several key elements unless keys have a fixed length
+        filter_suite_name = (
+            expectation_suite_name is not None and not self._use_fixed_length_key
+        )
+        filters = {}
+        for position, value in [
+            (0, run_name),
+            (2, data_asset_name),
+            (3, None if filter_suite_name else expectation_suite_name),
+            (-2, metric_name),
+            (-1, metric_kwargs_id),
+        ]:
+            if value is not None:
+                filters[position] = value
+        ranges = {}
+        if start_time is not None or end_time is not None:
+            ranges[1] = tuple(
+                None
+                if run_time is None
+                else RunIdentifier(run_time=run_time).to_tuple()[1]
+                for run_time in (start_time, end_time)
+            )
+
+        keys_and_values = self._store_backend.query(
+            filters=filters,
+            ranges=ranges,
+            order_by=1,
+            descending=True,
+            limit=None if filter_suite_name else limit,
+        )
+        keys = [key for key, _ in keys_and_values]
+        history = pd.DataFrame(
+            {
+                "run_name": [None if key[0] == "__none__" else key[0] for key in keys],
+                "run_time": pd.to_datetime(
+                    [key[1] for key in keys], format="%Y%m%dT%H%M%S.%fZ", utc=True
+                ),
+                "data_asset_name": [None if key[2] == "__" else key[2] for key in keys],
+                "expectation_suite_name": [".".join(key[3:-2]) for key in keys],
+                "metric_name": [key[-2] for key in keys],
+                "metric_kwargs_id": [
+                    None if key[-1] == "__" else key[-1] for key in keys
+                ],
+                "value": [
+                    self.deserialize(key, value) for key, value in keys_and_values
+                ],
+            },
+            columns=[
+                "run_name",
+                "run_time",
+                "data_asset_name",
+                "expectation_suite_name",
+                "metric_name",
+                "metric_kwargs_id",
+                "value",
+            ],
+        )
+        if filter_suite_name:
+            history = history[
+                history["expectation_suite_name"] == expectation_suite_name
+            ]
+            if limit is not None:
+                history = history.iloc[:limit]
+        return history.iloc[::-1].reset_index(drop=True)
+
 
 class EvaluationParameterStore(MetricStore):
-    def __init__(self, store_backend=None, store_name=None):
+    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -87,7 +196,15 @@ class EvaluationParameterStore(MetricStore):
                 store_backend["table_name"] = store_backend.get(
                     "table_name", "ge_evaluation_parameters"
                 )
-        super().__init__(store_backend=store_backend, store_name=store_name)
+            if issubclass(store_backend_class, ParquetStoreBackend):
+                store_backend["base_directory"] = store_backend.get(
+                    "base_directory", "uncommitted/evaluation_parameters/"
+                )
+        super().__init__(
+            store_backend=store_backend,
+            runtime_environment=runtime_environment,
+            store_name=store_name,
+        )
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
@@ -101,9 +218,12 @@ class EvaluationParameterStore(MetricStore):
 
     def get_bind_params(self, run_id):
         params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
+        # Fetch all of the parameters of the run at once
+        for k, value in self._store_backend.get_all(run_id.to_tuple()).items():
             key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
+            params[key.to_evaluation_parameter_urn()] = (
+                self.deserialize(key, value) if value else None
+            )
         return params
 
     @property
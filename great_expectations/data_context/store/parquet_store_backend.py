@@ -0,0 +1,373 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+import pandas as pd
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.util import filter_properties_dict
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# The column recording when each row was written: the value of a key is that of its most recent row
+WRITTEN_AT_COLUMN = "_written_at"
+
+
+class ParquetStoreBackend(StoreBackend):
+    """Appends values to a directory of Parquet files, with a column per key element, so that the history of a store
+    (such as the metrics of a MetricStore) can be queried at once rather than key by key.
+
+    Each write appends a file holding its rows to the directory of their partition (the value of their partition_by
+    key column), and a key has the value it was last set to. Removing a key rewrites its partition.
+    """
+
+    def __init__(
+        self,
+        base_directory,
+        key_columns,
+        partition_by=None,
+        root_directory=None,
+        fixed_length_key=True,
+        suppress_store_backend_id=False,
+        manually_initialize_store_backend_id: str = "",
+        store_name=None,
+    ):
+        super().__init__(
+            fixed_length_key=fixed_length_key,
+            suppress_store_backend_id=suppress_store_backend_id,
+            manually_initialize_store_backend_id=manually_initialize_store_backend_id,
+            store_name=store_name,
+        )
+        if not pa:
+            raise ge_exceptions.DataContextError(
+                "ModuleNotFoundError: No module named 'pyarrow'"
+            )
+
+        if not self.fixed_length_key:
+            raise ge_exceptions.InvalidConfigError(
+                "ParquetStoreBackend requires use of a fixed-length-key"
+            )
+
+        for column in key_columns:
+            if column in ["value", WRITTEN_AT_COLUMN]:
+                raise ge_exceptions.InvalidConfigError(
+                    f"'{column}' cannot be used as a key_element name"
+                )
+        if partition_by is not None and partition_by not in key_columns:
+            raise ge_exceptions.InvalidConfigError(
+                f"Unable to partition by {partition_by}: it is not one of the key_columns."
+            )
+        self.key_columns = list(key_columns)
+        self.partition_by = partition_by
+
+        if os.path.isabs(base_directory):
+            self.full_base_directory = base_directory
+        else:
+            if root_directory is None:
+                raise ValueError(
+                    "base_directory must be an absolute path if root_directory is not provided"
+                )
+            self.full_base_directory = os.path.join(root_directory, base_directory)
+        os.makedirs(self.full_base_directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._last_written_at = 0
+        # Initialize with store_backend_id if not part of an HTMLSiteStore
+        if not self._suppress_store_backend_id:
+            _ = self.store_backend_id
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "base_directory": base_directory,
+            "key_columns": key_columns,
+            "partition_by": partition_by,
+            "root_directory": root_directory,
+            "fixed_length_key": fixed_length_key,
+            "suppress_store_backend_id": suppress_store_backend_id,
+            "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, inplace=True)
+
+    def _validate_key(self, key):
+        super()._validate_key(key)
+        if key != self.STORE_BACKEND_ID_KEY and len(key) != len(self.key_columns):
+            raise TypeError(
+                "Keys in {} must have {} elements, not {}".format(
+                    self.__class__.__name__, len(self.key_columns), len(key)
+                )
+            )
+
+    def _validate_value(self, value):
+        if not isinstance(value, str):
+            raise TypeError(
+                "Values in {} must be instances of {}, not {}".format(
+                    self.__class__.__name__, str, type(value)
+                )
+            )
+
+    def _get_partition_directory(self, partition) -> str:
+        return os.path.join(
+            self.full_base_directory, f"{self.partition_by}={quote(partition, safe='')}"
+        )
+
+    def _list_files(self, partitions: Optional[Iterable[str]] = None) -> List[str]:
+        """Returns the data files of the given partitions (of all of them if None), in the order they were written."""
+        if self.partition_by is None:
+            directories = [self.full_base_directory]
+        elif partitions is None:
+            directories = [
+                entry.path
+                for entry in os.scandir(self.full_base_directory)
+                if entry.is_dir() and entry.name.startswith(f"{self.partition_by}=")
+            ]
+        else:
+            directories = [
+                self._get_partition_directory(partition)
+                for partition in set(partitions)
+            ]
+
+        files = []
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            files.extend(
+                entry.path
+                for entry in os.scandir(directory)
+                if entry.is_file()
+                and entry.name.endswith(".parquet")
+                and not entry.name.startswith(".")
+            )
+        return sorted(files, key=os.path.basename)
+
+    def _read_files(self, files: List[str]) -> pd.DataFrame:
+        columns = self.key_columns + ["value", WRITTEN_AT_COLUMN]
+        if not files:
+            return pd.DataFrame(columns=columns)
+        df = pa.concat_tables(
+            [pq.read_table(path, columns=columns) for path in files]
+        ).to_pandas()
+        return df.sort_values(WRITTEN_AT_COLUMN, kind="mergesort")
+
+    def _read(
+        self,
+        filters: Optional[Dict[int, str]] = None,
+        ranges: Optional[Dict[int, Tuple[Optional[str], Optional[str]]]] = None,
+        partitions: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
+        """Returns the current rows of the store whose keys match filters and ranges, reading only the partitions they
+        can be in."""
+        filters = {
+            self.key_columns[position]: value
+            for position, value in (filters or {}).items()
+        }
+        if partitions is None and self.partition_by in filters:
+            partitions = [filters[self.partition_by]]
+
+        df = self._read_files(self._list_files(partitions))
+        df = df.drop_duplicates(subset=self.key_columns, keep="last")
+
+        mask = pd.Series(True, index=df.index)
+        for column, value in filters.items():
+            mask &= df[column] == value
+        for position, (start, end) in (ranges or {}).items():
+            column = self.key_columns[position]
+            if start is not None:
+                mask &= df[column] >= start
+            if end is not None:
+                mask &= df[column] <= end
+        return df[mask]
+
+    def _append(self, items: List[Tuple[tuple, str]]) -> None:
+        """Writes the (key, value) pairs of items, in a new file per partition."""
+        df = pd.DataFrame(
+            [list(key) + [value] for key, value in items],
+            columns=self.key_columns + ["value"],
+        ).drop_duplicates(subset=self.key_columns, keep="last")
+
+        if self.partition_by is None:
+            partitions = [(None, df)]
+        else:
+            partitions = list(df.groupby(self.partition_by, sort=False))
+        for partition, partition_df in partitions:
+            directory = (
+                self.full_base_directory
+                if partition is None
+                else self._get_partition_directory(partition)
+            )
+            self._write_file(directory, partition_df)
+
+    def _write_file(self, directory: str, df: pd.DataFrame) -> None:
+        with self._lock:
+            if WRITTEN_AT_COLUMN not in df.columns:
+                # Keep the times of the rows of this process increasing, however close together they are written
+                written_at = max(int(time.time() * 1e6), self._last_written_at + 1)
+                self._last_written_at = written_at
+                df = df.assign(**{WRITTEN_AT_COLUMN: written_at})
+        table = pa.Table.from_pandas(
+            df,
+            schema=pa.schema(
+                [(column, pa.string()) for column in self.key_columns + ["value"]]
+                + [(WRITTEN_AT_COLUMN, pa.int64())]
+            ),
+            preserve_index=False,
+        )
+        os.makedirs(directory, exist_ok=True)
+        filename = f"{int(time.time() * 1e6):020d}-{uuid.uuid4().hex}.parquet"
+        # Write to a hidden file first, so that readers never see a partly written file
+        temp_path = os.path.join(directory, f".{filename}")
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, os.path.join(directory, filename))
+
+    def _get_store_backend_id_path(self) -> str:
+        return os.path.join(self.full_base_directory, self.STORE_BACKEND_ID_KEY[0])
+
+    def _get(self, key):
+        if key == self.STORE_BACKEND_ID_KEY:
+            try:
+                with open(self._get_store_backend_id_path()) as infile:
+                    return infile.read()
+            except FileNotFoundError:
+                raise ge_exceptions.InvalidKeyError(
+                    f"Unable to retrieve object from ParquetStoreBackend with the following Key: {str(key)}"
+                )
+
+        df = self._read(filters=dict(enumerate(key)))
+        if len(df) == 0:
+            raise ge_exceptions.InvalidKeyError(
+                f"Unable to retrieve object from ParquetStoreBackend with the following Key: {str(key)}"
+            )
+        return df["value"].iloc[-1]
+
+    def get_many(
+        self, keys: Iterable[tuple], max_workers: Optional[int] = None
+    ) -> list:
+        """Returns the values of keys, in the order of the keys, reading the partitions they are in at once.
+
+        max_workers is ignored.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        partitions = None
+        if self.partition_by is not None:
+            partition_position = self.key_columns.index(self.partition_by)
+            partitions = [key[partition_position] for key in keys]
+        df = self._read(partitions=partitions)
+        values = dict(
+            zip(
+                zip(*[df[column] for column in self.key_columns]),
+                df["value"],
+            )
+        )
+
+        errors = {
+            key: ge_exceptions.InvalidKeyError(
+                f"Unable to retrieve object from ParquetStoreBackend with the following Key: {str(key)}"
+            )
+            for key in keys
+            if key not in values
+        }
+        return self._check_bulk_results([values.get(key) for key in keys], errors)
+
+    def get_all(self, prefix=()) -> dict:
+        return dict(self.query(filters=dict(enumerate(prefix))))
+
+    def query(
+        self,
+        filters: Optional[Dict[int, str]] = None,
+        ranges: Optional[Dict[int, Tuple[Optional[str], Optional[str]]]] = None,
+        order_by: Optional[int] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[tuple, object]]:
+        """Returns the (key, value) pairs whose keys match filters and ranges; see StoreBackend.query."""
+        df = self._read(filters=filters, ranges=ranges)
+        if order_by is not None:
+            df = df.sort_values(
+                self.key_columns[order_by], ascending=not descending, kind="mergesort"
+            )
+        if limit is not None:
+            df = df.iloc[:limit]
+        return list(zip(zip(*[df[column] for column in self.key_columns]), df["value"]))
+
+    def _set(self, key, value, **kwargs):
+        if key == self.STORE_BACKEND_ID_KEY:
+            with open(self._get_store_backend_id_path(), "w") as outfile:
+                outfile.write(value)
+            return
+        self._append([(key, value)])
+
+    def set_many(
+        self,
+        items: Iterable[Tuple[tuple, object]],
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """Sets the value of each (key, value) pair of items, writing a single file per partition.
+
+        max_workers is ignored.
+        """
+        items = list(items)
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+        if items:
+            self._append(items)
+        return [None] * len(items)
+
+    def _move(self, source_key, dest_key, **kwargs):
+        if source_key == dest_key:
+            return
+        self._set(dest_key, self._get(source_key))
+        self.remove_key(source_key)
+
+    def list_keys(self, prefix=()):
+        df = self._read(filters=dict(enumerate(prefix)))
+        return list(zip(*[df[column] for column in self.key_columns]))
+
+    def _has_key(self, key):
+        if key == self.STORE_BACKEND_ID_KEY:
+            return os.path.isfile(self._get_store_backend_id_path())
+        return len(self._read(filters=dict(enumerate(key)))) > 0
+
+    def remove_key(self, key):
+        """Removes key, rewriting the files of its partition without it."""
+        partitions = None
+        if self.partition_by is not None:
+            partitions = [key[self.key_columns.index(self.partition_by)]]
+        files = self._list_files(partitions)
+        df = self._read_files(files)
+        is_key = pd.Series(True, index=df.index)
+        for column, value in zip(self.key_columns, key):
+            is_key &= df[column] == value
+        if not is_key.any():
+            return False
+
+        # The remaining rows keep the time they were written at, so that rows appended meanwhile stay more recent
+        remaining_df = df[~is_key].drop_duplicates(subset=self.key_columns, keep="last")
+        if len(remaining_df) > 0:
+            self._write_file(os.path.dirname(files[0]), remaining_df)
+        for path in files:
+            os.remove(path)
+        return True
+
+    @property
+    def config(self) -> dict:
+        return self._config
@@ -3,27 +3,17 @@ from string import Template
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.data_context_key import StringKey
+from great_expectations.core.sqlalchemy_engine_registry import get_sqlalchemy_engine
 from great_expectations.data_context.store.store import Store
 from great_expectations.util import filter_properties_dict
 
 try:
     import sqlalchemy
-    from sqlalchemy import (
-        Column,
-        MetaData,
-        String,
-        Table,
-        and_,
-        column,
-        create_engine,
-        select,
-        text,
-    )
+    from sqlalchemy import Column, MetaData, String, Table, and_, column, select, text
     from sqlalchemy.engine.url import URL
     from sqlalchemy.exc import SQLAlchemyError
 except ImportError:
     sqlalchemy = None
-    create_engine = None
 
 
 logger = logging.getLogger(__name__)
@@ -75,11 +65,11 @@ class SqlAlchemyQueryStore(Store):
         if "engine" in credentials:
             self.engine = credentials["engine"]
         elif "url" in credentials:
-            self.engine = create_engine(credentials["url"])
+            self.engine = get_sqlalchemy_engine(credentials["url"])
         else:
             drivername = credentials.pop("drivername")
             options = URL(drivername, **credentials)
-            self.engine = create_engine(options)
+            self.engine = get_sqlalchemy_engine(options)
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
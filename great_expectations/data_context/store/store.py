@@ -133,6 +133,17 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value)
             )
 
+    def set_many(self, items):
+        """Sets the value of each (key, value) pair of items with StoreBackend.set_many, and returns its results."""
+        tuple_items = []
+        for key, value in items:
+            if key == StoreBackend.STORE_BACKEND_ID_KEY:
+                tuple_items.append((key, value))
+            else:
+                self._validate_key(key)
+                tuple_items.append((self.key_to_tuple(key), self.serialize(key, value)))
+        return self._store_backend.set_many(tuple_items)
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -141,6 +152,14 @@ class Store:
         ]
         return [self.tuple_to_key(key) for key in keys_without_store_backend_id]
 
+    def list_keys_with_versions(self) -> dict:
+        """Return a dictionary mapping each key to the version its store backend lists for it (see StoreBackend)."""
+        return {
+            self.tuple_to_key(key): version
+            for key, version in self._store_backend.list_keys_with_versions().items()
+            if not key == StoreBackend.STORE_BACKEND_ID_KEY
+        }
+
     def has_key(self, key):
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.has_key(key)
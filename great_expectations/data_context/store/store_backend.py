@@ -1,9 +1,16 @@
 import logging
+import threading
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
-
-from great_expectations.exceptions import InvalidKeyError, StoreBackendError, StoreError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from great_expectations.exceptions import (
+    InvalidKeyError,
+    StoreBackendBulkOperationError,
+    StoreBackendError,
+    StoreError,
+)
 from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
@@ -24,6 +31,8 @@ class StoreBackend(metaclass=ABCMeta):
     STORE_BACKEND_ID_KEY = (".ge_store_backend_id",)
     STORE_BACKEND_ID_PREFIX = "store_backend_id = "
     STORE_BACKEND_INVALID_CONFIGURATION_ID = "00000000-0000-0000-0000-00000000e003"
+    # The number of keys that get_many and set_many read or write at once, unless told otherwise
+    _default_bulk_max_workers = 1
 
     def __init__(
         self,
@@ -46,6 +55,10 @@ class StoreBackend(metaclass=ABCMeta):
             manually_initialize_store_backend_id
         )
         self._store_name = store_name
+        # The executor of get_many and set_many is kept across calls, so that its threads keep the clients they create
+        self._bulk_executor = None
+        self._bulk_executor_max_workers = 0
+        self._bulk_executor_lock = threading.Lock()
 
     @property
     def fixed_length_key(self):
@@ -55,6 +68,11 @@ class StoreBackend(metaclass=ABCMeta):
     def store_name(self):
         return self._store_name
 
+    @property
+    def bulk_max_workers(self) -> int:
+        """The number of keys that get_many and set_many read or write at once, unless told otherwise."""
+        return self._default_bulk_max_workers
+
     def _construct_store_backend_id(
         self, suppress_warning: bool = False
     ) -> Optional[str]:
@@ -112,6 +130,71 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_many(
+        self, keys: Iterable[tuple], max_workers: Optional[int] = None
+    ) -> list:
+        """Returns the values of keys, in the order of the keys.
+
+        Backends whose reads are round-trips to a remote service read up to max_workers keys at once. If some of the
+        keys cannot be read, the others are read all the same, and a StoreBackendBulkOperationError holding the values
+        that were read and the error of each key that was not is raised.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._run_bulk_operation(
+            self._get, [(key, ()) for key in keys], max_workers=max_workers
+        )
+
+    def get_all(self, prefix=()) -> dict:
+        """Returns the values of all of the keys that start with prefix, by key.
+
+        Backends that can fetch them in a single round-trip override this; by default, the keys are fetched with
+        get_many.
+        """
+        keys = list(self.list_keys(prefix))
+        return dict(zip(keys, self.get_many(keys)))
+
+    def query(
+        self,
+        filters: Optional[Dict[int, str]] = None,
+        ranges: Optional[Dict[int, Tuple[Optional[str], Optional[str]]]] = None,
+        order_by: Optional[int] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[tuple, object]]:
+        """Returns the (key, value) pairs whose keys match filters and ranges.
+
+        Args:
+            filters: the value that the key element at each given position must have
+            ranges: the (start, end) bounds, both included and None when unbounded, of the key element at each given
+                position
+            order_by: the position of the key element to sort the pairs by
+            descending: whether to sort them in descending order
+            limit: the number of pairs to return at most
+
+        Backends that can filter and sort their keys themselves override this; by default, all of the keys are listed
+        and only those that match are fetched.
+        """
+        filters = filters or {}
+        ranges = ranges or {}
+        keys = [
+            key
+            for key in self.list_keys()
+            if key != self.STORE_BACKEND_ID_KEY
+            and all(key[position] == value for position, value in filters.items())
+            and all(
+                (start is None or key[position] >= start)
+                and (end is None or key[position] <= end)
+                for position, (start, end) in ranges.items()
+            )
+        ]
+        if order_by is not None:
+            keys = sorted(keys, key=lambda key: key[order_by], reverse=descending)
+        if limit is not None:
+            keys = keys[:limit]
+        return list(zip(keys, self.get_many(keys)))
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -122,6 +205,102 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def set_many(
+        self,
+        items: Iterable[Tuple[tuple, object]],
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> list:
+        """Sets the value of each (key, value) pair of items, and returns what set would have returned for each of them,
+        in the order of the items.
+
+        Errors are reported as by get_many.
+        """
+        items = list(items)
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+
+        def _set(key, value):
+            try:
+                return self._set(key, value, **kwargs)
+            except ValueError as e:
+                logger.debug(str(e))
+                raise StoreBackendError(
+                    "ValueError while calling _set on store backend."
+                )
+
+        return self._run_bulk_operation(
+            _set, [(key, (value,)) for key, value in items], max_workers=max_workers
+        )
+
+    def _run_bulk_operation(
+        self,
+        operation: Callable,
+        calls: List[Tuple[tuple, tuple]],
+        max_workers: Optional[int] = None,
+    ) -> list:
+        """Calls operation(key, *args) for each (key, args) of calls, up to max_workers at once, and returns the results
+        in the order of the calls."""
+        if max_workers is None:
+            max_workers = self._default_bulk_max_workers
+        max_workers = min(max_workers, len(calls))
+
+        def _call(key, args):
+            try:
+                return operation(key, *args), None
+            except Exception as e:
+                return None, e
+
+        if max_workers <= 1:
+            outcomes = [_call(key, args) for key, args in calls]
+        else:
+            executor = self._get_bulk_executor(max_workers)
+            # the executor may have more threads than this operation is allowed to use
+            semaphore = threading.BoundedSemaphore(max_workers)
+            futures = []
+            for key, args in calls:
+                semaphore.acquire()
+                future = executor.submit(_call, key, args)
+                future.add_done_callback(lambda _: semaphore.release())
+                futures.append(future)
+            outcomes = [future.result() for future in futures]
+
+        return self._check_bulk_results(
+            [result for result, _ in outcomes],
+            {
+                key: error
+                for (key, _), (_, error) in zip(calls, outcomes)
+                if error is not None
+            },
+        )
+
+    def _get_bulk_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Returns the executor of the store backend, creating it on first use or when more workers are needed.
+
+        The executor replaced by a larger one finishes its pending calls before its threads exit, and the threads of the
+        last one exit once the store backend is garbage collected.
+        """
+        with self._bulk_executor_lock:
+            if self._bulk_executor_max_workers < max_workers:
+                if self._bulk_executor is not None:
+                    self._bulk_executor.shutdown(wait=False)
+                self._bulk_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="ge_store_backend"
+                )
+                self._bulk_executor_max_workers = max_workers
+            return self._bulk_executor
+
+    def _check_bulk_results(self, results: list, errors: dict) -> list:
+        """Returns the results of a bulk operation, or raises a StoreBackendBulkOperationError if some keys failed."""
+        if errors:
+            raise StoreBackendBulkOperationError(
+                f"{len(errors)} of {len(results)} keys failed in {self.__class__.__name__}",
+                results=results,
+                errors=errors,
+            )
+        return results
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -177,6 +356,14 @@ class StoreBackend(metaclass=ABCMeta):
     def list_keys(self, prefix=()):
         raise NotImplementedError
 
+    def list_keys_with_versions(self, prefix=()) -> dict:
+        """Return a dictionary mapping each key to a version of its value, read from the key listing.
+
+        A version is a string that changes whenever the value is written, such as an ETag or a modification time;
+        backends that cannot list versions cheaply map every key to None.
+        """
+        return {key: None for key in self.list_keys(prefix)}
+
     @abstractmethod
     def remove_key(self, key):
         raise NotImplementedError
@@ -238,6 +425,13 @@ class InMemoryStoreBackend(StoreBackend):
         except KeyError as e:
             raise InvalidKeyError(f"{str(e)}")
 
+    def get_all(self, prefix=()) -> dict:
+        return {
+            key: value
+            for key, value in self._store.items()
+            if key[: len(prefix)] == prefix
+        }
+
     def _set(self, key, value, **kwargs):
         self._store[key] = value
 
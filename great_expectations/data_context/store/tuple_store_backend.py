@@ -4,6 +4,7 @@ import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
 
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -22,6 +23,8 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     three components.
     """
 
+    _default_bulk_max_workers = 16
+
     def __init__(
         self,
         filepath_template=None,
@@ -71,6 +74,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             self.verify_that_key_to_filepath_operation_is_reversible()
             self._fixed_length_key = True
 
+    def get_all(self, prefix=()) -> dict:
+        keys = [key for key in self.list_keys() if key[: len(prefix)] == prefix]
+        return dict(zip(keys, self.get_many(keys)))
+
     def _validate_key(self, key):
         super()._validate_key(key)
 
@@ -342,7 +349,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         return False
 
     def list_keys(self, prefix=()):
-        key_list = []
+        return [key for key, _ in self._list_keys_and_filepaths(prefix)]
+
+    def list_keys_with_versions(self, prefix=()) -> dict:
+        versions = {}
+        for key, filepath in self._list_keys_and_filepaths(prefix):
+            stat = os.stat(filepath)
+            versions[key] = f"{stat.st_mtime_ns}-{stat.st_size}"
+        return versions
+
+    def _list_keys_and_filepaths(self, prefix=()):
+        """Yield (key, full file path) for every key under prefix."""
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)
         ):
@@ -367,9 +384,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     continue
                 key = self._convert_filepath_to_key(filepath)
                 if key and not self.is_ignored_key(key):
-                    key_list.append(key)
-
-        return key_list
+                    yield key, os.path.join(root, file_)
 
     def rrmdir(self, mroot, curpath):
         """
@@ -481,6 +496,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
             boto3_options = {}
         self._boto3_options = boto3_options
         self.endpoint_url = endpoint_url
+        # boto3 clients can be shared by threads, but resources cannot
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+        self._thread_local = threading.local()
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -527,7 +546,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _get(self, key):
         s3_object_key = self._build_s3_object_key(key)
 
-        s3 = self._create_client()
+        s3 = self._get_s3_client()
 
         try:
             s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
@@ -547,7 +566,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
     ):
         s3_object_key = self._build_s3_object_key(key)
 
-        s3 = self._create_resource()
+        s3 = self._get_s3_resource()
 
         try:
             result_s3 = s3.Object(self.bucket, s3_object_key)
@@ -566,7 +585,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
-        s3 = self._create_resource()
+        s3 = self._get_s3_resource()
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -582,7 +601,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3.Object(self.bucket, source_filepath).delete()
 
     def list_keys(self):
-        s3 = self._create_client()
+        return list(self.list_keys_with_versions())
+
+    def list_keys_with_versions(self) -> dict:
+        s3 = self._get_s3_client()
         paginator = s3.get_paginator("list_objects_v2")
 
         if self.prefix:
@@ -608,7 +630,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             if current_page_contents is not None:
                 objects.extend(current_page_contents)
 
-        key_list = []
+        versions = {}
         for s3_object_info in objects:
             s3_object_key = s3_object_info["Key"]
             if self.platform_specific_separator:
@@ -630,12 +652,12 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
             if key:
-                key_list.append(key)
+                versions[key] = s3_object_info.get("ETag")
 
-        return key_list
+        return versions
 
     def get_url_for_key(self, key, protocol=None):
-        location = self._create_client().get_bucket_location(Bucket=self.bucket)[
+        location = self._get_s3_client().get_bucket_location(Bucket=self.bucket)[
             "LocationConstraint"
         ]
         if self.boto3_options.get("endpoint_url"):
@@ -672,7 +694,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         if not isinstance(key, tuple):
             key = key.to_tuple()
 
-        s3 = self._create_resource()
+        s3 = self._get_s3_resource()
         s3_object_key = self._build_s3_object_key(key)
         s3.Object(self.bucket, s3_object_key).delete()
         if s3_object_key:
@@ -706,10 +728,11 @@ class TupleS3StoreBackend(TupleStoreBackend):
         from botocore.client import Config
 
         result = {}
-        if self._boto3_options.get("signature_version"):
-            signature_version = self._boto3_options.pop("signature_version")
+        boto3_options = dict(self._boto3_options)
+        if boto3_options.get("signature_version"):
+            signature_version = boto3_options.pop("signature_version")
             result["config"] = Config(signature_version=signature_version)
-        result.update(self._boto3_options)
+        result.update(boto3_options)
 
         return result
 
@@ -721,7 +744,23 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _create_resource(self):
         import boto3
 
-        return boto3.resource("s3", **self.boto3_options)
+        # The default session of boto3 cannot be used by several threads at once
+        return boto3.session.Session().resource("s3", **self.boto3_options)
+
+    def _get_s3_client(self):
+        """Returns the S3 client of the store, creating it on first use."""
+        with self._s3_client_lock:
+            if self._s3_client is None:
+                self._s3_client = self._create_client()
+            return self._s3_client
+
+    def _get_s3_resource(self):
+        """Returns the S3 resource of the current thread, creating it on first use."""
+        s3 = getattr(self._thread_local, "s3_resource", None)
+        if s3 is None:
+            s3 = self._create_resource()
+            self._thread_local.s3_resource = s3
+        return s3
 
     @property
     def config(self) -> dict:
@@ -771,6 +810,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        # google-cloud-storage clients are not thread-safe: each thread gets its own
+        self._thread_local = threading.local()
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -820,10 +861,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _get(self, key):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_bucket()
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
@@ -837,10 +875,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     ):
         gcs_object_key = self._build_gcs_object_key(key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_bucket()
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -853,10 +888,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_bucket()
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -869,11 +901,12 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         _ = bucket.rename_blob(blob, dest_filepath)
 
     def list_keys(self):
-        key_list = []
+        return list(self.list_keys_with_versions())
 
-        from google.cloud import storage
+    def list_keys_with_versions(self) -> dict:
+        versions = {}
 
-        gcs = storage.Client(self.project)
+        gcs = self._get_client()
 
         for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
             gcs_object_name = blob.name
@@ -891,8 +924,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
             if key:
-                key_list.append(key)
-        return key_list
+                versions[key] = blob.etag
+        return versions
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -932,11 +965,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return path_url
 
     def remove_key(self, key):
-        from google.cloud import storage
         from google.cloud.exceptions import NotFound
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.get_bucket(self.bucket)
+        bucket = self._get_bucket()
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
         except NotFound:
@@ -947,6 +978,24 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         all_keys = self.list_keys()
         return key in all_keys
 
+    def _get_client(self):
+        """Returns the GCS client of the current thread, creating it on first use."""
+        gcs = getattr(self._thread_local, "client", None)
+        if gcs is None:
+            from google.cloud import storage
+
+            gcs = storage.Client(project=self.project)
+            self._thread_local.client = gcs
+        return gcs
+
+    def _get_bucket(self):
+        """Returns the bucket of the store for the GCS client of the current thread, fetching it on first use."""
+        bucket = getattr(self._thread_local, "bucket", None)
+        if bucket is None:
+            bucket = self._get_client().get_bucket(self.bucket)
+            self._thread_local.bucket = bucket
+        return bucket
+
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
     """
@@ -984,15 +1033,20 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         self.connection_string = connection_string
         self.prefix = prefix
         self.container = container
+        self._container_client = None
+        self._container_client_lock = threading.Lock()
 
     def _get_container_client(self):
-
+        """Returns the container client of the store, creating it on first use."""
         from azure.storage.blob import BlobServiceClient
 
         if self.connection_string:
-            return BlobServiceClient.from_connection_string(
-                self.connection_string
-            ).get_container_client(self.container)
+            with self._container_client_lock:
+                if self._container_client is None:
+                    self._container_client = BlobServiceClient.from_connection_string(
+                        self.connection_string
+                    ).get_container_client(self.container)
+                return self._container_client
         else:
             raise StoreBackendError(
                 "Unable to initialze ServiceClient, AZURE_STORAGE_CONNECTION_STRING should be set"
@@ -1024,7 +1078,10 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         return az_blob_key
 
     def list_keys(self):
-        key_list = []
+        return list(self.list_keys_with_versions())
+
+    def list_keys_with_versions(self) -> dict:
+        versions = {}
 
         for obj in self._get_container_client().list_blobs(
             name_starts_with=self.prefix
@@ -1042,8 +1099,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
 
-            key_list.append(key)
-        return key_list
+            versions[key] = obj.etag
+        return versions
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -110,11 +110,12 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
 
     def _refresh_data_references_cache(self):
 
-        # Map data_references to batch_definitions
-        self._data_references_cache = {}
+        # Map data_references to batch_definitions (aside, so that threads getting batches concurrently never see a
+        # partially filled cache)
+        data_references_cache = {}
 
         for data_asset_name in self.get_available_data_asset_names():
-            self._data_references_cache[data_asset_name] = {}
+            data_references_cache[data_asset_name] = {}
 
             for data_reference in self._get_data_reference_list(
                 data_asset_name=data_asset_name
@@ -125,9 +126,10 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
                     data_reference=data_reference,
                     data_asset_name=data_asset_name,
                 )
-                self._data_references_cache[data_asset_name][
+                data_references_cache[data_asset_name][
                     data_reference
                 ] = mapped_batch_definition_list
+        self._data_references_cache = data_references_cache
 
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
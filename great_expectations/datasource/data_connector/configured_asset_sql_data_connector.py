@@ -89,7 +89,8 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         return partition_definition_list
 
     def _refresh_data_references_cache(self):
-        self._data_references_cache = {}
+        # Built aside, so that threads getting batches concurrently never see a partially filled cache
+        data_references_cache = {}
 
         for data_asset_name in self.data_assets:
             data_asset = self.data_assets[data_asset_name]
@@ -102,7 +103,8 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
 
             # TODO Abe 20201029 : Apply sorters to partition_definition_list here
             # TODO Will 20201102 : add sorting code here
-            self._data_references_cache[data_asset_name] = partition_definition_list
+            data_references_cache[data_asset_name] = partition_definition_list
+        self._data_references_cache = data_references_cache
 
     def _get_column_names_from_splitter_kwargs(self, splitter_kwargs) -> List[str]:
         column_names: List[str] = []
@@ -58,8 +58,9 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
 
     def _refresh_data_references_cache(self):
         """ refreshes data_reference cache """
-        # Map data_references to batch_definitions
-        self._data_references_cache = {}
+        # Map data_references to batch_definitions (aside, so that threads getting batches concurrently never see a
+        # partially filled cache)
+        data_references_cache = {}
 
         for data_reference in self._get_data_reference_list():
             mapped_batch_definition_list: List[
@@ -67,7 +68,8 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             ] = self._map_data_reference_to_batch_definition_list(
                 data_reference=data_reference, data_asset_name=None
             )
-            self._data_references_cache[data_reference] = mapped_batch_definition_list
+            data_references_cache[data_reference] = mapped_batch_definition_list
+        self._data_references_cache = data_references_cache
 
     def get_data_reference_list_count(self) -> int:
         """
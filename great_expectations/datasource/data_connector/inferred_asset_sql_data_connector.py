@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 
+from great_expectations.core.sqlalchemy_schema_cache import SqlAlchemySchemaCache
 from great_expectations.datasource.data_connector import ConfiguredAssetSqlDataConnector
 from great_expectations.datasource.data_connector.asset import Asset
 from great_expectations.execution_engine import ExecutionEngine
@@ -204,12 +205,14 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         include_views=True,
     ):
         engine = self._execution_engine.engine
-        inspector = sa.inspect(engine)
+        schema_cache = getattr(self._execution_engine, "schema_cache", None)
+        if schema_cache is None:
+            schema_cache = SqlAlchemySchemaCache(ttl=0)
 
         selected_schema_name = schema_name
 
         tables = []
-        for schema_name in inspector.get_schema_names():
+        for schema_name in schema_cache.get_schema_names(engine):
             if (
                 ignore_information_schemas_and_system_tables
                 and schema_name in information_schemas
@@ -219,7 +222,9 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if selected_schema_name is not None and schema_name != selected_schema_name:
                 continue
 
-            for table_name in inspector.get_table_names(schema=schema_name):
+            for table_name in schema_cache.get_table_names(
+                engine, schema_name=schema_name
+            ):
 
                 if (ignore_information_schemas_and_system_tables) and (
                     table_name in system_tables
@@ -238,7 +243,9 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if include_views:
                 # Note: this is not implemented for bigquery
 
-                for view_name in inspector.get_view_names(schema=schema_name):
+                for view_name in schema_cache.get_view_names(
+                    engine, schema_name=schema_name
+                ):
 
                     if (ignore_information_schemas_and_system_tables) and (
                         table_name in system_tables
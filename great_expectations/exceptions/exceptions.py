@@ -46,6 +46,20 @@ class StoreBackendError(DataContextError):
     pass
 
 
+class StoreBackendBulkOperationError(StoreBackendError):
+    """Raised by StoreBackend.get_many and set_many when some of the keys failed.
+
+    Attributes:
+        results: the result of each key, in the order of the keys (None for the keys that failed)
+        errors: the exception raised for each key that failed, by key
+    """
+
+    def __init__(self, message, results, errors):
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+
+
 class UnavailableMetricError(GreatExpectationsError):
     pass
 
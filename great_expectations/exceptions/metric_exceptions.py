@@ -8,3 +8,7 @@ class MetricError(GreatExpectationsError):
 
 class MetricProviderError(MetricError):
     pass
+
+
+class MetricResolutionError(MetricError):
+    pass
@@ -0,0 +1,406 @@
+import logging
+import math
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+# Map metrics whose condition on a row depends on the other rows of the batch, and which therefore cannot be computed
+# one chunk at a time.
+CHUNK_UNSAFE_MAP_METRICS = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+}
+
+
+class ChunkedMetricMerge:
+    """Describes how the values a metric takes on each chunk of a chunked batch are merged into its value on the batch.
+
+    On each chunk, the metric is computed as usual and partial_fn turns its value into a partial state; partial states
+    are folded together with combine_fn as chunks are read, and finalize_fn turns the result into the metric value.
+
+    Args:
+        combine_fn: combine_fn(state, other_state, metric) returns the state of the union of the two chunks; it must be
+            associative. If None, the metric is not computed on the chunks at all, but from the (already merged) values of
+            its dependencies.
+        partial_fn: partial_fn(execution_engine, metric, value) returns the partial state of the chunk currently loaded
+            in execution_engine, given the value of the metric on that chunk (defaults to the value itself)
+        finalize_fn: finalize_fn(state, metric) returns the metric value (defaults to the state itself)
+        done_fn: done_fn(state, metric) returns True once no further chunk can change the metric value, so that it
+            need not be computed on the remaining chunks
+        complete_result_format: compute the metric on each chunk with the COMPLETE result_format, so that partial
+            states are not truncated before they are combined
+        supports_fn: supports_fn(metric) returns whether the metric can be merged across chunks with the value kwargs
+            it is configured with (defaults to always)
+    """
+
+    def __init__(
+        self,
+        combine_fn: Optional[Callable] = None,
+        partial_fn: Optional[Callable] = None,
+        finalize_fn: Optional[Callable] = None,
+        done_fn: Optional[Callable] = None,
+        complete_result_format: bool = False,
+        supports_fn: Optional[Callable] = None,
+    ):
+        self.combine_fn = combine_fn
+        self.partial_fn = partial_fn
+        self.finalize_fn = finalize_fn
+        self.done_fn = done_fn
+        self.complete_result_format = complete_result_format
+        self.supports_fn = supports_fn
+
+    @property
+    def derived(self) -> bool:
+        """Whether the metric is computed from the merged values of its dependencies rather than on each chunk."""
+        return self.combine_fn is None and self.done_fn is None
+
+    def supports(self, metric: MetricConfiguration) -> bool:
+        return self.supports_fn is None or self.supports_fn(metric)
+
+    def partial(self, execution_engine, metric: MetricConfiguration, value: Any) -> Any:
+        if self.partial_fn is None:
+            return value
+        return self.partial_fn(execution_engine, metric, value)
+
+    def combine(self, state: Any, other_state: Any, metric: MetricConfiguration) -> Any:
+        return self.combine_fn(state, other_state, metric)
+
+    def finalize(self, state: Any, metric: MetricConfiguration) -> Any:
+        if self.finalize_fn is None:
+            return state
+        return self.finalize_fn(state, metric)
+
+    def done(self, state: Any, metric: MetricConfiguration) -> bool:
+        return self.done_fn is not None and self.done_fn(state, metric)
+
+
+_chunked_metric_merges: Dict[str, ChunkedMetricMerge] = dict()
+_chunked_metric_suffix_merges: Dict[str, ChunkedMetricMerge] = dict()
+
+
+def register_chunked_metric_merge(metric_name: str, merge: ChunkedMetricMerge) -> None:
+    """Registers how the partial values of a metric are merged across the chunks of a chunked batch.
+
+    A metric_name starting with "." is a suffix, and applies to every metric whose name ends with it (e.g.
+    ".unexpected_count" applies to the unexpected counts of all map metrics).
+    """
+    if metric_name.startswith("."):
+        _chunked_metric_suffix_merges[metric_name] = merge
+    else:
+        _chunked_metric_merges[metric_name] = merge
+
+
+def get_chunked_metric_merge(metric_name: str) -> Optional[ChunkedMetricMerge]:
+    """Returns how the partial values of a metric are merged across chunks, or None if they cannot be."""
+    if metric_name in _chunked_metric_merges:
+        return _chunked_metric_merges[metric_name]
+    for suffix, merge in _chunked_metric_suffix_merges.items():
+        if metric_name.endswith(suffix):
+            return merge
+    return None
+
+
+def _get_column_values(execution_engine, metric: MetricConfiguration) -> pd.Series:
+    values, _, _ = execution_engine.get_column_domain_values(
+        domain_kwargs=metric.metric_domain_kwargs, filter_column_isnull=True
+    )
+    return values
+
+
+def _get_unexpected_limit(metric: MetricConfiguration) -> Optional[int]:
+    result_format = metric.metric_value_kwargs.get("result_format")
+    if result_format is None or result_format["result_format"] == "COMPLETE":
+        return None
+    return result_format["partial_unexpected_count"]
+
+
+def _sum(state, other_state, metric):
+    return state + other_state
+
+
+def _first(state, metric):
+    return True
+
+
+def _min(state, other_state, metric):
+    if pd.isnull(state):
+        return other_state
+    if pd.isnull(other_state):
+        return state
+    return min(state, other_state)
+
+
+def _max(state, other_state, metric):
+    if pd.isnull(state):
+        return other_state
+    if pd.isnull(other_state):
+        return state
+    return max(state, other_state)
+
+
+def _mean_partial(execution_engine, metric, value):
+    return value, len(_get_column_values(execution_engine, metric))
+
+
+def _mean_combine(state, other_state, metric):
+    (mean, count), (other_mean, other_count) = state, other_state
+    if count == 0:
+        return other_state
+    if other_count == 0:
+        return state
+    total_count = count + other_count
+    return mean + (other_mean - mean) * other_count / total_count, total_count
+
+
+def _mean_finalize(state, metric):
+    mean, count = state
+    return mean if count > 0 else np.nan
+
+
+def _moments_partial(execution_engine, metric, value):
+    values = _get_column_values(execution_engine, metric)
+    count = len(values)
+    if count == 0:
+        return 0, 0.0, 0.0
+    mean = values.mean()
+    return count, mean, float(((values - mean) ** 2).sum())
+
+
+def _moments_combine(state, other_state, metric):
+    """Combines (count, mean, sum of squared deviations) states, as in Chan et al.'s parallel variance algorithm."""
+    (count, mean, m2), (other_count, other_mean, other_m2) = state, other_state
+    if count == 0:
+        return other_state
+    if other_count == 0:
+        return state
+    total_count = count + other_count
+    delta = other_mean - mean
+    return (
+        total_count,
+        mean + delta * other_count / total_count,
+        m2 + other_m2 + delta ** 2 * count * other_count / total_count,
+    )
+
+
+def _standard_deviation_finalize(state, metric):
+    count, _, m2 = state
+    if count < 2:
+        return np.nan
+    return math.sqrt(m2 / (count - 1))
+
+
+def _combine_value_counts(state, other_state, metric):
+    return pd.concat([state, other_state]).groupby(level=0, sort=False).sum()
+
+
+def _value_counts_finalize(state, metric):
+    counts = state.astype("int64")
+    if metric.metric_value_kwargs.get("sort", "value") == "value":
+        try:
+            counts = counts.sort_index()
+        except TypeError:
+            counts.index = counts.index.astype(str)
+            counts = counts.sort_index()
+    else:
+        counts = counts.sort_values(ascending=False, kind="mergesort")
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
+
+
+def _value_counts_partial(execution_engine, metric, value):
+    return _get_column_values(execution_engine, metric).value_counts()
+
+
+def _most_common_value_finalize(state, metric):
+    if len(state) == 0:
+        return []
+    mode = list(state[state == state.max()].index)
+    try:
+        return sorted(mode)
+    except TypeError:
+        return mode
+
+
+def _distinct_values_partial(execution_engine, metric, value):
+    return set(_get_column_values(execution_engine, metric).unique())
+
+
+def _union(state, other_state, metric):
+    return state | other_state
+
+
+def _histogram_combine(state, other_state, metric):
+    return [count + other_count for count, other_count in zip(state, other_state)]
+
+
+def _unexpected_list_combine(state, other_state, metric):
+    limit = _get_unexpected_limit(metric)
+    if limit is not None and len(state) >= limit:
+        return state
+    return (list(state) + list(other_state))[:limit]
+
+
+def _unexpected_index_list_partial(execution_engine, metric, value):
+    """Returns the unexpected indices of the chunk together with the number of rows of its domain, by which the
+    indices of the following chunks are shifted if the domain is reindexed by a row_condition."""
+    if not metric.metric_domain_kwargs.get("row_condition"):
+        return value, 0
+    data, _, _ = execution_engine.get_compute_domain(
+        metric.metric_domain_kwargs, domain_type="table"
+    )
+    return value, len(data)
+
+
+def _unexpected_index_list_combine(state, other_state, metric):
+    (index_list, num_rows), (other_index_list, other_num_rows) = state, other_state
+    return (
+        _unexpected_list_combine(
+            index_list, [index + num_rows for index in other_index_list], metric
+        ),
+        num_rows + other_num_rows,
+    )
+
+
+def _unexpected_rows_combine(state, other_state, metric):
+    limit = _get_unexpected_limit(metric)
+    if limit is not None and len(state) >= limit:
+        return state
+    rows = pd.concat([state, other_state])
+    return rows if limit is None else rows.head(limit)
+
+
+def _unexpected_value_counts_finalize(state, metric):
+    value_counts = state.sort_values(ascending=False, kind="mergesort")
+    limit = _get_unexpected_limit(metric)
+    return value_counts if limit is None else value_counts[:limit]
+
+
+def _merge_sketches(state, other_state, metric):
+    return state.merge(other_state)
+
+
+def _approximate_quantiles(metric):
+    """Quantiles are merged across chunks only when they are computed from a KLL sketch."""
+    allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+    return bool(allow_relative_error) and not isinstance(allow_relative_error, str)
+
+
+def _head_combine(state, other_state, metric):
+    return pd.concat([state, other_state])
+
+
+def _head_finalize(state, metric):
+    if metric.metric_value_kwargs.get("fetch_all"):
+        return state
+    return state.head(metric.metric_value_kwargs["n_rows"])
+
+
+def _head_done(state, metric):
+    if metric.metric_value_kwargs.get("fetch_all"):
+        return False
+    n_rows = metric.metric_value_kwargs["n_rows"]
+    return n_rows >= 0 and len(state) >= n_rows
+
+
+for _metric_name in ["table.row_count", "column.sum", "column_values.between.count"]:
+    register_chunked_metric_merge(_metric_name, ChunkedMetricMerge(combine_fn=_sum))
+for _metric_name in ["table.columns", "table.column_types"]:
+    register_chunked_metric_merge(_metric_name, ChunkedMetricMerge(done_fn=_first))
+for _metric_name in [
+    "table.column_count",
+    "column.unique_proportion",
+    "column.partition",
+]:
+    register_chunked_metric_merge(_metric_name, ChunkedMetricMerge())
+register_chunked_metric_merge(
+    "table.head",
+    ChunkedMetricMerge(
+        combine_fn=_head_combine, finalize_fn=_head_finalize, done_fn=_head_done
+    ),
+)
+register_chunked_metric_merge("column.min", ChunkedMetricMerge(combine_fn=_min))
+register_chunked_metric_merge("column.max", ChunkedMetricMerge(combine_fn=_max))
+register_chunked_metric_merge(
+    "column.mean",
+    ChunkedMetricMerge(
+        combine_fn=_mean_combine,
+        partial_fn=_mean_partial,
+        finalize_fn=_mean_finalize,
+    ),
+)
+register_chunked_metric_merge(
+    "column.standard_deviation",
+    ChunkedMetricMerge(
+        combine_fn=_moments_combine,
+        partial_fn=_moments_partial,
+        finalize_fn=_standard_deviation_finalize,
+    ),
+)
+register_chunked_metric_merge(
+    "column.value_counts",
+    ChunkedMetricMerge(
+        combine_fn=_combine_value_counts, finalize_fn=_value_counts_finalize
+    ),
+)
+register_chunked_metric_merge(
+    "column.most_common_value",
+    ChunkedMetricMerge(
+        combine_fn=_combine_value_counts,
+        partial_fn=_value_counts_partial,
+        finalize_fn=_most_common_value_finalize,
+    ),
+)
+register_chunked_metric_merge(
+    "column.distinct_values", ChunkedMetricMerge(combine_fn=_union)
+)
+register_chunked_metric_merge(
+    "column.distinct_values.count",
+    ChunkedMetricMerge(
+        combine_fn=_union,
+        partial_fn=_distinct_values_partial,
+        finalize_fn=lambda state, metric: len(state),
+    ),
+)
+register_chunked_metric_merge(
+    "column.histogram", ChunkedMetricMerge(combine_fn=_histogram_combine)
+)
+for _metric_name in ["column.hll_sketch", "column.kll_sketch"]:
+    register_chunked_metric_merge(
+        _metric_name, ChunkedMetricMerge(combine_fn=_merge_sketches)
+    )
+register_chunked_metric_merge(
+    "column.distinct_values.approx_count", ChunkedMetricMerge()
+)
+register_chunked_metric_merge(
+    "column.quantile_values", ChunkedMetricMerge(supports_fn=_approximate_quantiles)
+)
+register_chunked_metric_merge(".unexpected_count", ChunkedMetricMerge(combine_fn=_sum))
+register_chunked_metric_merge(
+    ".unexpected_values", ChunkedMetricMerge(combine_fn=_unexpected_list_combine)
+)
+register_chunked_metric_merge(
+    ".unexpected_index_list",
+    ChunkedMetricMerge(
+        combine_fn=_unexpected_index_list_combine,
+        partial_fn=_unexpected_index_list_partial,
+        finalize_fn=lambda state, metric: state[0],
+    ),
+)
+register_chunked_metric_merge(
+    ".unexpected_rows", ChunkedMetricMerge(combine_fn=_unexpected_rows_combine)
+)
+register_chunked_metric_merge(
+    ".unexpected_value_counts",
+    ChunkedMetricMerge(
+        combine_fn=_combine_value_counts,
+        finalize_fn=_unexpected_value_counts_finalize,
+        complete_result_format=True,
+    ),
+)
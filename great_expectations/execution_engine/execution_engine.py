@@ -1,13 +1,18 @@
 import copy
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import filter_properties_dict
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -18,17 +23,6 @@ yaml.default_flow_style = False
 import pandas as pd
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    def update(self, value):
-        return None
-
-
 class BatchData:
     def __init__(self, execution_engine):
         self._execution_engine = execution_engine
@@ -52,18 +46,20 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache_max_bytes=None,
     ):
         self.name = name
         self._validator = validator
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance. Cached values are invalidated when a batch
+        # is (re)loaded with load_batch_data.
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache = {}
+            self._metric_cache = MetricCache(max_bytes=metric_cache_max_bytes)
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = None
+        self._batch_load_counts = dict()
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -81,6 +77,10 @@ class ExecutionEngine(ABC):
         }
 
         self._batch_data_dict = {}
+        # Validators that run in separate threads (e.g. the validations of a checkpoint run concurrently) each keep
+        # their own active batch
+        self._thread_active_batch_data_id = threading.local()
+        self._last_active_batch_data_id = None
         if batch_data_dict is None:
             batch_data_dict = {}
         self._load_batch_data_from_dict(batch_data_dict)
@@ -94,6 +94,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -103,6 +104,21 @@ class ExecutionEngine(ABC):
         """Optionally configure the validator as appropriate for the execution engine."""
         pass
 
+    @property
+    def _active_batch_data_id(self) -> Optional[str]:
+        """The batch most recently loaded (or made active) by the current thread, or by any thread if the current
+        thread has loaded none."""
+        return getattr(
+            self._thread_active_batch_data_id,
+            "batch_id",
+            self._last_active_batch_data_id,
+        )
+
+    @_active_batch_data_id.setter
+    def _active_batch_data_id(self, batch_id: Optional[str]):
+        self._thread_active_batch_data_id.batch_id = batch_id
+        self._last_active_batch_data_id = batch_id
+
     @property
     def active_batch_data_id(self):
         """The batch id for the default batch data.
@@ -139,6 +155,38 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Whether independent metrics may be computed from several threads at once.
+
+        Engines holding state that cannot be shared across threads (e.g. a single pinned database connection) must
+        return False.
+        """
+        return False
+
+    @contextmanager
+    def metric_resolution_executor(self, max_workers: Optional[int] = None):
+        """Provide an executor for resolving independent metrics concurrently.
+
+        Yields None (meaning metrics are resolved sequentially) unless max_workers is greater than one and the engine
+        supports concurrent metric resolution.
+
+        Args:
+            max_workers: the maximum number of metric functions to run at once
+        """
+        if (
+            max_workers is None
+            or max_workers <= 1
+            or not self.supports_concurrent_metric_resolution
+        ):
+            yield None
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ge_metric_resolution"
+        ) as executor:
+            yield executor
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -165,6 +213,75 @@ class ExecutionEngine(ABC):
         """
         self._batch_data_dict[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+        self._batch_load_counts[batch_id] = self._batch_load_counts.get(batch_id, 0) + 1
+        if self._metric_cache is not None:
+            self._metric_cache.invalidate(batch_id)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Unloads the specified batch_data from the execution engine, releasing the resources it holds
+        """
+        self._batch_data_dict.pop(batch_id, None)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+        if self._metric_cache is not None:
+            self._metric_cache.invalidate(batch_id)
+
+    @property
+    def metric_cache_stats(self) -> dict:
+        """Per-metric-name hit, miss and latency (seconds spent computing missed values) counters of the metric
+        cache."""
+        if self._metric_cache is None:
+            return dict()
+        return self._metric_cache.stats
+
+    def _get_batch_fingerprint(self, metric: MetricConfiguration) -> Optional[Tuple]:
+        """Identifies the loaded batch on which a metric is computed: its batch_id, and how many times data has been
+        loaded under that batch_id. Returns None if the metric does not refer to a loaded batch."""
+        batch_id = metric.metric_domain_kwargs.get("batch_id")
+        if batch_id is None:
+            batch_id = self.active_batch_data_id
+        if batch_id not in self._batch_load_counts:
+            return None
+        return batch_id, self._batch_load_counts[batch_id]
+
+    def get_cached_metrics(self, metrics: Iterable[MetricConfiguration]) -> dict:
+        """Returns the cached values of those of the given metrics that have already been resolved on their batch.
+
+        Returns:
+            A dictionary of metric values keyed by metric id.
+        """
+        cached_metrics = dict()
+        if self._metric_cache is None:
+            return cached_metrics
+        for metric in metrics:
+            batch_fingerprint = self._get_batch_fingerprint(metric)
+            if batch_fingerprint is None:
+                continue
+            # Misses are recorded when the metric is resolved
+            found, value = self._metric_cache.get(
+                batch_fingerprint, metric.id, record_miss=False
+            )
+            if found:
+                cached_metrics[metric.id] = value
+        return cached_metrics
+
+    @staticmethod
+    def _timed_metric_fn_call(metric_fn, metric_provider_kwargs) -> Tuple[Any, float]:
+        start = time.perf_counter()
+        value = metric_fn(**metric_provider_kwargs)
+        return value, time.perf_counter() - start
+
+    def _call_with_active_batch_data_id(self, active_batch_data_id, fn, *args):
+        """Calls fn in a worker thread with the active batch of the thread that submitted it."""
+        thread_state = self._thread_active_batch_data_id
+        previous_state = dict(thread_state.__dict__)
+        thread_state.batch_id = active_batch_data_id
+        try:
+            return fn(*args)
+        finally:
+            thread_state.__dict__.clear()
+            thread_state.__dict__.update(previous_state)
 
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
@@ -173,11 +290,20 @@ class ExecutionEngine(ABC):
         for batch_id, batch_data in batch_data_dict.items():
             self.load_batch_data(batch_id, batch_data)
 
+    def check_metric_support(self, metric: MetricConfiguration) -> None:
+        """Raises an ExecutionEngineError if the engine cannot resolve metric on the batch it refers to.
+
+        The validator calls this for every metric of an expectation before any metric is resolved, so that expectations
+        the engine cannot evaluate fail without reading any data.
+        """
+        pass
+
     def resolve_metrics(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
         metrics: Dict[Tuple, Any] = None,
         runtime_configuration: dict = None,
+        executor: Optional[Executor] = None,
     ) -> dict:
         """resolve_metrics is the main entrypoint for an execution engine. The execution engine will compute the value
         of the provided metrics.
@@ -186,20 +312,42 @@ class ExecutionEngine(ABC):
             metrics_to_resolve: the metrics to evaluate
             metrics: already-computed metrics currently available to the engine
             runtime_configuration: runtime configuration information
+            executor: if provided, metric functions that are not bundled are submitted to this executor and run
+                concurrently (see metric_resolution_executor)
 
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+
+        Metric values (as opposed to partial functions) are stored in the metric cache, if caching is enabled, and are
+        returned from it as long as their batch has not been reloaded.
         """
         if metrics is None:
             metrics = dict()
 
         resolved_metrics = dict()
+        # Batch fingerprints of the metrics whose values should be stored in the metric cache once resolved
+        cacheable_metrics = dict()
 
         metric_fn_bundle = []
+        metric_fn_calls = []
         for metric_to_resolve in metrics_to_resolve:
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
             )
+            if self._metric_cache is not None and (
+                metric_fn is None
+                or getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+                == MetricFunctionTypes.VALUE
+            ):
+                batch_fingerprint = self._get_batch_fingerprint(metric_to_resolve)
+                if batch_fingerprint is not None:
+                    found, value = self._metric_cache.get(
+                        batch_fingerprint, metric_to_resolve.id
+                    )
+                    if found:
+                        resolved_metrics[metric_to_resolve.id] = value
+                        continue
+                    cacheable_metrics[metric_to_resolve.id] = batch_fingerprint
             try:
                 metric_dependencies = {
                     k: metrics[v.id]
@@ -239,7 +387,7 @@ class ExecutionEngine(ABC):
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
             )
-            if metric_fn_type in [
+            if metric_fn_type not in [
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_FN,
                 MetricPartialFunctionTypes.MAP_CONDITION_FN,
@@ -247,25 +395,60 @@ class ExecutionEngine(ABC):
                 MetricPartialFunctionTypes.WINDOW_FN,
                 MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
                 MetricPartialFunctionTypes.AGGREGATE_FN,
+                MetricFunctionTypes.VALUE,
             ]:
-                # NOTE: 20201026 - JPC - we could use the fact that these metric functions return functions rather
-                # than data to optimize compute in the future
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            elif metric_fn_type == MetricFunctionTypes.VALUE:
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
                 )
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
+            # NOTE: 20201026 - JPC - we could use the fact that partial metric functions return functions rather
+            # than data to optimize compute in the future
+            metric_fn_calls.append(
+                (metric_to_resolve, metric_fn, metric_provider_kwargs)
+            )
+
+        latencies = dict()
+        metric_fn_futures = []
+        if executor is not None and len(metric_fn_calls) > 1:
+            for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_calls:
+                metric_fn_futures.append(
+                    (
+                        metric_to_resolve.id,
+                        executor.submit(
+                            self._call_with_active_batch_data_id,
+                            self._active_batch_data_id,
+                            self._timed_metric_fn_call,
+                            metric_fn,
+                            metric_provider_kwargs,
+                        ),
+                    )
                 )
+        else:
+            for metric_to_resolve, metric_fn, metric_provider_kwargs in metric_fn_calls:
+                (
+                    resolved_metrics[metric_to_resolve.id],
+                    latencies[metric_to_resolve.id],
+                ) = self._timed_metric_fn_call(metric_fn, metric_provider_kwargs)
+
         if len(metric_fn_bundle) > 0:
-            resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+            start = time.perf_counter()
+            bundle_metrics = self.resolve_metric_bundle(metric_fn_bundle)
+            # The bundle is computed at once; each of its metrics is charged an equal share of the time spent.
+            bundle_latency = (time.perf_counter() - start) / len(metric_fn_bundle)
+            for metric_id in bundle_metrics:
+                latencies[metric_id] = bundle_latency
+            resolved_metrics.update(bundle_metrics)
+
+        for metric_id, future in metric_fn_futures:
+            resolved_metrics[metric_id], latencies[metric_id] = future.result()
+
+        for metric_id, batch_fingerprint in cacheable_metrics.items():
+            if metric_id in resolved_metrics:
+                self._metric_cache.set(
+                    batch_fingerprint,
+                    metric_id,
+                    resolved_metrics[metric_id],
+                    latency=latencies.get(metric_id),
+                )
 
         return resolved_metrics
 
@@ -0,0 +1,134 @@
+import copy
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_METRIC_CACHE_MAX_BYTES = 2 ** 26
+
+
+def estimate_metric_value_size(value: Any) -> int:
+    """Returns an estimate, in bytes, of the memory held by a resolved metric value."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        memory_usage = value.memory_usage(deep=True)
+        return int(memory_usage.sum() if hasattr(memory_usage, "sum") else memory_usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_metric_value_size(k) + estimate_metric_value_size(v)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            estimate_metric_value_size(item) for item in value
+        )
+    return sys.getsizeof(value)
+
+
+def _copy_metric_value(value: Any) -> Any:
+    """Returns a copy of a mutable metric value, so that callers cannot modify the value held by the cache."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index, np.ndarray)):
+        return value.copy()
+    if isinstance(value, (dict, list, set)):
+        return copy.deepcopy(value)
+    return value
+
+
+class MetricCache:
+    """An LRU cache of resolved metric values, keyed by (batch fingerprint, metric id).
+
+    The batch fingerprint identifies the batch a metric was computed on, so that all of the values computed on a batch
+    can be invalidated at once when that batch is reloaded. Values are evicted, least recently used first, once their
+    estimated total size exceeds max_bytes. Hits, misses and the time spent computing missed values are recorded for
+    each metric name. Mutable values (DataFrames, Series, arrays, dicts, lists and sets) are copied when they are stored
+    and when they are returned.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = DEFAULT_METRIC_CACHE_MAX_BYTES
+        self._max_bytes = max_bytes
+        self._values = OrderedDict()
+        self._bytes = 0
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0, "latency": 0.0})
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def stats(self) -> dict:
+        """Per-metric-name counters: number of hits, number of misses, and seconds spent computing missed values."""
+        with self._lock:
+            return {
+                metric_name: dict(stats) for metric_name, stats in self._stats.items()
+            }
+
+    def get(
+        self, batch_fingerprint: Hashable, metric_id: Tuple, record_miss: bool = True
+    ) -> Tuple[bool, Any]:
+        """Returns a (found, value) tuple for the given metric, and records the hit (or the miss, if record_miss)."""
+        key = (batch_fingerprint, metric_id)
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                self._stats[metric_id[0]]["hits"] += 1
+                value = self._values[key][0]
+            else:
+                if record_miss:
+                    self._stats[metric_id[0]]["misses"] += 1
+                return False, None
+        return True, _copy_metric_value(value)
+
+    def set(
+        self,
+        batch_fingerprint: Hashable,
+        metric_id: Tuple,
+        value: Any,
+        latency: Optional[float] = None,
+    ) -> None:
+        """Stores a resolved metric value, evicting the least recently used values if needed to stay within max_bytes.
+
+        Args:
+            batch_fingerprint: the fingerprint of the batch on which the metric was computed
+            metric_id: the id of the metric
+            value: the resolved value
+            latency: the number of seconds it took to compute value
+        """
+        key = (batch_fingerprint, metric_id)
+        nbytes = estimate_metric_value_size(value)
+        with self._lock:
+            if latency is not None:
+                self._stats[metric_id[0]]["latency"] += latency
+            if nbytes > self._max_bytes:
+                return
+            if key in self._values:
+                self._bytes -= self._values.pop(key)[1]
+            self._values[key] = (_copy_metric_value(value), nbytes)
+            self._bytes += nbytes
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_nbytes) = self._values.popitem(last=False)
+                self._bytes -= evicted_nbytes
+
+    def invalidate(self, batch_id: Hashable) -> None:
+        """Removes every value computed on any fingerprint of the given batch."""
+        with self._lock:
+            for key in [key for key in self._values if key[0][0] == batch_id]:
+                self._bytes -= self._values.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._bytes = 0
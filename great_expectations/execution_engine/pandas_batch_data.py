@@ -1,13 +1,74 @@
+from typing import Callable, Iterator, List, Optional
+
 import pandas as pd
 
+from great_expectations.exceptions import ExecutionEngineError
 from great_expectations.execution_engine.execution_engine import BatchData
 
 
 class PandasBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe: pd.DataFrame):
+    def __init__(
+        self,
+        execution_engine,
+        dataframe: pd.DataFrame,
+        source_columns: Optional[List[str]] = None,
+    ):
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self._source_columns = source_columns
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def source_columns(self) -> Optional[List[str]]:
+        """The columns of the source, if the batch was loaded with a column projection; otherwise None."""
+        return self._source_columns
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """Batch data that is read from its source one chunk of rows at a time, so that batches larger than memory can be
+    validated.
+
+    The rows of the batch are never held at once: PandasExecutionEngine computes metrics on each chunk in turn, while
+    that chunk is the batch's dataframe, and merges their partial values.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader: Callable[[], Iterator[pd.DataFrame]],
+        chunk_size: int,
+        source_columns: Optional[List[str]] = None,
+    ):
+        super().__init__(
+            execution_engine=execution_engine,
+            dataframe=None,
+            source_columns=source_columns,
+        )
+        self._chunk_reader = chunk_reader
+        self._chunk_size = chunk_size
+        self._current_chunk = None
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def dataframe(self):
+        if self._current_chunk is None:
+            raise ExecutionEngineError(
+                "The rows of a chunked batch are only available one chunk at a time, while its metrics are resolved."
+            )
+        return self._current_chunk
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reads the batch from its source, yielding its chunks in order; each chunk is the batch's dataframe until
+        the next one is read."""
+        try:
+            for chunk in self._chunk_reader():
+                self._current_chunk = chunk
+                yield chunk
+        finally:
+            self._current_chunk = None
@@ -1,13 +1,17 @@
-import copy
 import datetime
 import hashlib
 import logging
 import pickle
 import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions.exceptions as ge_exceptions
@@ -17,8 +21,17 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import S3Url, sniff_s3_compression
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.chunked_metrics import (
+    CHUNK_UNSAFE_MAP_METRICS,
+    get_chunked_metric_merge,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.expectations.registry import get_metric_provider
 
 try:
     import boto3
@@ -28,11 +41,18 @@ except ImportError:
 from great_expectations.core.batch import BatchMarkers
 
 from ..exceptions import BatchSpecError, GreatExpectationsError, ValidationError
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from ..validator.validation_graph import MetricConfiguration
+from .execution_engine import (
+    ExecutionEngine,
+    MetricDomainTypes,
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
+DEFAULT_COMPUTE_DOMAIN_CACHE_MAX_BYTES = 2 ** 28
 
 
 class PandasExecutionEngine(ExecutionEngine):
@@ -86,6 +106,25 @@ Notes:
         except (TypeError, AttributeError):
             self._s3 = None
 
+        # DataFrames filtered by a row_condition are kept in an LRU cache, keyed on (batch_id, row_condition,
+        # condition_parser), as long as their total memory_usage stays within compute_domain_cache_max_bytes. The
+        # positions of the non-null rows of column domains, which are shared by every map metric on a column, are
+        # kept in the same cache and count towards the same budget.
+        compute_domain_cache_max_bytes: Optional[int] = kwargs.pop(
+            "compute_domain_cache_max_bytes", None
+        )
+        if compute_domain_cache_max_bytes is None:
+            self._compute_domain_cache_max_bytes = (
+                DEFAULT_COMPUTE_DOMAIN_CACHE_MAX_BYTES
+            )
+        else:
+            self._compute_domain_cache_max_bytes = compute_domain_cache_max_bytes
+        self._compute_domain_cache = OrderedDict()
+        self._compute_domain_cache_bytes = 0
+        self._compute_domain_cache_hits = 0
+        self._compute_domain_cache_misses = 0
+        self._compute_domain_cache_lock = threading.Lock()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -94,11 +133,20 @@ Notes:
                 "boto3_options": boto3_options,
             }
         )
+        if compute_domain_cache_max_bytes is not None:
+            self._config[
+                "compute_domain_cache_max_bytes"
+            ] = compute_domain_cache_max_bytes
 
     def configure_validator(self, validator):
         super().configure_validator(validator)
         validator.expose_dataframe_methods = True
 
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        # Metric functions only read from the loaded DataFrames, and most pandas/numpy kernels release the GIL.
+        return True
+
     def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
@@ -108,8 +156,314 @@ Notes:
             raise GreatExpectationsError(
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
+        self._clear_compute_domain_cache(batch_id)
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def _get_metric_batch_id(self, metric: MetricConfiguration) -> Optional[str]:
+        return metric.metric_domain_kwargs.get("batch_id") or self.active_batch_data_id
+
+    def _is_chunked_metric(self, metric: MetricConfiguration) -> bool:
+        return isinstance(
+            self.loaded_batch_data_dict.get(self._get_metric_batch_id(metric)),
+            ChunkedPandasBatchData,
+        )
+
+    def check_metric_support(self, metric: MetricConfiguration) -> None:
+        """Raises an ExecutionEngineError if metric refers to a chunked batch but cannot be computed chunk by chunk:
+        map metrics whose condition on a row depends on other rows, and metrics whose values on each chunk cannot be
+        merged (see great_expectations.execution_engine.chunked_metrics)."""
+        if not self._is_chunked_metric(metric):
+            return
+
+        _, metric_fn = get_metric_provider(metric.metric_name, execution_engine=self)
+        metric_fn_type = getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+        if metric_fn_type in [
+            MetricPartialFunctionTypes.MAP_FN,
+            MetricPartialFunctionTypes.MAP_SERIES,
+            MetricPartialFunctionTypes.MAP_CONDITION_FN,
+            MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+        ]:
+            map_metric_name = metric.metric_name.rsplit(".", 1)[0]
+            if map_metric_name not in CHUNK_UNSAFE_MAP_METRICS:
+                return
+        elif metric_fn_type == MetricFunctionTypes.VALUE:
+            merge = get_chunked_metric_merge(metric.metric_name)
+            if merge is not None and merge.supports(metric):
+                return
+
+        raise ge_exceptions.ExecutionEngineError(
+            f'Metric "{metric.metric_name}" cannot be computed on a batch that is read in chunks, because its value '
+            f"depends on all of the rows of the batch at once. Load the batch without a chunk_size to validate it."
+        )
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+        executor: Optional[Executor] = None,
+    ) -> dict:
+        """Resolves metrics as ExecutionEngine.resolve_metrics does, except for those on chunked batches.
+
+        The map functions and conditions of chunked batches are not computed when they are resolved, but on each chunk
+        by the metrics that depend on them. All of the other metrics of chunked batches are computed together, in one
+        pass over each batch, and their values on each chunk are merged.
+        """
+        if metrics is None:
+            metrics = dict()
+
+        chunked_metrics = []
+        unchunked_metrics = []
+        for metric_to_resolve in metrics_to_resolve:
+            if self._is_chunked_metric(metric_to_resolve):
+                chunked_metrics.append(metric_to_resolve)
+            else:
+                unchunked_metrics.append(metric_to_resolve)
+
+        resolved_metrics = super().resolve_metrics(
+            metrics_to_resolve=unchunked_metrics,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+            executor=executor,
+        )
+        if len(chunked_metrics) > 0:
+            resolved_metrics.update(
+                self._resolve_chunked_metrics(
+                    chunked_metrics, metrics, runtime_configuration
+                )
+            )
+        return resolved_metrics
+
+    def _resolve_chunked_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict],
+    ) -> dict:
+        resolved_metrics = dict()
+        # Metrics to compute on every chunk, grouped by batch
+        batch_metrics = dict()
+        for metric_to_resolve in metrics_to_resolve:
+            self.check_metric_support(metric_to_resolve)
+            _, metric_fn = get_metric_provider(
+                metric_to_resolve.metric_name, execution_engine=self
+            )
+            if (
+                getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+                != MetricFunctionTypes.VALUE
+            ):
+                resolved_metrics[metric_to_resolve.id] = _ChunkLocalMetric(
+                    metric_to_resolve
+                )
+                continue
+
+            batch_fingerprint = self._get_batch_fingerprint(metric_to_resolve)
+            if self._metric_cache is not None:
+                found, value = self._metric_cache.get(
+                    batch_fingerprint, metric_to_resolve.id
+                )
+                if found:
+                    resolved_metrics[metric_to_resolve.id] = value
+                    continue
+            if get_chunked_metric_merge(metric_to_resolve.metric_name).derived:
+                value, latency = self._timed_metric_fn_call(
+                    self._resolve_chunk_metric,
+                    {
+                        "metric": metric_to_resolve,
+                        "metrics": metrics,
+                        "chunk_metrics": dict(),
+                        "runtime_configuration": runtime_configuration,
+                    },
+                )
+                resolved_metrics[metric_to_resolve.id] = value
+                if self._metric_cache is not None:
+                    self._metric_cache.set(
+                        batch_fingerprint, metric_to_resolve.id, value, latency=latency
+                    )
+            else:
+                batch_metrics.setdefault(
+                    self._get_metric_batch_id(metric_to_resolve), []
+                ).append(metric_to_resolve)
+
+        for batch_id, pass_metrics in batch_metrics.items():
+            start = time.perf_counter()
+            batch_values = self._resolve_metrics_over_chunks(
+                batch_id, pass_metrics, metrics, runtime_configuration
+            )
+            # Every metric of the pass is charged an equal share of the time spent reading the batch.
+            latency = (time.perf_counter() - start) / len(pass_metrics)
+            for metric in pass_metrics:
+                if self._metric_cache is not None:
+                    self._metric_cache.set(
+                        self._get_batch_fingerprint(metric),
+                        metric.id,
+                        batch_values[metric.id],
+                        latency=latency,
+                    )
+            resolved_metrics.update(batch_values)
+
+        return resolved_metrics
+
+    def _resolve_metrics_over_chunks(
+        self,
+        batch_id: str,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict],
+    ) -> dict:
+        """Computes metrics on each chunk of a chunked batch in turn, folding their partial states together as the
+        chunks are read, and returns their merged values."""
+        batch_data: ChunkedPandasBatchData = self.loaded_batch_data_dict[batch_id]
+        merges = {
+            metric.id: get_chunked_metric_merge(metric.metric_name)
+            for metric in metrics_to_resolve
+        }
+        states = dict()
+        done_metric_ids = set()
+        num_chunks = 0
+        try:
+            for _ in batch_data.iter_chunks():
+                num_chunks += 1
+                self._clear_compute_domain_cache(batch_id)
+                # Map functions and conditions computed on this chunk, shared by the metrics that depend on them
+                chunk_metrics = dict()
+                for metric in metrics_to_resolve:
+                    if metric.id in done_metric_ids:
+                        continue
+                    merge = merges[metric.id]
+                    metric_value_kwargs = None
+                    if merge.complete_result_format:
+                        metric_value_kwargs = {
+                            **metric.metric_value_kwargs,
+                            "result_format": {
+                                **metric.metric_value_kwargs["result_format"],
+                                "result_format": "COMPLETE",
+                            },
+                        }
+                    value = self._resolve_chunk_metric(
+                        metric,
+                        metrics,
+                        chunk_metrics,
+                        runtime_configuration,
+                        metric_value_kwargs=metric_value_kwargs,
+                    )
+                    state = merge.partial(self, metric, value)
+                    if metric.id in states:
+                        state = merge.combine(states[metric.id], state, metric)
+                    states[metric.id] = state
+                    if merge.done(state, metric):
+                        done_metric_ids.add(metric.id)
+                if len(done_metric_ids) == len(metrics_to_resolve):
+                    break
+        finally:
+            self._clear_compute_domain_cache(batch_id)
+
+        if num_chunks == 0:
+            raise ge_exceptions.ExecutionEngineError(
+                f"Chunked batch {batch_id} has no rows from which to compute metrics."
+            )
+        logger.debug(
+            f"Resolved {len(metrics_to_resolve)} metrics over {num_chunks} chunks of batch {batch_id}."
+        )
+        return {
+            metric.id: merges[metric.id].finalize(states[metric.id], metric)
+            for metric in metrics_to_resolve
+        }
+
+    def _resolve_chunk_metric(
+        self,
+        metric: MetricConfiguration,
+        metrics: Dict[Tuple, Any],
+        chunk_metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict],
+        metric_value_kwargs: Optional[dict] = None,
+    ) -> Any:
+        """Computes metric on the chunk currently loaded, computing the map functions and conditions it depends on
+        first."""
+        metric_class, metric_fn = get_metric_provider(
+            metric.metric_name, execution_engine=self
+        )
+        metric_dependencies = dict()
+        for key, dependency in metric.metric_dependencies.items():
+            try:
+                value = metrics[dependency.id]
+            except KeyError as e:
+                raise GreatExpectationsError(f"Missing metric dependency: {str(e)}")
+            if isinstance(value, _ChunkLocalMetric):
+                if dependency.id not in chunk_metrics:
+                    chunk_metrics[dependency.id] = self._resolve_chunk_metric(
+                        value.metric, metrics, chunk_metrics, runtime_configuration
+                    )
+                value = chunk_metrics[dependency.id]
+            metric_dependencies[key] = value
+        return metric_fn(
+            cls=metric_class,
+            execution_engine=self,
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs or metric.metric_value_kwargs,
+            metrics=metric_dependencies,
+            runtime_configuration=runtime_configuration,
+        )
+
+    @property
+    def compute_domain_cache_stats(self) -> dict:
+        """Hit/miss statistics and current size of the cache of DataFrames filtered by a row_condition."""
+        with self._compute_domain_cache_lock:
+            return {
+                "hits": self._compute_domain_cache_hits,
+                "misses": self._compute_domain_cache_misses,
+                "entries": len(self._compute_domain_cache),
+                "bytes": self._compute_domain_cache_bytes,
+                "max_bytes": self._compute_domain_cache_max_bytes,
+            }
+
+    def _clear_compute_domain_cache(self, batch_id: str) -> None:
+        with self._compute_domain_cache_lock:
+            for key in [
+                key for key in self._compute_domain_cache if key[0] == batch_id
+            ]:
+                _, nbytes = self._compute_domain_cache.pop(key)
+                self._compute_domain_cache_bytes -= nbytes
+
+    def _add_to_compute_domain_cache(self, key: tuple, value, nbytes: int) -> None:
+        """Adds a value to the compute domain cache, evicting the least recently used values beyond its budget."""
+        if nbytes > self._compute_domain_cache_max_bytes:
+            return
+        with self._compute_domain_cache_lock:
+            if key not in self._compute_domain_cache:
+                self._compute_domain_cache[key] = (value, nbytes)
+                self._compute_domain_cache_bytes += nbytes
+            while (
+                self._compute_domain_cache_bytes > self._compute_domain_cache_max_bytes
+            ):
+                _, (_, evicted_nbytes) = self._compute_domain_cache.popitem(last=False)
+                self._compute_domain_cache_bytes -= evicted_nbytes
+
+    def _get_row_condition_data(
+        self,
+        batch_id: str,
+        data: pd.DataFrame,
+        row_condition: str,
+        condition_parser: str,
+    ) -> pd.DataFrame:
+        """Returns the rows of data matching row_condition, reusing the result of a previous query on the same batch
+        if it is still in the compute domain cache."""
+        key = (batch_id, row_condition, condition_parser)
+        with self._compute_domain_cache_lock:
+            cached = self._compute_domain_cache.get(key)
+            if cached is not None:
+                self._compute_domain_cache.move_to_end(key)
+                self._compute_domain_cache_hits += 1
+                return cached[0]
+            self._compute_domain_cache_misses += 1
+
+        data = data.query(row_condition, parser=condition_parser).reset_index(drop=True)
+
+        self._add_to_compute_domain_cache(
+            key, data, int(data.memory_usage(deep=False).sum())
+        )
+        return data
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -123,6 +477,9 @@ Notes:
         )
 
         batch_data: PandasBatchData
+        source_columns: Optional[List[str]] = None
+        # If the batch_spec sets a chunk_size, files are read chunk_size rows at a time rather than all at once.
+        chunk_size: Optional[int] = batch_spec.get("chunk_size")
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
             if isinstance(batch_spec.batch_data, pd.DataFrame):
@@ -153,14 +510,74 @@ Notes:
                 )
             )
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            if chunk_size is not None and self._is_csv_reader(
+                reader_method, s3_url.key
+            ):
+                # Text sources are streamed from S3 rather than downloaded, so that they need not fit in memory.
+                s3_object["Body"].close()
+
+                def open_source():
+                    return s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)[
+                        "Body"
+                    ]
+
+            else:
+                buf = BytesIO(s3_object["Body"].read())
+
+                def open_source():
+                    buf.seek(0)
+                    return buf
+
+            if batch_spec.get("column_projection") is not None:
+                reader_options, source_columns = self._project_reader_options(
+                    reader_fn=reader_fn,
+                    source=open_source(),
+                    reader_method=reader_method,
+                    path=s3_url.key,
+                    reader_options=reader_options,
+                    column_projection=batch_spec["column_projection"],
+                )
+            if chunk_size is not None:
+                return (
+                    self._get_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        reader_fn=reader_fn,
+                        reader_method=reader_method,
+                        path=s3_url.key,
+                        open_source=open_source,
+                        reader_options=reader_options,
+                        source_columns=source_columns,
+                    ),
+                    batch_markers,
+                )
+            df = reader_fn(open_source(), **reader_options)
         elif isinstance(batch_spec, PathBatchSpec):
             reader_method: str = batch_spec.reader_method
             reader_options: dict = batch_spec.reader_options
             path: str = batch_spec.path
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
+            if batch_spec.get("column_projection") is not None:
+                reader_options, source_columns = self._project_reader_options(
+                    reader_fn=reader_fn,
+                    source=path,
+                    reader_method=reader_method,
+                    path=path,
+                    reader_options=reader_options,
+                    column_projection=batch_spec["column_projection"],
+                )
+            if chunk_size is not None:
+                return (
+                    self._get_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        reader_fn=reader_fn,
+                        reader_method=reader_method,
+                        path=path,
+                        open_source=lambda: path,
+                        reader_options=reader_options,
+                        source_columns=source_columns,
+                    ),
+                    batch_markers,
+                )
             df = reader_fn(path, **reader_options)
         else:
             raise BatchSpecError(
@@ -171,10 +588,158 @@ Notes:
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
 
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        typed_batch_data = PandasBatchData(
+            execution_engine=self, dataframe=df, source_columns=source_columns
+        )
 
         return typed_batch_data, batch_markers
 
+    def _project_reader_options(
+        self,
+        reader_fn: Callable,
+        source,
+        reader_method: Optional[str],
+        path: str,
+        reader_options: dict,
+        column_projection: List[str],
+    ) -> Tuple[dict, Optional[List[str]]]:
+        """Restrict a reader to the columns in column_projection, using the file's metadata to find its columns.
+
+        Columns in column_projection that are missing from the source are ignored, and the first column of the source is
+        kept if none of them are present, so that the batch keeps its rows. Projection is only supported for the csv,
+        table and parquet readers, and is skipped when reader_options already select columns.
+
+        Returns:
+            A tuple of the reader options to use and the columns of the source, or of the unchanged reader options and
+            None if the batch should not be projected
+        """
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+
+        if reader_method in ("read_csv", "read_table"):
+            if any(
+                option in reader_options
+                for option in ("usecols", "index_col", "chunksize", "iterator")
+            ):
+                return reader_options, None
+            projection_option = "usecols"
+            source_columns = list(
+                reader_fn(source, **{**reader_options, "nrows": 0}).columns
+            )
+        elif reader_method == "read_parquet":
+            if "columns" in reader_options:
+                return reader_options, None
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                logger.debug(
+                    "Unable to read parquet metadata without pyarrow; skipping column projection."
+                )
+                return reader_options, None
+            projection_option = "columns"
+            source_columns = [
+                name
+                for name in pq.ParquetFile(source).schema_arrow.names
+                if not name.startswith("__index_level_")
+            ]
+        else:
+            return reader_options, None
+
+        column_projection = set(column_projection)
+        projected_columns = [
+            column for column in source_columns if column in column_projection
+        ] or source_columns[:1]
+        if len(projected_columns) == len(source_columns):
+            return reader_options, None
+
+        logger.debug(
+            f"Loading {len(projected_columns)} of {len(source_columns)} columns from {path}."
+        )
+        return (
+            {**reader_options, projection_option: projected_columns},
+            source_columns,
+        )
+
+    def _is_csv_reader(self, reader_method: Optional[str], path: str) -> bool:
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+        return reader_method in ("read_csv", "read_table")
+
+    def _get_chunked_batch_data(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: Callable,
+        reader_method: Optional[str],
+        path: str,
+        open_source: Callable,
+        reader_options: dict,
+        source_columns: Optional[List[str]],
+    ) -> ChunkedPandasBatchData:
+        """Returns batch data that reads the source chunk_size rows at a time, each time its metrics are resolved.
+
+        Chunks are read with the chunksize option of the csv and table readers, and from the record batches of parquet
+        files. The splitter and sampling methods of batch_spec are applied to each chunk; since they select rows
+        independently of each other, the union of the chunks is the batch that would have been loaded at once.
+
+        Args:
+            open_source: returns a path or file-like object from which to read the source, from its beginning
+        """
+        chunk_size: int = batch_spec["chunk_size"]
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise BatchSpecError(
+                f"chunk_size must be a positive number of rows, not {chunk_size}."
+            )
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+
+        if reader_method in ("read_csv", "read_table"):
+
+            def read_chunks():
+                reader = reader_fn(
+                    open_source(), chunksize=chunk_size, **reader_options
+                )
+                try:
+                    yield from reader
+                finally:
+                    reader.close()
+
+        elif reader_method == "read_parquet":
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise BatchSpecError(
+                    "Reading parquet files in chunks requires pyarrow."
+                )
+
+            def read_chunks():
+                parquet_file = pq.ParquetFile(open_source())
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=chunk_size, columns=reader_options.get("columns")
+                ):
+                    yield record_batch.to_pandas()
+
+        else:
+            raise BatchSpecError(
+                f'chunk_size is only supported for the csv, table and parquet readers, not "{reader_method}".'
+            )
+
+        def read_batch_chunks():
+            offset = 0
+            for chunk in read_chunks():
+                # Number the rows of every chunk from the position of its first row in the source
+                if isinstance(chunk.index, pd.RangeIndex):
+                    chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield self._apply_splitting_and_sampling_methods(batch_spec, chunk)
+
+        logger.debug(f"Reading {path} in chunks of {chunk_size} rows.")
+        return ChunkedPandasBatchData(
+            execution_engine=self,
+            chunk_reader=read_batch_chunks,
+            chunk_size=chunk_size,
+            source_columns=source_columns,
+        )
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         if batch_spec.get("splitter_method"):
             splitter_fn = getattr(self, batch_spec.get("splitter_method"))
@@ -300,6 +865,7 @@ Notes:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ValidationError(
@@ -311,7 +877,7 @@ Notes:
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        compute_domain_kwargs = copy.deepcopy(domain_kwargs)
+        compute_domain_kwargs = dict(domain_kwargs)
         accessor_domain_kwargs = dict()
         table = domain_kwargs.get("table", None)
         if table:
@@ -332,8 +898,8 @@ Notes:
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
+                data = self._get_row_condition_data(
+                    batch_id, data, row_condition, condition_parser
                 )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
@@ -427,6 +993,101 @@ Notes:
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _get_column_domain(
+        self, domain_kwargs: dict, filter_column_isnull: bool
+    ) -> Tuple[pd.DataFrame, Optional[np.ndarray], dict, dict]:
+        """Returns the compute domain for a column domain, together with the positions of the rows in which the column
+        is not null (None if no rows are filtered out). The positions are kept in the compute domain cache, so that
+        the null mask is usually evaluated only once for all of the map metrics on the same column.
+        """
+        data, compute_domain_kwargs, accessor_domain_kwargs = self.get_compute_domain(
+            domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+
+        nonnull_positions = None
+        if filter_column_isnull:
+            positions_key = (
+                domain_kwargs.get("batch_id") or self.active_batch_data_id,
+                "nonnull_positions",
+                IDDict(compute_domain_kwargs).to_id(),
+                accessor_domain_kwargs["column"],
+            )
+            with self._compute_domain_cache_lock:
+                cached = self._compute_domain_cache.get(positions_key)
+                if cached is not None:
+                    self._compute_domain_cache.move_to_end(positions_key)
+            if cached is not None:
+                nonnull_positions = cached[0]
+            else:
+                nonnull = data[accessor_domain_kwargs["column"]].notnull().values
+                if not nonnull.all():
+                    nonnull_positions = np.flatnonzero(nonnull)
+                self._add_to_compute_domain_cache(
+                    positions_key,
+                    nonnull_positions,
+                    0 if nonnull_positions is None else nonnull_positions.nbytes,
+                )
+
+        return data, nonnull_positions, compute_domain_kwargs, accessor_domain_kwargs
+
+    @staticmethod
+    def _get_row_positions(
+        nonnull_positions: Optional[np.ndarray], positions: Optional[np.ndarray]
+    ) -> Optional[np.ndarray]:
+        if nonnull_positions is None:
+            return positions
+        if positions is None:
+            return nonnull_positions
+        return nonnull_positions[positions]
+
+    def get_column_domain_values(
+        self,
+        domain_kwargs: dict,
+        filter_column_isnull: bool = False,
+        positions: Optional[np.ndarray] = None,
+    ) -> Tuple[pd.Series, dict, dict]:
+        """Returns the values of the column described by a column domain, without re-applying the row_condition or
+        the null filter if another metric has already requested the same domain in this batch.
+
+        Args:
+            domain_kwargs (dict) - the domain kwargs of the column domain
+            filter_column_isnull (bool) - whether rows in which the column is null are excluded
+            positions (array of int) - if provided, only the values at these positions of the (filtered) column
+
+        Returns:
+            A tuple including:
+              - a Series of column values, indexed like the compute domain
+              - a dictionary of compute_domain_kwargs
+              - a dictionary of accessor_domain_kwargs
+        """
+        (
+            data,
+            nonnull_positions,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = self._get_column_domain(domain_kwargs, filter_column_isnull)
+        values = data[accessor_domain_kwargs["column"]]
+        row_positions = self._get_row_positions(nonnull_positions, positions)
+        if row_positions is not None:
+            values = values.iloc[row_positions]
+        return values, compute_domain_kwargs, accessor_domain_kwargs
+
+    def get_column_domain_rows(
+        self,
+        domain_kwargs: dict,
+        filter_column_isnull: bool = False,
+        positions: Optional[np.ndarray] = None,
+    ) -> pd.DataFrame:
+        """Returns the rows of the compute domain (ignoring the column constraint) at the given positions of the
+        values returned by get_column_domain_values for the same arguments."""
+        data, nonnull_positions, _, _ = self._get_column_domain(
+            domain_kwargs, filter_column_isnull
+        )
+        row_positions = self._get_row_positions(nonnull_positions, positions)
+        if row_positions is not None:
+            data = data.iloc[row_positions]
+        return data
+
     ### Splitter methods for partitioning dataframes ###
     @staticmethod
     def _split_on_whole_table(
@@ -467,9 +1128,12 @@ Notes:
         """Divide the values in the named column by `divisor`, and split on that"""
 
         matching_divisor = partition_definition[column_name]
-        matching_rows = df[column_name].map(
-            lambda x: int(x / divisor) == matching_divisor
-        )
+        if pd.api.types.is_numeric_dtype(df[column_name]):
+            matching_rows = np.trunc(df[column_name] / divisor) == matching_divisor
+        else:
+            matching_rows = df[column_name].map(
+                lambda x: int(x / divisor) == matching_divisor
+            )
 
         return df[matching_rows]
 
@@ -483,7 +1147,10 @@ Notes:
         """Divide the values in the named column by `divisor`, and split on that"""
 
         matching_mod_value = partition_definition[column_name]
-        matching_rows = df[column_name].map(lambda x: x % mod == matching_mod_value)
+        if pd.api.types.is_numeric_dtype(df[column_name]):
+            matching_rows = df[column_name] % mod == matching_mod_value
+        else:
+            matching_rows = df[column_name].map(lambda x: x % mod == matching_mod_value)
 
         return df[matching_rows]
 
@@ -542,7 +1209,7 @@ Notes:
 
         Note: the Random function behaves differently on different dialects of SQL
         """
-        return df[df.index.map(lambda x: random.random() < p)]
+        return df[_random_values(len(df)) < p]
 
     @staticmethod
     def _sample_using_mod(
@@ -552,6 +1219,8 @@ Notes:
         value: int,
     ):
         """Take the mod of named column, and only keep rows that match the given value"""
+        if pd.api.types.is_numeric_dtype(df[column_name]):
+            return df[df[column_name] % mod == value]
         return df[df[column_name].map(lambda x: x % mod == value)]
 
     @staticmethod
@@ -589,6 +1258,34 @@ Notes:
         return df[matches]
 
 
+class _ChunkLocalMetric:
+    """Stands for the value of a map function or condition on a chunked batch, which only exists for one chunk at a
+    time and is computed on each chunk by the metrics that depend on it."""
+
+    def __init__(self, metric: MetricConfiguration):
+        self.metric = metric
+
+
+def _random_values(size: int) -> np.ndarray:
+    """Returns the next `size` values of random.random(), drawn at once by numpy.
+
+    numpy's legacy RandomState uses the same Mersenne Twister and the same conversion to floats as the random module,
+    so sampling stays reproducible with random.seed and leaves the random module in the same state as drawing the
+    values one by one would.
+    """
+    version, internal_state, gauss_next = random.getstate()
+    random_state = np.random.RandomState()
+    random_state.set_state(
+        ("MT19937", np.array(internal_state[:-1], dtype=np.uint32), internal_state[-1])
+    )
+    values = random_state.random_sample(size)
+    _, keys, pos, _, _ = random_state.get_state()
+    random.setstate(
+        (version, tuple(int(key) for key in keys) + (int(pos),), gauss_next)
+    )
+    return values
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
@@ -2,10 +2,16 @@ from great_expectations.execution_engine.execution_engine import BatchData
 
 
 class SparkDFBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe):
+    def __init__(self, execution_engine, dataframe, source_columns=None):
         super().__init__(execution_engine)
         self._dataframe = dataframe
+        self._source_columns = source_columns
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def source_columns(self):
+        """The columns of the source, if the batch was loaded with a column projection; otherwise None."""
+        return self._source_columns
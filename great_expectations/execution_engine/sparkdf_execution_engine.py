@@ -178,6 +178,11 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return self.active_batch_data.dataframe
 
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        # A SparkSession accepts jobs from multiple threads; the scheduler runs them side by side.
+        return True
+
     def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
         if isinstance(batch_data, DataFrame):
             batch_data = SparkDFBatchData(self, batch_data)
@@ -203,6 +208,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
             }
         )
 
+        source_columns = None
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
             batch_data = batch_spec.batch_data
@@ -225,6 +231,19 @@ class SparkDFExecutionEngine(ExecutionEngine):
                     Unable to load pyspark. Pyspark is required for SparkDFExecutionEngine.
                     """
                 )
+            if batch_spec.get("column_projection") is not None:
+                # the reader only resolves the schema; selecting lets Spark prune the unused columns when it scans
+                source_columns = batch_data.columns
+                column_projection = set(batch_spec["column_projection"])
+                projected_columns = [
+                    column for column in source_columns if column in column_projection
+                ] or source_columns[:1]
+                if len(projected_columns) < len(source_columns):
+                    batch_data = batch_data.select(
+                        *[f"`{column}`" for column in projected_columns]
+                    )
+                else:
+                    source_columns = None
         else:
             raise BatchSpecError(
                 """
@@ -233,7 +252,9 @@ class SparkDFExecutionEngine(ExecutionEngine):
             )
 
         batch_data = self._apply_splitting_and_sampling_methods(batch_spec, batch_data)
-        typed_batch_data = SparkDFBatchData(execution_engine=self, dataframe=batch_data)
+        typed_batch_data = SparkDFBatchData(
+            execution_engine=self, dataframe=batch_data, source_columns=source_columns
+        )
 
         return typed_batch_data, batch_markers
 
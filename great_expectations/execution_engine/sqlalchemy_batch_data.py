@@ -1,7 +1,11 @@
 import logging
 import uuid
+from typing import List, Optional
 
 from great_expectations.execution_engine.execution_engine import BatchData
+from great_expectations.execution_engine.sqlalchemy_temp_tables import (
+    SqlAlchemyTempTableManager,
+)
 
 try:
     import sqlalchemy as sa
@@ -36,6 +40,7 @@ class SqlAlchemyBatchData(BatchData):
         use_quoted_name: bool = False,
         source_table_name: str = None,
         source_schema_name: str = None,
+        temp_table_index_columns: List[str] = None,
     ):
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -72,6 +77,8 @@ class SqlAlchemyBatchData(BatchData):
                 source_schema_name (str): \
                     For SqlAlchemyBatchData based on selectables, source_schema_name provides the name of the schema on which
                     the selectable is based. This is required for most kinds of table introspection (e.g. looking up column types)
+                temp_table_index_columns (list or None): \
+                    Columns to index in the temporary table, typically those that row_conditions filter on.
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -96,6 +103,8 @@ class SqlAlchemyBatchData(BatchData):
 
         self._schema_name = schema_name
         self._use_quoted_name = use_quoted_name
+        self._uses_session_temp_table = False
+        self._connection = None
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
 
@@ -131,30 +140,71 @@ class SqlAlchemyBatchData(BatchData):
                 )
 
         elif create_temp_table:
-            if temp_table_name:
-                generated_table_name = temp_table_name
-            else:
-                # Suggestion: Pull this into a separate "_generate_temporary_table_name" method
-                generated_table_name = f"ge_tmp_{str(uuid.uuid4())[:8]}"
-                # mssql expects all temporary table names to have a prefix '#'
-                if engine.dialect.name.lower() == "mssql":
-                    generated_table_name = f"#{generated_table_name}"
-                if engine.dialect.name.lower() == "bigquery":
-                    raise ValueError(
-                        "No BigQuery dataset specified.  Include bigquery_temp_table in "
-                        "batch_spec_passthrough or a specify a default dataset in engine url"
-                    )
             if selectable is not None:
                 # compile selectable to sql statement
                 query = selectable.compile(
                     dialect=self.sql_engine_dialect,
                     compile_kwargs={"literal_binds": True},
                 )
-            self._create_temporary_table(
-                generated_table_name,
+            # BigQuery "temporary" tables are regular tables; everywhere else they are only visible to the
+            # connection that created them.
+            self._uses_session_temp_table = engine.dialect.name.lower() != "bigquery"
+
+            # Reuse the temporary table of an identical query, if the execution engine still has one, through the
+            # connection that created it
+            temp_table_manager = getattr(execution_engine, "temp_table_manager", None)
+            query_key = SqlAlchemyTempTableManager.get_query_key(
                 query,
+                temp_table_name=temp_table_name,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            generated_table_name = None
+            if temp_table_manager is not None:
+                generated_table_name, self._connection = temp_table_manager.acquire(
+                    query_key, owner=self
+                )
+
+            if generated_table_name is None:
+                if self._uses_session_temp_table and hasattr(
+                    execution_engine, "get_session_connection"
+                ):
+                    # Bind the batch to the connection that will see its temporary table
+                    self._connection = execution_engine.get_session_connection()
+                if self._connection is not None:
+                    self._engine = self._connection
+
+                if temp_table_name:
+                    generated_table_name = temp_table_name
+                else:
+                    # Suggestion: Pull this into a separate "_generate_temporary_table_name" method
+                    generated_table_name = f"ge_tmp_{str(uuid.uuid4())[:8]}"
+                    # mssql expects all temporary table names to have a prefix '#'
+                    if engine.dialect.name.lower() == "mssql":
+                        generated_table_name = f"#{generated_table_name}"
+                    if engine.dialect.name.lower() == "bigquery":
+                        raise ValueError(
+                            "No BigQuery dataset specified.  Include bigquery_temp_table in "
+                            "batch_spec_passthrough or a specify a default dataset in engine url"
+                        )
+                self._create_temporary_table(
+                    generated_table_name,
+                    query,
+                    temp_table_schema_name=temp_table_schema_name,
+                )
+                if temp_table_manager is not None:
+                    # Session temporary tables can only be reused through the connection that created them
+                    temp_table_manager.register(
+                        query_key,
+                        generated_table_name,
+                        owner=self,
+                        temp_table_schema_name=temp_table_schema_name,
+                        reusable=not self._uses_session_temp_table
+                        or isinstance(self._engine, sa.engine.Connection),
+                        index_columns=temp_table_index_columns,
+                        connection=self._connection,
+                    )
+            elif self._connection is not None:
+                self._engine = self._connection
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -191,6 +241,17 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def connection(self) -> Optional["sa.engine.Connection"]:
+        """The connection that the batch is bound to, if its temporary table is only visible to that connection and the
+        execution engine does not already run all of its queries on a single connection."""
+        return self._connection
+
+    @property
+    def uses_session_temp_table(self) -> bool:
+        """True if the batch is backed by a temporary table that only the creating connection can see."""
+        return self._uses_session_temp_table
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ):
@@ -1,12 +1,22 @@
 import copy
 import datetime
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+import pandas as pd
+
 from great_expectations.core import IDDict
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.sqlalchemy_engine_registry import get_sqlalchemy_engine
+from great_expectations.core.sqlalchemy_schema_cache import (
+    DEFAULT_SCHEMA_CACHE_TTL,
+    SqlAlchemySchemaCache,
+)
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.exceptions import (
     DatasourceKeyPairAuthBadPassphraseError,
@@ -18,6 +28,9 @@ from great_expectations.execution_engine.execution_engine import MetricDomainTyp
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_temp_tables import (
+    SqlAlchemyTempTableManager,
+)
 from great_expectations.expectations.row_conditions import parse_condition_to_sqlalchemy
 from great_expectations.util import filter_properties_dict, import_library_module
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -121,6 +134,104 @@ def _get_dialect_type_module(dialect):
     return dialect
 
 
+# Aggregate functions that ignore NULL inputs, so that a row condition can be moved inside them
+_NULL_IGNORING_AGGREGATE_FUNCTIONS = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "stdev",
+    "stdevp",
+    "sum",
+    "var",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+# Scalar functions that may be applied to aggregate results in a fused query
+_SCALAR_FUNCTIONS = {"abs", "coalesce", "nullif", "round", "sqrt"}
+
+
+def _push_condition_into_aggregates(
+    expression: "sa.sql.expression.ColumnElement",
+    condition: "sa.sql.expression.ColumnElement",
+    use_filter_clause: bool = False,
+) -> Optional["sa.sql.expression.ColumnElement"]:
+    """Rewrite an aggregate expression so that each aggregate function only considers rows matching condition.
+
+    Returns None if the expression cannot be safely rewritten, e.g. because it contains a subquery or a function that
+    is not known to be either a NULL-ignoring aggregate or a scalar function.
+    """
+    for element in sa.sql.visitors.iterate(expression, {}):
+        # (functions are FromClauses too, since they can be selected from)
+        if isinstance(
+            element, (sa.sql.expression.SelectBase, sa.sql.FromClause)
+        ) and not isinstance(element, sa.sql.functions.FunctionElement):
+            return None
+
+    found_aggregate = False
+    unknown_function = False
+
+    def _filtered_aggregate(element):
+        nonlocal found_aggregate, unknown_function
+        if not isinstance(element, sa.sql.functions.FunctionElement):
+            return None
+        name = element.name.lower()
+        if name in _SCALAR_FUNCTIONS:
+            return None
+        if name not in _NULL_IGNORING_AGGREGATE_FUNCTIONS:
+            unknown_function = True
+            return element
+
+        found_aggregate = True
+        if use_filter_clause:
+            return element.filter(condition)
+        filtered_arguments = []
+        for argument in element.clauses:
+            if getattr(argument, "is_literal", False) and argument.name == "*":
+                # count(*) becomes count(CASE WHEN <condition> THEN 1 END)
+                filtered_arguments.append(
+                    sa.case([(condition, sa.literal_column("1"))])
+                )
+            elif (
+                isinstance(argument, sa.sql.expression.UnaryExpression)
+                and argument.operator is sa.sql.operators.distinct_op
+            ):
+                filtered_arguments.append(
+                    sa.distinct(sa.case([(condition, argument.element)]))
+                )
+            else:
+                filtered_arguments.append(sa.case([(condition, argument)]))
+        return getattr(sa.func, element.name)(*filtered_arguments, type_=element.type)
+
+    rewritten = sa.sql.visitors.replacement_traverse(
+        expression, {}, _filtered_aggregate
+    )
+    if unknown_function or not found_aggregate:
+        return None
+    return rewritten
+
+
+class GroupedValueCounts:
+    """A partial function counting the rows of each distinct, non-null value of a column, as returned by the
+    aggregate_fn of column.value_counts.
+
+    SqlAlchemyExecutionEngine.resolve_metric_bundle computes the value counts of all of the columns of a domain that are
+    sorted the same way with a single grouped query; the value of the metric is a pandas Series of counts indexed by
+    value.
+    """
+
+    def __init__(
+        self, column_name: str, sort: str = "value", collate: Optional[str] = None
+    ):
+        self.column_name = column_name
+        self.sort = sort
+        self.collate = collate
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     def __init__(
         self,
@@ -132,6 +243,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url=None,
         batch_data_dict=None,
         create_temp_table=True,
+        max_concurrent_queries=None,
+        fuse_filtered_domains=True,
+        temp_table_ttl=None,
+        analyze_temp_tables=None,
+        temp_table_index_columns=None,
+        max_session_connections=1,
+        schema_cache_ttl=None,
+        schema_cache_path=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -158,6 +277,39 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                max_concurrent_queries (int): \
+                    The maximum number of bundled metric queries (one per compute domain) to run at the same time,
+                    each on its own pooled connection. By default, queries run one after another.
+                fuse_filtered_domains (bool): \
+                    If True (the default), bundled aggregate metrics whose compute domains differ only in their
+                    row_condition are computed in a single query over the unfiltered domain, with each condition moved
+                    inside the aggregate functions (as CASE WHEN, or FILTER (WHERE ...) on PostgreSQL).
+                temp_table_ttl (float): \
+                    The number of seconds during which the temporary table of a batch is reused by later batches with
+                    the same query (e.g. repeated checkpoint runs on the same partition), instead of being created
+                    again. By default, temporary tables are not reused, and are dropped when their batch is unloaded.
+                analyze_temp_tables (bool): \
+                    If True, collect statistics on each temporary table after it is created.
+                temp_table_index_columns (list): \
+                    Columns to index in every temporary table, typically those that row_conditions filter on.
+                max_session_connections (int): \
+                    The number of connections that batches backed by temporary tables (which only the connection that
+                    created them can see) are spread over, in each thread that loads batches. Each such batch is bound
+                    to one of the connections of the thread that loads it, and its metrics are computed on it; other
+                    work uses the connection pool.
+                schema_cache_ttl (float): \
+                    The number of seconds for which the metadata reflected from the database (the columns of tables,
+                    and the names of schemas, tables and views) is reused, by metrics and data connectors alike.
+                    Tables altered during the ttl keep their cached columns until it expires. By default, metadata is
+                    not cached, unless schema_cache_path is given (in which case it is reused for 5 minutes).
+                schema_cache_path (str): \
+                    A file to persist the schema cache of the execution engine to, when the execution engine is closed
+                    and when the process exits, so that later processes reuse it.
+
+        Engines built from credentials, a connection_string or a url are shared (with their connection pools) by all
+        the execution engines, datasources and stores of the process that connect with the same url and engine
+        options (see great_expectations.core.sqlalchemy_engine_registry). Pool options such as pool_size,
+        max_overflow, pool_pre_ping and pool_recycle are passed through kwargs.
         """
         super().__init__(name=name, batch_data_dict=batch_data_dict)
         self._name = name
@@ -166,6 +318,31 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._max_concurrent_queries = max_concurrent_queries
+        self._fuse_filtered_domains = fuse_filtered_domains
+        self._temp_table_manager = SqlAlchemyTempTableManager(
+            self,
+            ttl=temp_table_ttl,
+            analyze=bool(analyze_temp_tables),
+            index_columns=temp_table_index_columns,
+        )
+        self._max_session_connections = max_session_connections
+        if schema_cache_ttl is None and schema_cache_path is None:
+            self._schema_cache = SqlAlchemySchemaCache(ttl=0)
+        else:
+            self._schema_cache = SqlAlchemySchemaCache(
+                ttl=DEFAULT_SCHEMA_CACHE_TTL
+                if schema_cache_ttl is None
+                else schema_cache_ttl,
+                persist_path=schema_cache_path,
+            )
+        # Session connections (and the number of batches bound to them) by thread: connections are not shared across
+        # threads, which many drivers (sqlite, psycopg2 cursors) do not support
+        self._session_connections: Dict[int, List["sa.engine.Connection"]] = dict()
+        self._session_connection_counts: Dict[int, int] = dict()
+        self._session_connection_lock = threading.Lock()
+        # The connection of the batch whose metrics the current thread is computing, if any
+        self._batch_connection_scope = threading.local()
 
         if engine is not None:
             if credentials is not None:
@@ -177,10 +354,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = get_sqlalchemy_engine(url, **kwargs)
         else:
             raise InvalidConfigError(
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -215,15 +392,6 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             self.dialect_module = None
 
-        if self.engine and self.engine.dialect.name.lower() in [
-            "sqlite",
-            "mssql",
-            "snowflake",
-            "mysql",
-        ]:
-            # sqlite/mssql temp tables only persist within a connection so override the engine
-            self.engine = self.engine.connect()
-
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
             data_context, "_usage_statistics_handler", None
@@ -250,6 +418,18 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "max_concurrent_queries": max_concurrent_queries,
+            "fuse_filtered_domains": fuse_filtered_domains
+            if not fuse_filtered_domains
+            else None,
+            "max_session_connections": max_session_connections
+            if max_session_connections != 1
+            else None,
+            "temp_table_ttl": temp_table_ttl,
+            "analyze_temp_tables": analyze_temp_tables,
+            "temp_table_index_columns": temp_table_index_columns,
+            "schema_cache_ttl": schema_cache_ttl,
+            "schema_cache_path": schema_cache_path,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -268,6 +448,134 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self):
         return self._url
 
+    @property
+    def engine(self) -> Union["sa.engine.Engine", "sa.engine.Connection"]:
+        """The connectable on which queries are run: the connection of the batch whose metrics are being computed by
+        the current thread, if the batch is bound to one, and the engine (or connection) given to the execution engine
+        otherwise."""
+        connection = getattr(self._batch_connection_scope, "connection", None)
+        if connection is not None:
+            return connection
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine: Union["sa.engine.Engine", "sa.engine.Connection"]):
+        self._engine = engine
+
+    def get_session_connection(self) -> Optional["sa.engine.Connection"]:
+        """Returns a connection for a batch to create its temporary table on, spreading the batches of the current
+        thread over at most max_session_connections connections of its own. Returns None if the execution engine was
+        given a connection, which all batches then share."""
+        if isinstance(self._engine, sa.engine.Connection):
+            return None
+        thread_id = threading.get_ident()
+        with self._session_connection_lock:
+            connections = self._session_connections.setdefault(thread_id, [])
+            count = self._session_connection_counts.get(thread_id, 0)
+            if len(connections) < max(self._max_session_connections, 1):
+                connection = self._engine.connect()
+                connections.append(connection)
+            else:
+                connection = connections[count % len(connections)]
+            self._session_connection_counts[thread_id] = count + 1
+            return connection
+
+    def close_session_connections(self) -> None:
+        """Unloads the batches bound to the session connections of the current thread, drops their temporary tables
+        and closes these connections, which only the thread that opened them may use."""
+        thread_id = threading.get_ident()
+        with self._session_connection_lock:
+            connections = self._session_connections.pop(thread_id, [])
+            self._session_connection_counts.pop(thread_id, None)
+        if not connections:
+            return
+        for batch_id, batch_data in list(self.loaded_batch_data_dict.items()):
+            if getattr(batch_data, "connection", None) in connections:
+                self.unload_batch_data(batch_id)
+        self._temp_table_manager.drop_all(connections=connections)
+        for connection in connections:
+            connection.close()
+
+    def _get_batch_connection(
+        self, domain_kwargs: dict
+    ) -> Optional["sa.engine.Connection"]:
+        batch_id = domain_kwargs.get("batch_id")
+        if batch_id is None:
+            batch_id = self.active_batch_data_id
+        return getattr(self.loaded_batch_data_dict.get(batch_id), "connection", None)
+
+    @contextmanager
+    def batch_connection_scope(self, domain_kwargs: dict):
+        """Within this context, self.engine is the connection of the batch that domain_kwargs refer to, if it is bound
+        to one."""
+        previous_connection = getattr(self._batch_connection_scope, "connection", None)
+        self._batch_connection_scope.connection = (
+            self._get_batch_connection(domain_kwargs) or previous_connection
+        )
+        try:
+            yield
+        finally:
+            self._batch_connection_scope.connection = previous_connection
+
+    def _timed_metric_fn_call(self, metric_fn, metric_provider_kwargs):
+        with self.batch_connection_scope(
+            metric_provider_kwargs["metric_domain_kwargs"]
+        ):
+            return super()._timed_metric_fn_call(metric_fn, metric_provider_kwargs)
+
+    @property
+    def schema_cache(self) -> SqlAlchemySchemaCache:
+        """The cache of the metadata reflected from the database of the execution engine."""
+        return self._schema_cache
+
+    @property
+    def temp_table_manager(self) -> SqlAlchemyTempTableManager:
+        return self._temp_table_manager
+
+    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+        previous_batch_data = self.loaded_batch_data_dict.get(batch_id)
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        if previous_batch_data is not None and previous_batch_data is not batch_data:
+            self._temp_table_manager.release(previous_batch_data)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        batch_data = self.loaded_batch_data_dict.get(batch_id)
+        super().unload_batch_data(batch_id=batch_id)
+        if batch_data is not None:
+            self._temp_table_manager.release(batch_data)
+
+    def close(self) -> None:
+        """Drops the temporary tables of the execution engine, and returns the connections of its batches to the
+        pool."""
+        self._temp_table_manager.drop_all()
+        self._schema_cache.save()
+        with self._session_connection_lock:
+            for connections in self._session_connections.values():
+                for connection in connections:
+                    connection.close()
+            self._session_connections = dict()
+            self._session_connection_counts = dict()
+
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        # A connection (given to the execution engine, or bound to batches so that their temp tables stay visible)
+        # cannot be shared across threads; a pooled engine checks out one connection per concurrent query. In-memory
+        # sqlite databases are private to the connection of each thread.
+        return (
+            not isinstance(self._engine, sa.engine.Connection)
+            and not self._is_in_memory_sqlite
+            and not self._session_connections
+        )
+
+    @property
+    def _is_in_memory_sqlite(self) -> bool:
+        url = self._engine.engine.url
+        return url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        )
+
     def _build_engine(self, credentials, **kwargs) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -295,7 +603,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = sa.engine.url.URL(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -562,6 +870,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         bundles the metrics into one large query dictionary so that they are all executed simultaneously. Will fail if
         bundling the metrics together is not possible.
 
+        Bundled metric functions may be aggregate expressions, lists of aggregate expressions (whose metric value is the
+        list of their values), scalar subqueries (which are selected alongside the aggregates of their domain) or
+        GroupedValueCounts (which are computed by one grouped query per domain).
+
             Args:
                 metric_fn_bundle (Iterable[Tuple[MetricConfiguration, Callable, dict]): \
                     A Dictionary containing a MetricProvider's MetricConfiguration (its unique identifier), its metric provider function
@@ -573,51 +885,363 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 A dictionary of metric names and their corresponding now-queried values.
         """
         resolved_metrics = dict()
+        metric_fn_bundle = list(metric_fn_bundle)
+
+        # Value counts are grouped by domain and sort order; the value counts of the columns of a group are computed by
+        # a single query.
+        value_counts_queries: Dict[Tuple, dict] = dict()
+        aggregate_fn_bundle = []
+        for bundled_metric in metric_fn_bundle:
+            metric_to_resolve, engine_fn, compute_domain_kwargs, _, _ = bundled_metric
+            if not isinstance(engine_fn, GroupedValueCounts):
+                aggregate_fn_bundle.append(bundled_metric)
+                continue
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            # Collated orderings cannot be applied to the result of a union on all databases
+            key = (
+                compute_domain_kwargs.to_id(),
+                engine_fn.sort,
+                engine_fn.collate,
+                None if engine_fn.collate is None else engine_fn.column_name,
+            )
+            if key not in value_counts_queries:
+                value_counts_queries[key] = {
+                    "value_counts": [],
+                    "ids": [],
+                    "domain_kwargs": compute_domain_kwargs,
+                }
+            value_counts_queries[key]["value_counts"].append(engine_fn)
+            value_counts_queries[key]["ids"].append(metric_to_resolve.id)
 
-        # We need a different query for each domain (where clause).
+        # We need a different query for each domain (where clause), unless domains that differ only in their
+        # row_condition can be fused into one query over their common base domain.
         queries: Dict[Tuple, dict] = dict()
+        if self._fuse_filtered_domains:
+            fusable_group_ids = self._get_fusable_domain_group_ids(aggregate_fn_bundle)
+        else:
+            fusable_group_ids = set()
         for (
             metric_to_resolve,
             engine_fn,
             compute_domain_kwargs,
             accessor_domain_kwargs,
             metric_provider_kwargs,
-        ) in metric_fn_bundle:
+        ) in aggregate_fn_bundle:
             if not isinstance(compute_domain_kwargs, IDDict):
                 compute_domain_kwargs = IDDict(compute_domain_kwargs)
             domain_id = compute_domain_kwargs.to_id()
+
+            group_domain_kwargs, condition = self._split_row_condition(
+                compute_domain_kwargs
+            )
+            group_id = ("fused", group_domain_kwargs.to_id())
+            if group_id in fusable_group_ids:
+                if condition is not None:
+                    use_filter_clause = self.engine.dialect.name.lower() == "postgresql"
+                    if isinstance(engine_fn, (list, tuple)):
+                        fused_engine_fn = [
+                            _push_condition_into_aggregates(
+                                expression,
+                                condition,
+                                use_filter_clause=use_filter_clause,
+                            )
+                            for expression in engine_fn
+                        ]
+                        if any(expression is None for expression in fused_engine_fn):
+                            fused_engine_fn = None
+                    else:
+                        fused_engine_fn = _push_condition_into_aggregates(
+                            engine_fn,
+                            condition,
+                            use_filter_clause=use_filter_clause,
+                        )
+                else:
+                    fused_engine_fn = engine_fn
+                if fused_engine_fn is not None:
+                    engine_fn = fused_engine_fn
+                    domain_id = group_id
+                    compute_domain_kwargs = group_domain_kwargs
+
             if domain_id not in queries:
                 queries[domain_id] = {
                     "select": [],
+                    "scalar_select": [],
                     "ids": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
-            queries[domain_id]["select"].append(
-                engine_fn.label(metric_to_resolve.metric_name)
-            )
-            queries[domain_id]["ids"].append(metric_to_resolve.id)
+            query = queries[domain_id]
+            if isinstance(engine_fn, sa.sql.expression.ScalarSelect):
+                query["ids"].append(
+                    (metric_to_resolve.id, "scalar_select", len(query["scalar_select"]))
+                )
+                query["scalar_select"].append(
+                    (engine_fn, metric_to_resolve.metric_name)
+                )
+            elif isinstance(engine_fn, (list, tuple)):
+                query["ids"].append(
+                    (
+                        metric_to_resolve.id,
+                        "select",
+                        slice(
+                            len(query["select"]), len(query["select"]) + len(engine_fn)
+                        ),
+                    )
+                )
+                query["select"].extend(
+                    (expression, metric_to_resolve.metric_name)
+                    for expression in engine_fn
+                )
+            else:
+                query["ids"].append(
+                    (metric_to_resolve.id, "select", len(query["select"]))
+                )
+                query["select"].append((engine_fn, metric_to_resolve.metric_name))
+
+        statements = []
         for query in queries.values():
             selectable, compute_domain_kwargs, _ = self.get_compute_domain(
                 query["domain_kwargs"], domain_type="identity"
             )
-            assert len(query["select"]) == len(query["ids"])
-            res = self.engine.execute(
-                sa.select(query["select"]).select_from(selectable)
-            ).fetchall()
+            statements.append(self._get_bundle_statement(selectable, query))
+        for query in value_counts_queries.values():
+            selectable, compute_domain_kwargs, _ = self.get_compute_domain(
+                query["domain_kwargs"], domain_type="identity"
+            )
+            statements.append(
+                self._get_value_counts_statement(selectable, query["value_counts"])
+            )
+
+        all_queries = list(queries.values()) + list(value_counts_queries.values())
+        connectable = self._get_concurrent_query_connectable(all_queries)
+        if connectable is not None:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrent_queries, len(statements)),
+                thread_name_prefix="ge_metric_bundle",
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda statement: connectable.execute(statement).fetchall(),
+                        statements,
+                    )
+                )
+        else:
+            results = []
+            for query, statement in zip(all_queries, statements):
+                with self.batch_connection_scope(query["domain_kwargs"]):
+                    results.append(self.engine.execute(statement).fetchall())
+
+        for query, res in zip(queries.values(), results):
             logger.debug(
-                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
+                f"SqlAlchemyExecutionEngine computed {len(query['ids'])} metrics on domain_id {query['domain_kwargs'].to_id()}"
             )
             assert (
                 len(res) == 1
             ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
+            assert len(query["select"]) + len(query["scalar_select"]) == len(
                 res[0]
             ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+            values = {
+                "select": res[0][: len(query["select"])],
+                "scalar_select": res[0][len(query["select"]) :],
+            }
+            for id, kind, idx in query["ids"]:
+                resolved_metrics[id] = convert_to_json_serializable(values[kind][idx])
+
+        for query, res in zip(value_counts_queries.values(), results[len(queries) :]):
+            value_counts = self._get_value_counts_from_rows(
+                res, len(query["value_counts"])
+            )
+            for id, series in zip(query["ids"], value_counts):
+                resolved_metrics[id] = series
 
         return resolved_metrics
 
+    @staticmethod
+    def _get_bundle_statement(selectable, query: dict) -> "sa.sql.expression.Select":
+        """Return the statement selecting the aggregates and scalar subqueries of a bundled query."""
+        if not query["scalar_select"]:
+            return sa.select(
+                [expression.label(label) for expression, label in query["select"]]
+            ).select_from(selectable)
+
+        scalar_selects = [
+            expression.label(label) for expression, label in query["scalar_select"]
+        ]
+        if not query["select"]:
+            return sa.select(scalar_selects)
+        # Without an aggregate to reduce the domain to a single row, scalar subqueries would be selected once per row of
+        # the domain: aggregates are computed in a subquery of their own.
+        aggregates = (
+            sa.select(
+                [
+                    expression.label(f"aggregate_{idx}")
+                    for idx, (expression, _) in enumerate(query["select"])
+                ]
+            )
+            .select_from(selectable)
+            .alias("aggregates")
+        )
+        return sa.select(list(aggregates.columns) + scalar_selects)
+
+    @staticmethod
+    def _get_value_counts_statement(
+        selectable, value_counts: List[GroupedValueCounts]
+    ) -> "sa.sql.expression.SelectBase":
+        """Return a statement counting the values of several columns of a domain at once.
+
+        The counts of each column are grouped by a select of their own, in which the other columns are NULL, and the
+        selects are combined with UNION ALL. The grouping_set column identifies the column that a row counts.
+
+        The NULLs standing for the other columns must have the types of these columns, or databases such as PostgreSQL
+        and mssql cannot match the types of the selects. The types of the columns are not known here, so each NULL is
+        a CASE expression over its column that is never true (and, being constant, does not change the groups).
+        """
+        sort = value_counts[0].sort
+        collate = value_counts[0].collate
+        columns = [
+            sa.column(column_value_counts.column_name)
+            for column_value_counts in value_counts
+        ]
+        # (1 = 0 rather than false, which mssql renders as a bare 0 that it does not accept as a condition)
+        never = sa.literal_column("1") == sa.literal_column("0")
+        typed_nulls = [sa.case([(never, column)]) for column in columns]
+        selects = []
+        for idx, column in enumerate(columns):
+            other_typed_nulls = [
+                typed_null
+                for other_idx, typed_null in enumerate(typed_nulls)
+                if other_idx != idx
+            ]
+            selects.append(
+                sa.select(
+                    [sa.literal_column(str(idx)).label("grouping_set")]
+                    + [
+                        (column if other_idx == idx else typed_null).label(
+                            f"value_{other_idx}"
+                        )
+                        for other_idx, typed_null in enumerate(typed_nulls)
+                    ]
+                    + [sa.func.count(column).label("count")]
+                )
+                .where(column != None)
+                .group_by(column, *other_typed_nulls)
+                .select_from(selectable)
+            )
+
+        if len(selects) == 1:
+            statement = selects[0]
+        else:
+            statement = sa.union_all(*selects)
+
+        order_by = [sa.column("grouping_set")]
+        if sort == "value":
+            # NOTE: depending on the way the underlying database collates columns,
+            # ordering can vary. postgresql collate "C" matches default sort
+            # for python and most other systems, but is not universally supported,
+            # so we use the default sort for the system, unless specifically overridden
+            for idx in range(len(columns)):
+                if collate is not None:
+                    order_by.append(sa.column(f"value_{idx}").collate(collate))
+                else:
+                    order_by.append(sa.column(f"value_{idx}"))
+        elif sort == "count":
+            order_by.append(sa.column("count").desc())
+        return statement.order_by(*order_by)
+
+    @staticmethod
+    def _get_value_counts_from_rows(rows: list, n_columns: int) -> List[pd.Series]:
+        """Split the rows of a value counts statement into a Series of counts indexed by value for each column."""
+        values_and_counts = [([], []) for _ in range(n_columns)]
+        for row in rows:
+            idx = int(row[0])
+            values_and_counts[idx][0].append(row[1 + idx])
+            values_and_counts[idx][1].append(row[-1])
+        return [
+            pd.Series(
+                counts,
+                index=pd.Index(data=values, name="value"),
+                name="count",
+            )
+            for values, counts in values_and_counts
+        ]
+
+    @staticmethod
+    def _split_row_condition(
+        compute_domain_kwargs: IDDict,
+    ) -> Tuple[IDDict, Optional["sa.sql.expression.ColumnElement"]]:
+        """Separate a compute domain into the domain without its row_condition and the condition as a SQL
+        expression. The condition is None if the domain has no row_condition that could be fused."""
+        if (
+            compute_domain_kwargs.get("row_condition") is None
+            or compute_domain_kwargs.get("condition_parser")
+            != "great_expectations__experimental__"
+        ):
+            return compute_domain_kwargs, None
+        group_domain_kwargs = IDDict(
+            {
+                key: value
+                for key, value in compute_domain_kwargs.items()
+                if key not in ("row_condition", "condition_parser")
+            }
+        )
+        return group_domain_kwargs, parse_condition_to_sqlalchemy(
+            compute_domain_kwargs["row_condition"]
+        )
+
+    def _get_fusable_domain_group_ids(self, metric_fn_bundle: List[Tuple]) -> set:
+        """Return the ids of base domains that more than one compute domain in the bundle reduces to once its
+        row_condition is removed; metrics on such domains can share a single scan of the base domain."""
+        domain_ids_by_group_id: Dict[Tuple, set] = dict()
+        for (_, _, compute_domain_kwargs, _, _) in metric_fn_bundle:
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            if (
+                compute_domain_kwargs.get("row_condition") is not None
+                and compute_domain_kwargs.get("condition_parser")
+                != "great_expectations__experimental__"
+            ):
+                continue
+            group_domain_kwargs, _ = self._split_row_condition(compute_domain_kwargs)
+            domain_ids_by_group_id.setdefault(
+                ("fused", group_domain_kwargs.to_id()), set()
+            ).add(compute_domain_kwargs.to_id())
+        return {
+            group_id
+            for group_id, domain_ids in domain_ids_by_group_id.items()
+            if len(domain_ids) > 1
+        }
+
+    def _get_concurrent_query_connectable(
+        self, queries: Iterable[dict]
+    ) -> Optional["sa.engine.Engine"]:
+        """Return a pooled engine on which the given bundled queries may run concurrently, or None if they must run
+        one after another on self.engine.
+
+        Queries can only be moved to the connection pool if none of them reads from a temporary table that is visible
+        to the connection of its batch alone. sqlite connections given to the execution engine, and in-memory sqlite
+        databases (which are private to each connection), always keep their queries on a single connection.
+        """
+        queries = list(queries)
+        if self._max_concurrent_queries is None or self._max_concurrent_queries <= 1:
+            return None
+        if len(queries) < 2:
+            return None
+
+        if self._engine.dialect.name.lower() == "sqlite" and (
+            isinstance(self._engine, sa.engine.Connection) or self._is_in_memory_sqlite
+        ):
+            return None
+        for query in queries:
+            batch_id = query.get("domain_kwargs", {}).get("batch_id")
+            if batch_id is None:
+                data_object = self.active_batch_data
+            else:
+                data_object = self.loaded_batch_data_dict.get(batch_id)
+            if data_object is None or data_object.uses_session_temp_table:
+                return None
+        return self._engine.engine
+
     ### Splitter methods for partitioning tables ###
 
     def _split_on_whole_table(
@@ -832,6 +1456,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             ),
             source_table_name=source_table_name,
             source_schema_name=source_schema_name,
+            temp_table_index_columns=batch_spec.get("temp_table_index_columns"),
         )
         batch_markers = BatchMarkers(
             {
@@ -0,0 +1,235 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+logger = logging.getLogger(__name__)
+
+
+class _TempTable:
+    def __init__(
+        self,
+        query_key: str,
+        table_name: str,
+        schema_name: Optional[str],
+        reusable: bool,
+        connection=None,
+    ):
+        self.query_key = query_key
+        self.table_name = table_name
+        self.schema_name = schema_name
+        self.reusable = reusable
+        self.connection = connection
+        # Session connections may only be used by the thread that opened them
+        self.thread_id = threading.get_ident() if connection is not None else None
+        self.created_at = time.time()
+        self.owners: Set[int] = set()
+
+
+class SqlAlchemyTempTableManager:
+    """Keeps track of the temporary tables that SqlAlchemyBatchData materialize their selectables into.
+
+    Temporary tables are keyed by a hash of the compiled query they were created from, so that a batch whose query was
+    materialized less than ttl seconds ago reuses the existing table rather than creating a new one. Tables are dropped
+    once no loaded batch uses them and their ttl has expired, and all of them are dropped when the execution engine is
+    closed.
+
+    Args:
+        execution_engine: the SqlAlchemyExecutionEngine whose engine (or connection) creates the tables, unless a table
+            was created on a session connection of its own
+        ttl: number of seconds during which a temporary table is reused for the same query. If None (the default), tables
+            are never reused, and are dropped as soon as their batch is unloaded.
+        analyze: if True, collect statistics on each table after it is created (ANALYZE, or UPDATE STATISTICS on mssql)
+        index_columns: columns to index in each table that has them, typically those used in row_conditions
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        ttl: Optional[float] = None,
+        analyze: bool = False,
+        index_columns: Optional[Iterable[str]] = None,
+    ):
+        self._execution_engine = execution_engine
+        self._ttl = ttl
+        self._analyze = analyze
+        self._index_columns = list(index_columns or [])
+        # Temporary tables by name
+        self._temp_tables: Dict[str, _TempTable] = dict()
+        self._lock = threading.RLock()
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def temp_table_names(self) -> List[str]:
+        with self._lock:
+            return [temp_table.table_name for temp_table in self._temp_tables.values()]
+
+    @property
+    def _dialect_name(self) -> str:
+        return self._execution_engine.engine.dialect.name.lower()
+
+    @staticmethod
+    def get_query_key(
+        query,
+        temp_table_name: Optional[str] = None,
+        temp_table_schema_name: Optional[str] = None,
+    ) -> str:
+        """Returns the key of the temporary tables materializing a compiled query (under a requested name and schema,
+        if any)."""
+        return hashlib.sha256(
+            f"{temp_table_schema_name}.{temp_table_name}:{str(query)}".encode("utf-8")
+        ).hexdigest()
+
+    def _is_expired(self, temp_table: _TempTable) -> bool:
+        return (
+            not temp_table.reusable
+            or self._ttl is None
+            or time.time() - temp_table.created_at > self._ttl
+        )
+
+    def acquire(
+        self, query_key: str, owner
+    ) -> Tuple[Optional[str], Optional["sa.engine.Connection"]]:
+        """Returns the name of a live temporary table created from the query with the given key and the session
+        connection it was created on (if any), and records that owner uses it; returns (None, None) if there is no such
+        table. Tables created on a session connection are only reused by the thread that created them."""
+        with self._lock:
+            self.drop_expired()
+            for temp_table in self._temp_tables.values():
+                if (
+                    temp_table.query_key == query_key
+                    and not self._is_expired(temp_table)
+                    and temp_table.thread_id in (None, threading.get_ident())
+                ):
+                    temp_table.owners.add(id(owner))
+                    logger.debug(f"Reusing temporary table {temp_table.table_name}")
+                    return temp_table.table_name, temp_table.connection
+            return None, None
+
+    def register(
+        self,
+        query_key: str,
+        table_name: str,
+        owner,
+        temp_table_schema_name: Optional[str] = None,
+        reusable: bool = True,
+        index_columns: Optional[Iterable[str]] = None,
+        connection: Optional["sa.engine.Connection"] = None,
+    ) -> None:
+        """Records a temporary table that was just created from the query with the given key for owner, collects its
+        statistics and creates its indexes.
+
+        Args:
+            reusable: whether later batches can use the table (False for session-scoped tables of pooled engines, which
+                only the connection that created them can see)
+            index_columns: columns to index in addition to those the manager indexes in every table
+            connection: the session connection the table was created on, if not the engine of the execution engine
+        """
+        temp_table = _TempTable(
+            query_key=query_key,
+            table_name=table_name,
+            schema_name=temp_table_schema_name,
+            reusable=reusable,
+            connection=connection,
+        )
+        temp_table.owners.add(id(owner))
+        with self._lock:
+            self._temp_tables[table_name] = temp_table
+
+        for column in dict.fromkeys(self._index_columns + list(index_columns or [])):
+            self._create_index(temp_table, column)
+        if self._analyze:
+            self._collect_statistics(temp_table)
+
+    def release(self, owner) -> None:
+        """Records that owner no longer uses its temporary table, and drops the table if it has expired."""
+        with self._lock:
+            for temp_table in self._temp_tables.values():
+                temp_table.owners.discard(id(owner))
+            self.drop_expired()
+
+    def drop_expired(self) -> None:
+        """Drops the temporary tables that are unused and whose ttl has expired."""
+        with self._lock:
+            for table_name, temp_table in list(self._temp_tables.items()):
+                if not temp_table.owners and self._is_expired(temp_table):
+                    self._drop(temp_table)
+                    del self._temp_tables[table_name]
+
+    def drop_all(
+        self, connections: Optional[List["sa.engine.Connection"]] = None
+    ) -> None:
+        """Drops all of the temporary tables (only those created on connections, if given), whether or not batches still
+        use them."""
+        with self._lock:
+            for table_name, temp_table in list(self._temp_tables.items()):
+                if connections is None or temp_table.connection in connections:
+                    self._drop(temp_table)
+                    del self._temp_tables[table_name]
+
+    def _execute(self, temp_table: _TempTable, statement) -> None:
+        (temp_table.connection or self._execution_engine.engine).execute(statement)
+
+    def _get_table(self, temp_table: _TempTable, *columns: str) -> "sa.Table":
+        return sa.Table(
+            temp_table.table_name,
+            sa.MetaData(),
+            *[sa.Column(column) for column in columns],
+            schema=temp_table.schema_name,
+        )
+
+    def _drop(self, temp_table: _TempTable) -> None:
+        try:
+            self._execute(temp_table, sa.schema.DropTable(self._get_table(temp_table)))
+            logger.debug(f"Dropped temporary table {temp_table.table_name}")
+        except sa.exc.SQLAlchemyError as e:
+            # The table may already be gone with the session that created it
+            logger.debug(
+                f"Unable to drop temporary table {temp_table.table_name}: {str(e)}"
+            )
+
+    def _create_index(self, temp_table: _TempTable, column: str) -> None:
+        if self._dialect_name in ["bigquery", "snowflake", "awsathena"]:
+            # These do not support indexes
+            return
+        index_name = re.sub(
+            r"\W", "_", f"ix_{temp_table.table_name}_{column}".lstrip("#")
+        )
+        table = self._get_table(temp_table, column)
+        try:
+            self._execute(
+                temp_table, sa.schema.CreateIndex(sa.Index(index_name, table.c[column]))
+            )
+        except sa.exc.SQLAlchemyError as e:
+            logger.warning(
+                f"Unable to index column {column} of temporary table {temp_table.table_name}: {str(e)}"
+            )
+
+    def _collect_statistics(self, temp_table: _TempTable) -> None:
+        preparer = self._execution_engine.engine.dialect.identifier_preparer
+        table_name = preparer.format_table(self._get_table(temp_table))
+        if self._dialect_name in ["postgresql", "redshift", "sqlite"]:
+            statement = f"ANALYZE {table_name}"
+        elif self._dialect_name == "mysql":
+            statement = f"ANALYZE TABLE {table_name}"
+        elif self._dialect_name == "mssql":
+            statement = f"UPDATE STATISTICS {table_name}"
+        else:
+            # Other databases collect statistics on their own when a table is created
+            return
+        try:
+            self._execute(temp_table, sa.text(statement))
+        except sa.exc.SQLAlchemyError as e:
+            logger.warning(
+                f"Unable to collect statistics on temporary table {temp_table.table_name}: {str(e)}"
+            )
@@ -7,6 +7,7 @@ from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.util import render_evaluation_parameter_string
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from ...render.renderer.renderer import renderer
 from ...render.types import RenderedStringTemplateContent
@@ -36,6 +37,9 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
                     If True, the column median must be strictly larger than min_value, default=False
                 strict_max (boolean):
                     If True, the column median must be strictly smaller than max_value, default=False
+                allow_relative_error (boolean or float): \
+                    If True or a relative error between 0 and 1, compute the median as an approximate 0.5 quantile \
+                    (see :func:`expect_column_quantile_values_to_be_between`) rather than exactly. Defaults to False.
 
             Other Parameters:
                 result_format (str or None): \
@@ -89,7 +93,13 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.median",)
-    success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    success_keys = (
+        "min_value",
+        "strict_min",
+        "max_value",
+        "strict_max",
+        "allow_relative_error",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -97,6 +107,7 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -181,6 +192,30 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
             )
         ]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        allow_relative_error = self.get_success_kwargs(configuration).get(
+            "allow_relative_error"
+        )
+        if allow_relative_error:
+            metric = dependencies["metrics"].pop("column.median")
+            dependencies["metrics"]["column.quantile_values"] = MetricConfiguration(
+                metric_name="column.quantile_values",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={
+                    "quantiles": [0.5],
+                    "allow_relative_error": allow_relative_error,
+                },
+            )
+        return dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -188,6 +223,8 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
+        if "column.quantile_values" in metrics:
+            metrics = {"column.median": metrics["column.quantile_values"][0]}
         return self._validate_metric_value_between(
             metric_name="column.median",
             configuration=configuration,
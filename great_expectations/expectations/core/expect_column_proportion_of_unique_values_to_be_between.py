@@ -5,7 +5,9 @@ import pandas as pd
 
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.expectations.metrics.sketches import get_sketch_relative_error
 from great_expectations.expectations.util import render_evaluation_parameter_string
 
 from ...render.renderer.renderer import renderer
@@ -40,6 +42,10 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean):
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        approximate (boolean or float): \
+            If True or a relative error between 0 and 1, count the unique values approximately (with a HyperLogLog \
+            sketch on pandas, and with the approximate distinct count of the backend elsewhere) rather than exactly. \
+            Defaults to False.
 
     Other Parameters:
         result_format (str or None): \
@@ -91,7 +97,13 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
-    success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    success_keys = (
+        "min_value",
+        "strict_min",
+        "max_value",
+        "strict_max",
+        "approximate",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -99,6 +111,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "approximate": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -119,6 +132,10 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         """
         super().validate_configuration(configuration)
         self.validate_metric_value_between_configuration(configuration=configuration)
+        try:
+            get_sketch_relative_error(configuration.kwargs.get("approximate"))
+        except ValueError as e:
+            raise InvalidExpectationConfigurationError(str(e))
 
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
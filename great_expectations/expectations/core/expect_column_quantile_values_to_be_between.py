@@ -16,6 +16,7 @@ from great_expectations.render.util import (
     parse_row_condition_string_pandas_engine,
     substitute_none_for_missing,
 )
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
@@ -76,8 +77,10 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
                    The column name.
                quantile_ranges (dictionary): \
                    Quantiles and associated value ranges for the column. See above for details.
-               allow_relative_error (boolean): \
-                   Whether to allow relative error in quantile communications on backends that support or require it.
+               allow_relative_error (boolean or float): \
+                   Whether to allow relative error in quantile communications on backends that support or require it. \
+                   True or a relative error between 0 and 1 computes approximate quantiles (from a KLL sketch on \
+                   pandas).
 
            Other Parameters:
                result_format (str or None): \
@@ -164,9 +167,12 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
         else:
             allow_relative_error = False
 
-        if allow_relative_error is not False:
+        if not isinstance(allow_relative_error, (bool, str)) and not (
+            isinstance(allow_relative_error, (int, float))
+            and 0 <= allow_relative_error <= 1
+        ):
             raise ValueError(
-                "PandasExecutionEngine does not support relative error in column quantiles."
+                "allow_relative_error must be True, False, or a relative error between 0 and 1."
             )
 
         if len(quantiles) != len(quantile_value_ranges):
@@ -369,9 +375,16 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             configuration, execution_engine, runtime_configuration
         )
         # column.quantile_values expects a "quantiles" key
-        all_dependencies["metrics"]["column.quantile_values"].metric_value_kwargs[
-            "quantiles"
-        ] = configuration.kwargs["quantile_ranges"]["quantiles"]
+        quantile_values_metric = all_dependencies["metrics"]["column.quantile_values"]
+        all_dependencies["metrics"]["column.quantile_values"] = MetricConfiguration(
+            metric_name=quantile_values_metric.metric_name,
+            metric_domain_kwargs=quantile_values_metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                **quantile_values_metric.metric_value_kwargs,
+                "quantiles": configuration.kwargs["quantile_ranges"]["quantiles"],
+            },
+            metric_dependencies=quantile_values_metric.metric_dependencies,
+        )
         return all_dependencies
 
     def _validate(
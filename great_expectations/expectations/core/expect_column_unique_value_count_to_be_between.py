@@ -5,8 +5,11 @@ import pandas as pd
 
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.expectations.metrics.sketches import get_sketch_relative_error
 from great_expectations.expectations.util import render_evaluation_parameter_string
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 from ...render.renderer.renderer import renderer
 from ...render.types import RenderedStringTemplateContent
@@ -33,6 +36,10 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                     The minimum number of unique values allowed.
                 max_value (int or None): \
                     The maximum number of unique values allowed.
+                approximate (boolean or float): \
+                    If True or a relative error between 0 and 1, count the unique values approximately (with a \
+                    HyperLogLog sketch on pandas, and with the approximate distinct count of the backend elsewhere) \
+                    rather than exactly. Defaults to False.
 
             Other Parameters:
                 result_format (str or None): \
@@ -87,6 +94,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "approximate",
     )
 
     # Default values
@@ -95,6 +103,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "condition_parser": None,
         "min_value": None,
         "max_value": None,
+        "approximate": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -115,6 +124,10 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         """
         super().validate_configuration(configuration)
         self.validate_metric_value_between_configuration(configuration=configuration)
+        try:
+            get_sketch_relative_error(configuration.kwargs.get("approximate"))
+        except ValueError as e:
+            raise InvalidExpectationConfigurationError(str(e))
 
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
@@ -225,6 +238,27 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         else:
             return [template_string_object, observed_value]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        approximate = self.get_success_kwargs(configuration).get("approximate")
+        if approximate:
+            metric = dependencies["metrics"].pop("column.distinct_values.count")
+            dependencies["metrics"][
+                "column.distinct_values.approx_count"
+            ] = MetricConfiguration(
+                metric_name="column.distinct_values.approx_count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"approximate": approximate},
+            )
+        return dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
@@ -232,8 +266,12 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         runtime_configuration: dict = None,
         execution_engine: ExecutionEngine = None,
     ):
+        if self.get_success_kwargs(configuration).get("approximate"):
+            metric_name = "column.distinct_values.approx_count"
+        else:
+            metric_name = "column.distinct_values.count"
         return self._validate_metric_value_between(
-            metric_name="column.distinct_values.count",
+            metric_name=metric_name,
             configuration=configuration,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
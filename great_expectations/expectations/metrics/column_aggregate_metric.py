@@ -59,14 +59,21 @@ def column_aggregate_value(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
 
-                df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
-                )
-                if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
+                if MetricDomainTypes(domain_type) == MetricDomainTypes.COLUMN:
+                    column, _, _ = execution_engine.get_column_domain_values(
+                        domain_kwargs=metric_domain_kwargs,
+                        filter_column_isnull=filter_column_isnull,
+                    )
+                else:
+                    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                        domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                    )
+                    if filter_column_isnull:
+                        df = df[df[accessor_domain_kwargs["column"]].notnull()]
+                    column = df[accessor_domain_kwargs["column"]]
                 return metric_fn(
                     cls,
-                    column=df[accessor_domain_kwargs["column"]],
+                    column=column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -1,4 +1,8 @@
-from .column_distinct_values import ColumnDistinctValues, ColumnDistinctValuesCount
+from .column_distinct_values import (
+    ColumnDistinctValues,
+    ColumnDistinctValuesApproxCount,
+    ColumnDistinctValuesCount,
+)
 from .column_histogram import ColumnHistogram
 from .column_max import ColumnMax
 from .column_mean import ColumnMean
@@ -11,6 +15,7 @@ from .column_parameterized_distribution_ks_test_p_value import (
 from .column_partition import ColumnPartition
 from .column_proportion_of_unique_values import ColumnUniqueProportion
 from .column_quantile_values import ColumnQuantileValues
+from .column_sketches import ColumnHyperLogLogSketch, ColumnKLLSketch
 from .column_standard_deviation import ColumnStandardDeviation
 from .column_sum import ColumnSum
 from .column_value_counts import ColumnValueCounts
@@ -11,9 +11,12 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import get_sketch_relative_error
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -143,3 +146,72 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
             )
 
         return dependencies
+
+
+class ColumnDistinctValuesApproxCount(ColumnMetricProvider):
+    """MetricProvider Class for an approximate count of the distinct values of a column, within the relative error
+    allowed by the "approximate" value kwarg (True for DEFAULT_SKETCH_RELATIVE_ERROR, or a number)"""
+
+    metric_name = "column.distinct_values.approx_count"
+    value_keys = ("approximate",)
+    default_kwarg_values = {"approximate": True}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return metrics["column.hll_sketch"].count()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, _dialect, **kwargs):
+        dialect_name = _dialect.name.lower()
+        if dialect_name in ("bigquery", "snowflake", "mssql"):
+            return sa.func.approx_count_distinct(column)
+        elif dialect_name in ("presto", "trino", "awsathena"):
+            return sa.func.approx_distinct(column)
+        # Dialects without an approximate distinct count fall back to the exact one, which is still computed in the
+        # aggregate query of the batch rather than from the value counts of the column.
+        return sa.func.count(sa.distinct(column))
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, approximate=True, **kwargs):
+        return F.approx_count_distinct(column, get_sketch_relative_error(approximate))
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(execution_engine, PandasExecutionEngine):
+            dependencies.update(
+                {
+                    "column.hll_sketch": MetricConfiguration(
+                        metric_name="column.hll_sketch",
+                        metric_domain_kwargs=metric.metric_domain_kwargs,
+                        metric_value_kwargs={
+                            "relative_error": get_sketch_relative_error(
+                                metric.metric_value_kwargs.get("approximate", True)
+                            )
+                        },
+                    )
+                }
+            )
+
+        return dependencies
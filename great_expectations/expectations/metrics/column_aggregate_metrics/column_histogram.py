@@ -4,18 +4,23 @@ from typing import Any, Dict, Tuple
 
 import numpy as np
 
-from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
 )
 from great_expectations.expectations.metrics.import_manager import Bucketizer, F, sa
-from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.metric_provider import (
+    metric_partial,
+    metric_value,
+)
 from great_expectations.expectations.metrics.util import (
     get_sql_dialect_floating_point_infinity_value,
 )
@@ -44,7 +49,11 @@ class ColumnHistogram(ColumnMetricProvider):
         hist, bin_edges = np.histogram(df[column], bins, density=False)
         return list(hist)
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
+    @metric_partial(
+        engine=SqlAlchemyExecutionEngine,
+        partial_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
     def _sqlalchemy(
         cls,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -53,13 +62,18 @@ class ColumnHistogram(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
-        """return a list of counts corresponding to bins
+        """return a list of aggregates counting the values of each bin, which are computed together with the other
+        aggregates of the domain
 
         Args:
             column: the name of the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """
-        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
         column = accessor_domain_kwargs["column"]
@@ -85,9 +99,7 @@ class ColumnHistogram(ColumnMetricProvider):
             )
         ):
             case_conditions.append(
-                sa.func.sum(
-                    sa.case([(sa.column(column) < bins[idx + 1], 1)], else_=0)
-                ).label("bin_" + str(idx))
+                sa.func.sum(sa.case([(sa.column(column) < bins[idx + 1], 1)], else_=0))
             )
             idx += 1
 
@@ -106,7 +118,7 @@ class ColumnHistogram(ColumnMetricProvider):
                         ],
                         else_=0,
                     )
-                ).label("bin_" + str(idx))
+                )
             )
 
         if (
@@ -121,9 +133,7 @@ class ColumnHistogram(ColumnMetricProvider):
             )
         ):
             case_conditions.append(
-                sa.func.sum(
-                    sa.case([(bins[-2] <= sa.column(column), 1)], else_=0)
-                ).label("bin_" + str(len(bins) - 1))
+                sa.func.sum(sa.case([(bins[-2] <= sa.column(column), 1)], else_=0))
             )
         else:
             case_conditions.append(
@@ -140,22 +150,11 @@ class ColumnHistogram(ColumnMetricProvider):
                         ],
                         else_=0,
                     )
-                ).label("bin_" + str(len(bins) - 1))
+                )
             )
 
-        query = (
-            sa.select(case_conditions)
-            .where(
-                sa.column(column) != None,
-            )
-            .select_from(selectable)
-        )
-
-        # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
-        hist = convert_to_json_serializable(
-            list(execution_engine.engine.execute(query).fetchone())
-        )
-        return hist
+        # NULL values fall in no bin
+        return case_conditions, compute_domain_kwargs, accessor_domain_kwargs
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
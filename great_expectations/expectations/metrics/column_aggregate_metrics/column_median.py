@@ -8,7 +8,10 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
@@ -19,6 +22,7 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
+    metric_partial,
     metric_value,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -34,7 +38,11 @@ class ColumnMedian(ColumnMetricProvider):
         """Pandas Median Implementation"""
         return column.median()
 
-    @metric_value(engine=SqlAlchemyExecutionEngine, metric_fn_type="value")
+    @metric_partial(
+        engine=SqlAlchemyExecutionEngine,
+        partial_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
     def _sqlalchemy(
         cls,
         execution_engine: "SqlAlchemyExecutionEngine",
@@ -43,6 +51,10 @@ class ColumnMedian(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        """SqlAlchemy Median Implementation
+
+        Returns a scalar subquery selecting the center value(s) of the column, which is computed together with the
+        aggregates of the domain."""
         (
             selectable,
             compute_domain_kwargs,
@@ -52,40 +64,41 @@ class ColumnMedian(ColumnMetricProvider):
         )
         column_name = accessor_domain_kwargs["column"]
         column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
-        """SqlAlchemy Median Implementation"""
+        dialect = execution_engine.engine.dialect
         if dialect.name.lower() == "awsathena":
             raise NotImplementedError("AWS Athena does not support OFFSET.")
         nonnull_count = metrics.get("column_values.nonnull.count")
         if not nonnull_count:
-            return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
-            .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
-        )
-
-        column_values = list(element_values.fetchall())
-
-        if len(column_values) == 0:
-            column_median = None
+            median = sa.select([sa.null()])
         elif nonnull_count % 2 == 0:
             # An even number of column values: take the average of the two center values
-            column_median = (
-                float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
-                )
-                / 2.0
-            )  # Average center values
+            center_values = (
+                sa.select([column.label("value")])
+                .where(column != None)
+                .order_by(column)
+                .offset(nonnull_count // 2 - 1)
+                .limit(2)
+                .select_from(selectable)
+                .alias("center_values")
+            )
+            median = sa.select(
+                [sa.func.avg(sa.cast(center_values.c.value, sa.Float))]
+            ).select_from(center_values)
         else:
             # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
-        return column_median
+            median = (
+                sa.select([column])
+                .where(column != None)
+                .order_by(column)
+                .offset(nonnull_count // 2)
+                .limit(1)
+                .select_from(selectable)
+            )
+        return (
+            median.correlate(None).as_scalar(),
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        )
 
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
     def _spark(
@@ -21,8 +21,14 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 
 def unique_proportion(_metrics):
     total_values = _metrics.get("table.row_count")
-    unique_values = _metrics.get("column.distinct_values.count")
     null_count = _metrics.get("column_values.nonnull.unexpected_count")
+    if "column.distinct_values.approx_count" in _metrics:
+        # An approximate count may overshoot the number of non-null values
+        unique_values = min(
+            _metrics["column.distinct_values.approx_count"], total_values - null_count
+        )
+    else:
+        unique_values = _metrics.get("column.distinct_values.count")
 
     if total_values > 0:
         return unique_values / (total_values - null_count)
@@ -32,6 +38,8 @@ def unique_proportion(_metrics):
 
 class ColumnUniqueProportion(ColumnMetricProvider):
     metric_name = "column.unique_proportion"
+    value_keys = ("approximate",)
+    default_kwarg_values = {"approximate": False}
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(*args, metrics, **kwargs):
@@ -56,10 +64,19 @@ class ColumnUniqueProportion(ColumnMetricProvider):
         table_domain_kwargs = {
             k: v for k, v in metric.metric_domain_kwargs.items() if k != "column"
         }
-        return {
-            "column.distinct_values.count": MetricConfiguration(
+        approximate = metric.metric_value_kwargs.get("approximate")
+        if approximate:
+            distinct_values_count_metric = MetricConfiguration(
+                "column.distinct_values.approx_count",
+                metric.metric_domain_kwargs,
+                {"approximate": approximate},
+            )
+        else:
+            distinct_values_count_metric = MetricConfiguration(
                 "column.distinct_values.count", metric.metric_domain_kwargs
-            ),
+            )
+        return {
+            distinct_values_count_metric.metric_name: distinct_values_count_metric,
             "table.row_count": MetricConfiguration(
                 "table.row_count", table_domain_kwargs
             ),
@@ -1,7 +1,7 @@
 import logging
 import traceback
 from collections import Iterable
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -22,7 +22,9 @@ except ImportError:
     WithinGroup = None
     CTE = None
 
+from great_expectations.core import ExpectationConfiguration
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
@@ -32,11 +34,15 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
-    column_aggregate_value,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import (
+    DEFAULT_SKETCH_RELATIVE_ERROR,
+    get_sketch_relative_error,
+)
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +51,21 @@ class ColumnQuantileValues(ColumnMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
         """Quantile Function"""
+        quantiles = metric_value_kwargs["quantiles"]
+        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+        if "column.kll_sketch" in metrics:
+            return metrics["column.kll_sketch"].quantiles(quantiles)
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -55,9 +73,13 @@ class ColumnQuantileValues(ColumnMetricProvider):
 
         if allow_relative_error not in interpolation_options:
             raise ValueError(
-                f"If specified for pandas, allow_relative_error must be one an allowed value for the 'interpolation'"
-                f"parameter of .quantile() (one of {interpolation_options})"
+                f"If specified for pandas, allow_relative_error must be True, a relative error between 0 and 1, or "
+                f"an allowed value for the 'interpolation' parameter of .quantile() (one of {interpolation_options})"
             )
+        column, _, _ = execution_engine.get_column_domain_values(
+            domain_kwargs=metric_domain_kwargs,
+            filter_column_isnull=cls.filter_column_isnull,
+        )
         return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -151,16 +173,50 @@ class ColumnQuantileValues(ColumnMetricProvider):
         column = accessor_domain_kwargs["column"]
         if allow_relative_error is False:
             allow_relative_error = 0.0
+        elif allow_relative_error is True:
+            allow_relative_error = DEFAULT_SKETCH_RELATIVE_ERROR
         if (
             not isinstance(allow_relative_error, float)
             or allow_relative_error < 0
             or allow_relative_error > 1
         ):
             raise ValueError(
-                "SparkDFDataset requires relative error to be False or to be a float between 0 and 1."
+                "SparkDFDataset requires relative error to be False, True or a float between 0 and 1."
             )
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        # Strings are interpolation options of pandas; True or a number ask for quantiles of a KLL sketch.
+        allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+        if isinstance(execution_engine, PandasExecutionEngine) and not isinstance(
+            allow_relative_error, str
+        ):
+            relative_error = get_sketch_relative_error(allow_relative_error)
+            if relative_error is not None:
+                dependencies["column.kll_sketch"] = MetricConfiguration(
+                    metric_name="column.kll_sketch",
+                    metric_domain_kwargs=metric.metric_domain_kwargs,
+                    metric_value_kwargs={"relative_error": relative_error},
+                )
+
+        return dependencies
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
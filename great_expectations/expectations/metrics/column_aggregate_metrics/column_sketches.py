@@ -0,0 +1,36 @@
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.metrics.column_aggregate_metric import (
+    ColumnMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.sketches import (
+    DEFAULT_SKETCH_RELATIVE_ERROR,
+    HyperLogLog,
+    KLLSketch,
+)
+
+
+class ColumnHyperLogLogSketch(ColumnMetricProvider):
+    """MetricProvider Class for a HyperLogLog sketch of the distinct values of a column"""
+
+    metric_name = "column.hll_sketch"
+    value_keys = ("relative_error",)
+    default_kwarg_values = {"relative_error": DEFAULT_SKETCH_RELATIVE_ERROR}
+    filter_column_isnull = True
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, relative_error=DEFAULT_SKETCH_RELATIVE_ERROR, **kwargs):
+        return HyperLogLog.for_relative_error(relative_error).update(column)
+
+
+class ColumnKLLSketch(ColumnMetricProvider):
+    """MetricProvider Class for a KLL sketch of the distribution of the values of a column"""
+
+    metric_name = "column.kll_sketch"
+    value_keys = ("relative_error",)
+    default_kwarg_values = {"relative_error": DEFAULT_SKETCH_RELATIVE_ERROR}
+    filter_column_isnull = True
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, relative_error=DEFAULT_SKETCH_RELATIVE_ERROR, **kwargs):
+        return KLLSketch.for_relative_error(relative_error).update(column)
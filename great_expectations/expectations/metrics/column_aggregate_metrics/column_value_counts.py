@@ -7,12 +7,21 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    GroupedValueCounts,
+)
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
-from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.metric_provider import (
+    metric_partial,
+    metric_value,
+)
 
 
 class ColumnValueCounts(ColumnMetricProvider):
@@ -61,7 +70,11 @@ class ColumnValueCounts(ColumnMetricProvider):
         counts.index.name = "value"
         return counts
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
+    @metric_partial(
+        engine=SqlAlchemyExecutionEngine,
+        partial_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
     def _sqlalchemy(
         cls,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -70,6 +83,8 @@ class ColumnValueCounts(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        """Value counts of the columns of a domain are computed together by a single grouped query (see
+        SqlAlchemyExecutionEngine.resolve_metric_bundle)"""
         sort = metric_value_kwargs.get("sort", cls.default_kwarg_values["sort"])
         collate = metric_value_kwargs.get(
             "collate", cls.default_kwarg_values["collate"]
@@ -80,44 +95,22 @@ class ColumnValueCounts(ColumnMetricProvider):
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")
 
-        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        (
+            _,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
             metric_domain_kwargs, MetricDomainTypes.COLUMN
         )
-        column = accessor_domain_kwargs["column"]
-
-        if sort not in ["value", "count", "none"]:
-            raise ValueError("sort must be either 'value', 'count', or 'none'")
-
-        query = (
-            sa.select(
-                [
-                    sa.column(column).label("value"),
-                    sa.func.count(sa.column(column)).label("count"),
-                ]
-            )
-            .where(sa.column(column) != None)
-            .group_by(sa.column(column))
-        )
-        if sort == "value":
-            # NOTE: depending on the way the underlying database collates columns,
-            # ordering can vary. postgresql collate "C" matches default sort
-            # for python and most other systems, but is not universally supported,
-            # so we use the default sort for the system, unless specifically overridden
-            if collate is not None:
-                query = query.order_by(sa.column(column).collate(collate))
-            else:
-                query = query.order_by(sa.column(column))
-        elif sort == "count":
-            query = query.order_by(sa.column("count").desc())
-        results = execution_engine.engine.execute(
-            query.select_from(selectable)
-        ).fetchall()
-        series = pd.Series(
-            [row[1] for row in results],
-            index=pd.Index(data=[row[0] for row in results], name="value"),
-            name="count",
+        return (
+            GroupedValueCounts(
+                column_name=accessor_domain_kwargs["column"],
+                sort=sort,
+                collate=collate,
+            ),
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
         )
-        return series
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -8,6 +8,7 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_unique_values
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -28,4 +29,4 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        return map_unique_values(column, is_parseable)
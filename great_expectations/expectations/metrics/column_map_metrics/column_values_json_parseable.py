@@ -9,6 +9,7 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_unique_values
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -23,7 +24,7 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except:
                 return False
 
-        return column.map(is_json)
+        return map_unique_values(column, is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
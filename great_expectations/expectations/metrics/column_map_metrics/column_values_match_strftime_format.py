@@ -9,6 +9,7 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_unique_values
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -28,7 +29,7 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        return column.map(is_parseable_by_format)
+        return map_unique_values(column, is_parseable_by_format)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
@@ -82,17 +82,16 @@ def column_function_partial(
                 )
 
                 (
-                    df,
+                    column_values,
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
-                ) = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                ) = execution_engine.get_column_domain_values(
+                    domain_kwargs=metric_domain_kwargs,
+                    filter_column_isnull=filter_column_isnull,
                 )
-                if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
                 values = metric_fn(
                     cls,
-                    df[accessor_domain_kwargs["column"]],
+                    column_values,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -278,18 +277,17 @@ def column_condition_partial(
                 )
 
                 (
-                    df,
+                    column_values,
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
-                ) = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                ) = execution_engine.get_column_domain_values(
+                    domain_kwargs=metric_domain_kwargs,
+                    filter_column_isnull=filter_column_isnull,
                 )
-                if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
 
                 meets_expectation_series = metric_fn(
                     cls,
-                    df[accessor_domain_kwargs["column"]],
+                    column_values,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -460,6 +458,21 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
+def _pandas_unexpected_positions(
+    boolean_mapped_unexpected_values, result_format: Optional[Dict] = None
+) -> np.ndarray:
+    """Returns the positions of unexpected values in a pandas map condition, limited to the partial_unexpected_count
+    of result_format unless the COMPLETE result format was requested."""
+    unexpected_positions = np.flatnonzero(
+        np.asarray(boolean_mapped_unexpected_values) == True
+    )
+    if result_format is not None and result_format["result_format"] != "COMPLETE":
+        unexpected_positions = unexpected_positions[
+            : result_format["partial_unexpected_count"]
+        ]
+    return unexpected_positions
+
+
 def _pandas_column_map_condition_values(
     cls,
     execution_engine: "PandasExecutionEngine",
@@ -474,9 +487,10 @@ def _pandas_column_map_condition_values(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics["unexpected_condition"]
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            "_pandas_column_map_condition_values requires a column in accessor_domain_kwargs"
+        )
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -485,25 +499,14 @@ def _pandas_column_map_condition_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
-        raise ValueError(
-            "_pandas_column_map_condition_values requires a column in accessor_domain_kwargs"
-        )
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(domain_values[boolean_map_unexpected_values == True])
-    else:
-        return list(
-            domain_values[boolean_map_unexpected_values == True][
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    domain_values, _, _ = execution_engine.get_column_domain_values(
+        domain_kwargs={**compute_domain_kwargs, **accessor_domain_kwargs},
+        filter_column_isnull=filter_column_isnull,
+        positions=_pandas_unexpected_positions(
+            boolean_map_unexpected_values, metric_value_kwargs["result_format"]
+        ),
+    )
+    return list(domain_values)
 
 
 def _pandas_column_map_series_and_domain_values(
@@ -531,9 +534,10 @@ def _pandas_column_map_series_and_domain_values(
     assert (
         accessor_domain_kwargs == accessor_domain_kwargs_2
     ), "map_series and condition must have the same accessor kwargs"
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            "_pandas_column_map_series_and_domain_values requires a column in accessor_domain_kwargs"
+        )
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -542,35 +546,18 @@ def _pandas_column_map_series_and_domain_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
-        raise ValueError(
-            "_pandas_column_map_series_and_domain_values requires a column in accessor_domain_kwargs"
-        )
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return (
-            list(domain_values[boolean_map_unexpected_values == True]),
-            list(map_series[boolean_map_unexpected_values == True]),
-        )
-    else:
-        return (
-            list(
-                domain_values[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-            list(
-                map_series[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-        )
+    unexpected_positions = _pandas_unexpected_positions(
+        boolean_map_unexpected_values, metric_value_kwargs["result_format"]
+    )
+    domain_values, _, _ = execution_engine.get_column_domain_values(
+        domain_kwargs={**compute_domain_kwargs, **accessor_domain_kwargs},
+        filter_column_isnull=filter_column_isnull,
+        positions=unexpected_positions,
+    )
+    return (
+        list(domain_values),
+        list(map_series.iloc[unexpected_positions]),
+    )
 
 
 def _pandas_map_condition_index(
@@ -586,10 +573,6 @@ def _pandas_map_condition_index(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -598,19 +581,14 @@ def _pandas_map_condition_index(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(df[boolean_mapped_unexpected_values == True].index)
-    else:
-        return list(
-            df[boolean_mapped_unexpected_values == True].index[
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    domain_values, _, _ = execution_engine.get_column_domain_values(
+        domain_kwargs={**compute_domain_kwargs, **accessor_domain_kwargs},
+        filter_column_isnull=filter_column_isnull,
+        positions=_pandas_unexpected_positions(
+            boolean_mapped_unexpected_values, metric_value_kwargs["result_format"]
+        ),
+    )
+    return list(domain_values.index)
 
 
 def _pandas_column_map_condition_value_counts(
@@ -627,10 +605,10 @@ def _pandas_column_map_condition_value_counts(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            "_pandas_column_map_condition_value_counts requires a column in accessor_domain_kwargs"
+        )
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -639,39 +617,29 @@ def _pandas_column_map_condition_value_counts(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
-        raise ValueError(
-            "_pandas_column_map_condition_value_counts requires a column in accessor_domain_kwargs"
-        )
+    domain_values, _, _ = execution_engine.get_column_domain_values(
+        domain_kwargs={**compute_domain_kwargs, **accessor_domain_kwargs},
+        filter_column_isnull=filter_column_isnull,
+        positions=_pandas_unexpected_positions(boolean_mapped_unexpected_values),
+    )
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
     try:
-        value_counts = domain_values[
-            boolean_mapped_unexpected_values == True
-        ].value_counts()
+        value_counts = domain_values.value_counts()
     except ValueError:
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values == True]
-                .apply(tuple)
-                .value_counts()
-            )
+            value_counts = domain_values.apply(tuple).value_counts()
         except ValueError:
             pass
 
-    if not value_counts:
+    if value_counts is None:
         raise MetricError("Unable to compute value counts")
 
     if result_format["result_format"] == "COMPLETE":
         return value_counts
     else:
-        return value_counts[result_format["partial_unexpected_count"]]
+        return value_counts[: result_format["partial_unexpected_count"]]
 
 
 def _pandas_map_condition_rows(
@@ -688,10 +656,6 @@ def _pandas_map_condition_rows(
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -700,17 +664,13 @@ def _pandas_map_condition_rows(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return df[boolean_mapped_unexpected_values == True]
-    else:
-        return df[boolean_mapped_unexpected_values == True][
-            result_format["partial_unexpected_count"]
-        ]
+    return execution_engine.get_column_domain_rows(
+        domain_kwargs={**compute_domain_kwargs, **accessor_domain_kwargs},
+        filter_column_isnull=filter_column_isnull,
+        positions=_pandas_unexpected_positions(
+            boolean_mapped_unexpected_values, metric_value_kwargs["result_format"]
+        ),
+    )
 
 
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
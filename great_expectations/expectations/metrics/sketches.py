@@ -0,0 +1,264 @@
+"""Mergeable sketches for approximate metrics.
+
+A sketch summarizes the values of a column in bounded memory, and sketches built on separate parts of a column (chunks of
+a file, partitions of a dataframe) can be merged into the sketch of the whole column.
+"""
+import math
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# The relative error of approximate metrics whose expectation asks for an approximation without bounding its error
+DEFAULT_SKETCH_RELATIVE_ERROR = 0.01
+
+
+def get_sketch_relative_error(approximate) -> Optional[float]:
+    """Returns the relative error allowed by the approximate (or allow_relative_error) kwarg of an expectation: None for
+    False or 0 (exact metrics), DEFAULT_SKETCH_RELATIVE_ERROR for True, or the given number."""
+    if not approximate:
+        return None
+    if approximate is True:
+        return DEFAULT_SKETCH_RELATIVE_ERROR
+    if isinstance(approximate, (int, float)) and 0 < approximate < 1:
+        return float(approximate)
+    raise ValueError(
+        f"An approximation must be allowed with True or with a relative error between 0 and 1, not {approximate}."
+    )
+
+
+def _leading_zeros(words: np.ndarray) -> np.ndarray:
+    """Returns the number of leading zero bits of each of an array of uint64."""
+    words = words.copy()
+    leading_zeros = np.zeros(len(words), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        has_leading_zeros = words < (np.uint64(1) << np.uint64(64 - shift))
+        leading_zeros[has_leading_zeros] += shift
+        words[has_leading_zeros] <<= np.uint64(shift)
+    leading_zeros[words == 0] = 64
+    return leading_zeros
+
+
+def _get_canonical_values(values: pd.Series) -> pd.Series:
+    """Returns values in a form whose hashes do not depend on the dtype they were read with: numbers are hashed as
+    float64, so that 1 (read as int64 from a chunk without nulls) and 1.0 (read as float64 from a chunk with nulls) are
+    the same value."""
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return values
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        # (adding 0.0 also turns -0.0 into 0.0)
+        return values.astype(np.float64) + 0.0
+    if values.dtype == object:
+        is_number = values.map(
+            lambda value: isinstance(value, (int, float, np.number))
+            and not isinstance(value, (bool, np.bool_))
+        )
+        if is_number.all():
+            return values.astype(np.float64) + 0.0
+        return values.where(~is_number, values[is_number].astype(np.float64) + 0.0)
+    return values
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch of the distinct values of a column (Flajolet et al., 2007).
+
+    The count of distinct values it estimates has a relative standard error of 1.04 / sqrt(2 ** precision). Values are
+    hashed with pandas.util.hash_pandas_object, so that sketches built in separate processes can be merged, in a
+    canonical form, so that sketches of the same values read with different dtypes (such as the chunks of a file, with
+    and without nulls) can be merged too.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18.")
+        self._precision = precision
+        self._registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @classmethod
+    def for_relative_error(cls, relative_error: float) -> "HyperLogLog":
+        """Returns an empty sketch whose estimates have at most the given relative standard error."""
+        precision = math.ceil(2 * math.log2(1.04 / relative_error))
+        return cls(precision=min(max(precision, 4), 18))
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values: Iterable) -> "HyperLogLog":
+        """Adds values (other than nulls, which are expected to have been filtered out) to the sketch."""
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values)
+        if len(values) == 0:
+            return self
+        hashes = pd.util.hash_pandas_object(
+            _get_canonical_values(values), index=False
+        ).values
+        registers = hashes >> np.uint64(64 - self._precision)
+        ranks = np.minimum(
+            _leading_zeros(hashes << np.uint64(self._precision)) + 1,
+            64 - self._precision + 1,
+        ).astype(np.uint8)
+        max_ranks = pd.Series(ranks).groupby(registers).max()
+        self._registers[max_ranks.index.values] = np.maximum(
+            self._registers[max_ranks.index.values], max_ranks.values
+        )
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Returns the sketch of the union of the values of both sketches."""
+        if other.precision != self.precision:
+            raise ValueError(
+                "Only HyperLogLog sketches of the same precision can be merged."
+            )
+        merged = HyperLogLog(precision=self._precision)
+        merged._registers = np.maximum(self._registers, other._registers)
+        return merged
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct values."""
+        num_registers = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = (
+            alpha
+            * num_registers ** 2
+            / np.sum(np.exp2(-self._registers.astype(np.float64)))
+        )
+        num_empty_registers = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = num_registers * math.log(num_registers / num_empty_registers)
+        return int(round(estimate))
+
+
+class KLLSketch:
+    """A KLL sketch of the distribution of the values of a column (Karnin, Lang and Liberty, 2016).
+
+    The sketch keeps a hierarchy of compactors: the items of level h each stand for 2 ** h values of the column, and a
+    level holding more items than its capacity is sorted and half of its items (the odd or the even ones, at random)
+    are promoted to the next level. The rank of a value estimated from the sketch is off by about 2 / k of the number
+    of values at most.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        if k < 8:
+            raise ValueError("KLL sketches require k to be at least 8.")
+        self._k = k
+        self._levels = [np.array([])]
+        self._count = 0
+        self._min = None
+        self._max = None
+        self._random_state = np.random.RandomState(seed)
+
+    @classmethod
+    def for_relative_error(cls, relative_error: float) -> "KLLSketch":
+        """Returns an empty sketch whose quantiles have at most the given relative rank error."""
+        return cls(k=max(math.ceil(2 / relative_error), 8))
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """The number of values added to the sketch."""
+        return self._count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(int(math.ceil(self._k * (2 / 3) ** depth)), 2)
+
+    def _compact(self, items: np.ndarray) -> np.ndarray:
+        """Returns every other item of the sorted items, starting at random from the first or the second."""
+        return items[self._random_state.randint(2) :: 2]
+
+    def update(self, values: Iterable) -> "KLLSketch":
+        """Adds values (other than nulls, which are expected to have been filtered out) to the sketch."""
+        items = np.sort(np.asarray(values))
+        if len(items) == 0:
+            return self
+        self._count += len(items)
+        self._min = items[0] if self._min is None else min(self._min, items[0])
+        self._max = items[-1] if self._max is None else max(self._max, items[-1])
+
+        # Compact the (sorted) values until they fit in the level they are added to, rather than adding them to the
+        # first level one compaction at a time.
+        level = 0
+        while len(items) > self._k:
+            if len(items) % 2 == 1:
+                self._add_items(level, items[-1:])
+                items = items[:-1]
+            items = self._compact(items)
+            level += 1
+        self._add_items(level, items)
+        self._compress()
+        return self
+
+    def _add_items(self, level: int, items: np.ndarray) -> None:
+        while len(self._levels) <= level:
+            self._levels.append(np.array([]))
+        if len(self._levels[level]) == 0:
+            self._levels[level] = items
+        else:
+            self._levels[level] = np.concatenate([self._levels[level], items])
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                if len(items) % 2 == 1:
+                    self._levels[level] = items[-1:]
+                    items = items[:-1]
+                else:
+                    self._levels[level] = items[:0]
+                self._add_items(level + 1, self._compact(items))
+            level += 1
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Returns the sketch of the union of the values of both sketches."""
+        merged = KLLSketch(k=min(self._k, other.k))
+        merged._random_state = self._random_state
+        for sketch in (self, other):
+            for level, items in enumerate(sketch._levels):
+                merged._add_items(level, items)
+        merged._count = self._count + other._count
+        minima = [value for value in (self._min, other._min) if value is not None]
+        maxima = [value for value in (self._max, other._max) if value is not None]
+        merged._min = min(minima) if minima else None
+        merged._max = max(maxima) if maxima else None
+        merged._compress()
+        return merged
+
+    def quantiles(self, quantiles: Iterable[float]) -> List:
+        """Returns the values of the sketch whose estimated ranks are the closest above the given quantiles."""
+        quantiles = list(quantiles)
+        if self._count == 0:
+            return [None] * len(quantiles)
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(items), 2 ** level)
+                for level, items in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(items, kind="mergesort")
+        items = items[order]
+        cumulative_weights = np.cumsum(weights[order])
+        values = []
+        for quantile in quantiles:
+            if quantile <= 0:
+                value = self._min
+            elif quantile >= 1:
+                value = self._max
+            else:
+                position = np.searchsorted(
+                    cumulative_weights, quantile * cumulative_weights[-1], side="left"
+                )
+                value = items[min(position, len(items) - 1)]
+            values.append(value.item() if isinstance(value, np.generic) else value)
+        return values
@@ -1,5 +1,6 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
+from great_expectations.core.sqlalchemy_schema_cache import SqlAlchemySchemaCache
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -65,7 +66,11 @@ class ColumnTypes(TableMetricProvider):
             raise GreatExpectationsError(
                 "the requested batch is not available; please load the batch into the execution engine."
             )
-        return _get_sqlalchemy_column_metadata(execution_engine.engine, batch_data)
+        return _get_sqlalchemy_column_metadata(
+            execution_engine.engine,
+            batch_data,
+            schema_cache=getattr(execution_engine, "schema_cache", None),
+        )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -84,36 +89,50 @@ class ColumnTypes(TableMetricProvider):
         )
 
 
-def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
-    insp = reflection.Inspector.from_engine(engine)
-
+def _get_sqlalchemy_column_metadata(
+    engine,
+    batch_data: SqlAlchemyBatchData,
+    schema_cache: Optional[SqlAlchemySchemaCache] = None,
+):
     table_name = batch_data.source_table_name or batch_data.selectable.name
     schema_name = batch_data.source_schema_name or batch_data.selectable.schema
 
-    try:
-        columns = insp.get_columns(
-            table_name,
-            schema=schema_name,
-        )
+    def reflect_columns():
+        insp = reflection.Inspector.from_engine(engine)
+        try:
+            columns = insp.get_columns(
+                table_name,
+                schema=schema_name,
+            )
 
-    except (KeyError, AttributeError, sa.exc.NoSuchTableError):
-        # we will get a KeyError for temporary tables, since
-        # reflection will not find the temporary schema
-        columns = column_reflection_fallback(
-            selectable=batch_data.selectable,
-            dialect=batch_data.sql_engine_dialect,
-            sqlalchemy_engine=engine,
-        )
+        except (KeyError, AttributeError, sa.exc.NoSuchTableError):
+            # we will get a KeyError for temporary tables, since
+            # reflection will not find the temporary schema
+            columns = column_reflection_fallback(
+                selectable=batch_data.selectable,
+                dialect=batch_data.sql_engine_dialect,
+                sqlalchemy_engine=engine,
+            )
 
-    # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
-    if len(columns) == 0:
-        columns = column_reflection_fallback(
-            selectable=batch_data.selectable,
-            dialect=batch_data.sql_engine_dialect,
-            sqlalchemy_engine=engine,
-        )
+        # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
+        if len(columns) == 0:
+            columns = column_reflection_fallback(
+                selectable=batch_data.selectable,
+                dialect=batch_data.sql_engine_dialect,
+                sqlalchemy_engine=engine,
+            )
+
+        return columns
+
+    if batch_data.source_table_name is None:
+        # The batch is a query, or a temporary table of its own: there is no table whose columns could be reused
+        return reflect_columns()
 
-    return columns
+    if schema_cache is None:
+        return reflect_columns()
+    return schema_cache.get_columns(
+        engine, table_name, schema_name=schema_name, reflect=reflect_columns
+    )
 
 
 def _get_spark_column_metadata(field, parent_name="", include_nested=True):
@@ -19,6 +19,17 @@ except ImportError:
     sparktypes = None
 
 
+def _get_source_columns(execution_engine, metric_domain_kwargs):
+    """Return the columns of the batch's source if the batch was loaded with a column projection, or None."""
+    if "batch_data" in metric_domain_kwargs:
+        return None
+    batch_id = (
+        metric_domain_kwargs.get("batch_id") or execution_engine.active_batch_data_id
+    )
+    batch_data = execution_engine.loaded_batch_data_dict.get(batch_id)
+    return getattr(batch_data, "source_columns", None)
+
+
 class TableColumns(TableMetricProvider):
     metric_name = "table.columns"
 
@@ -31,6 +42,9 @@ class TableColumns(TableMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        source_columns = _get_source_columns(execution_engine, metric_domain_kwargs)
+        if source_columns is not None:
+            return list(source_columns)
         column_metadata = metrics["table.column_types"]
         return [col["name"] for col in column_metadata]
 
@@ -55,6 +69,9 @@ class TableColumns(TableMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
+        source_columns = _get_source_columns(execution_engine, metric_domain_kwargs)
+        if source_columns is not None:
+            return list(source_columns)
         column_metadata = metrics["table.column_types"]
         return [col["name"] for col in column_metadata]
 
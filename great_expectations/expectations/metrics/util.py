@@ -253,6 +253,18 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def map_unique_values(column, fn):
+    """Applies fn to each distinct value of a pandas Series, rather than to every row, and maps the results back onto
+    the Series. Falls back to Series.map if the values are not hashable or are all distinct."""
+    try:
+        unique_values = column.unique()
+    except TypeError:
+        return column.map(fn)
+    if len(unique_values) == len(column):
+        return column.map(fn)
+    return column.map({value: fn(value) for value in unique_values})
+
+
 def filter_pair_metric_nulls(column_A, column_B, ignore_row_if):
     if ignore_row_if == "both_values_are_missing":
         boolean_mapped_null_values = column_A.isnull() & column_B.isnull()
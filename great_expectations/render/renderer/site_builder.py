@@ -1,10 +1,13 @@
+import hashlib
+import json
 import logging
 import os
 import traceback
 from collections import OrderedDict
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core.util import nested_update
+from great_expectations import __version__ as ge_version
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
@@ -29,6 +32,14 @@ FALSEY_YAML_STRINGS = [
 ]
 
 
+def _get_content_hash(serialized_resource, render_fingerprint):
+    if not isinstance(serialized_resource, bytes):
+        serialized_resource = str(serialized_resource).encode("utf-8")
+    content_hash = hashlib.md5(serialized_resource)
+    content_hash.update(render_fingerprint.encode("utf-8"))
+    return content_hash.hexdigest()
+
+
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
     DataContext.
@@ -295,6 +306,7 @@ class SiteBuilder:
         index_page_url, index_links_dict = self.site_index_builder.build(
             build_index=build_index
         )
+        self.target_store.write_site_manifest()
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -384,13 +396,53 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
+        # pages are rendered again whenever anything that goes into rendering them, other than the resource, changes
+        self._render_fingerprint = json.dumps(
+            [
+                ge_version,
+                renderer,
+                view,
+                custom_styles_directory,
+                custom_views_directory,
+                data_context_id,
+                show_how_to_buttons,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
     def build(self, resource_identifiers=None):
-        source_store_keys = self.source_store.list_keys()
+        # versions (such as ETags or modification times) come with the key listing, so that unchanged resources whose
+        # pages exist are skipped without being fetched
+        source_store_key_versions = self.source_store.list_keys_with_versions()
+        source_store_keys = list(source_store_key_versions.keys())
+        site_section_manifest = self.target_store.get_site_section_manifest(self.name)
+        if not resource_identifiers:
+            # drop the manifest entries of resources that were removed from the source store
+            source_manifest_keys = {
+                self.target_store.manifest_key_for_resource(resource_key)
+                for resource_key in source_store_keys
+            }
+            for manifest_key in list(site_section_manifest.keys()):
+                if manifest_key not in source_manifest_keys:
+                    del site_section_manifest[manifest_key]
+
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        # pages already present in the site; listed once so that pages removed from the target store get rebuilt
+        site_keys = set()
+        for resource_key_class in {
+            type(resource_key) for resource_key in source_store_keys
+        }:
+            if resource_key_class in self.target_store.store_backends:
+                site_keys.update(
+                    self.target_store.store_backends[resource_key_class].list_keys()
+                )
+
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -405,14 +457,59 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-            except exceptions.InvalidKeyError:
+            manifest_entry = site_section_manifest.get(
+                self.target_store.manifest_key_for_resource(resource_key)
+            )
+            source_version = self._get_source_version(
+                source_store_key_versions[resource_key]
+            )
+            if (
+                manifest_entry
+                and source_version is not None
+                and manifest_entry.get("source_version") == source_version
+                and resource_key.to_tuple() in site_keys
+            ):
+                logger.debug(
+                    "        Skipping unchanged resource {}".format(resource_key)
+                )
+                continue
+            resource_keys.append(resource_key)
+
+        for resource_key, serialized_resource, found in self._get_serialized_resources(
+            resource_keys
+        ):
+            if not found:
                 logger.warning(
                     f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
                 )
                 continue
 
+            manifest_key = self.target_store.manifest_key_for_resource(resource_key)
+            content_hash = _get_content_hash(
+                serialized_resource, self._render_fingerprint
+            )
+            source_version = self._get_source_version(
+                source_store_key_versions[resource_key]
+            )
+            manifest_entry = site_section_manifest.get(manifest_key)
+            if (
+                manifest_entry
+                and manifest_entry.get("content_hash") == content_hash
+                and resource_key.to_tuple() in site_keys
+            ):
+                # the resource was rewritten with the same content
+                manifest_entry["source_version"] = source_version
+                logger.debug(
+                    "        Skipping unchanged resource {}".format(manifest_key)
+                )
+                continue
+
+            resource = (
+                self.source_store.deserialize(resource_key, serialized_resource)
+                if serialized_resource
+                else None
+            )
+
             if isinstance(resource_key, ExpectationSuiteIdentifier):
                 expectation_suite_name = resource_key.expectation_suite_name
                 logger.debug(
@@ -459,6 +556,9 @@ class DefaultSiteSectionBuilder:
                     ),
                     viewable_content,
                 )
+                site_section_manifest[manifest_key] = self._get_manifest_entry(
+                    resource_key, resource, content_hash, source_version
+                )
             except Exception as e:
                 exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
@@ -472,6 +572,56 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 )
                 logger.error(exception_message)
 
+    def _get_serialized_resources(self, resource_keys):
+        """Yields (resource key, serialized resource, whether it was found) for each of resource_keys.
+
+        Resources are fetched from the source store in chunks of as many keys as its backend reads at once, each chunk
+        once the resources of the previous one have been rendered, so that only a chunk of them is held in memory.
+        """
+        store_backend = self.source_store.store_backend
+        chunk_size = max(store_backend.bulk_max_workers, 1)
+        for start in range(0, len(resource_keys), chunk_size):
+            chunk = resource_keys[start : start + chunk_size]
+            source_tuple_keys = [
+                self.source_store.key_to_tuple(resource_key) for resource_key in chunk
+            ]
+            try:
+                serialized_resources = store_backend.get_many(source_tuple_keys)
+                errors = {}
+            except exceptions.StoreBackendBulkOperationError as e:
+                serialized_resources = e.results
+                errors = e.errors
+                for error in errors.values():
+                    if not isinstance(error, exceptions.InvalidKeyError):
+                        raise error
+            for resource_key, source_tuple_key, serialized_resource in zip(
+                chunk, source_tuple_keys, serialized_resources
+            ):
+                yield resource_key, serialized_resource, source_tuple_key not in errors
+
+    def _get_source_version(self, version):
+        """Return the version of a source resource combined with the render fingerprint, or None if it has no version."""
+        if version is None:
+            return None
+        return _get_content_hash(str(version).encode("utf-8"), self._render_fingerprint)
+
+    @staticmethod
+    def _get_manifest_entry(resource_key, resource, content_hash, source_version=None):
+        """Return the site manifest entry for a rendered resource, including the metadata the index page needs."""
+        manifest_entry = {
+            "content_hash": content_hash,
+            "source_version": source_version,
+        }
+        if isinstance(resource_key, ValidationResultIdentifier):
+            manifest_entry["validation_success"] = resource.success
+            manifest_entry["batch_kwargs"] = convert_to_json_serializable(
+                resource.meta.get("batch_kwargs", {})
+            )
+            manifest_entry["batch_spec"] = convert_to_json_serializable(
+                resource.meta.get("batch_spec", {})
+            )
+        return manifest_entry
+
 
 class DefaultSiteIndexBuilder:
     def __init__(
@@ -688,6 +838,33 @@ class DefaultSiteIndexBuilder:
 
         return results
 
+    def _get_validation_result_info(self, validation_result_key, section_name):
+        """
+        Return the (success, batch_kwargs, batch_spec) of a validation result, reading them from the site manifest
+        when the result's page was rendered by a manifest-aware section builder, and from the source store otherwise.
+        """
+        manifest_entry = self.target_store.get_site_section_manifest(section_name).get(
+            self.target_store.manifest_key_for_resource(validation_result_key)
+        )
+        if manifest_entry and "validation_success" in manifest_entry:
+            return (
+                manifest_entry["validation_success"],
+                manifest_entry.get("batch_kwargs", {}),
+                manifest_entry.get("batch_spec", {}),
+            )
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        return (
+            validation.success,
+            validation.meta.get("batch_kwargs", {}),
+            validation.meta.get("batch_spec", {}),
+        )
+
     # TODO: deprecate dual batch api support
     def build(self, skip_and_clean_missing=True, build_index: bool = True):
         """
@@ -805,16 +982,10 @@ class DefaultSiteIndexBuilder:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    _, batch_kwargs, batch_spec = self._get_validation_result_info(
+                        profiling_result_key, "profiling"
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
@@ -861,17 +1032,14 @@ class DefaultSiteIndexBuilder:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    (
+                        validation_success,
+                        batch_kwargs,
+                        batch_spec,
+                    ) = self._get_validation_result_info(
+                        validation_result_key, "validations"
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
@@ -1,6 +1,8 @@
 import logging
+import threading
 import warnings
 from collections import OrderedDict
+from typing import Dict, List
 
 from dateutil.parser import parse
 
@@ -16,6 +18,7 @@ from great_expectations.exceptions import ClassInstantiationError
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
+from great_expectations.validator.validator import Validator
 
 from ..core.run_identifier import RunIdentifier
 
@@ -190,10 +193,16 @@ class ActionListValidationOperator(ValidationOperator):
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        action_lock=None,
+        action_pipeline=None,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
+        # Held while running the actions of a validation; operators that validate concurrently share one
+        self._action_lock = action_lock or threading.Lock()
+        # An ActionPipeline deferring the slow actions to when its owner flushes it; actions run at once if None
+        self._action_pipeline = action_pipeline
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -306,9 +315,12 @@ class ActionListValidationOperator(ValidationOperator):
 
         run_results = {}
 
-        for item in assets_to_validate:
+        batches = [self._build_batch_from_item(item) for item in assets_to_validate]
+        shared_batch_groups = self._get_shared_batch_groups(batches)
+        shared_batch_validation_results = {}
+
+        for idx, batch in enumerate(batches):
             run_result_obj = {}
-            batch = self._build_batch_from_item(item)
 
             if hasattr(batch, "active_batch_id"):
                 batch_identifier = batch.active_batch_id
@@ -323,19 +335,37 @@ class ActionListValidationOperator(ValidationOperator):
                 expectation_suite_identifier=expectation_suite_identifier,
                 run_id=run_id,
             )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
-            )
+            if idx in shared_batch_groups:
+                shared_batch_validation_results.update(
+                    self._validate_shared_batch(
+                        batches,
+                        shared_batch_groups[idx],
+                        run_id=run_id,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
+                    )
+                )
+            if idx in shared_batch_validation_results:
+                batch_validation_result = shared_batch_validation_results.pop(idx)
+            else:
+                batch_validation_result = batch.validate(
+                    run_id=run_id,
+                    result_format=result_format
+                    if result_format
+                    else self.result_format,
+                    evaluation_parameters=evaluation_parameters,
+                )
             run_result_obj["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(
-                batch,
-                expectation_suite_identifier,
-                batch._expectation_suite,
-                batch_validation_result,
-                run_id,
-            )
+            with self._action_lock:
+                batch_actions_results = self._run_actions(
+                    batch,
+                    expectation_suite_identifier,
+                    batch._expectation_suite,
+                    batch_validation_result,
+                    run_id,
+                )
 
             run_result_obj["actions_results"] = batch_actions_results
             run_results[validation_result_id] = run_result_obj
@@ -347,6 +377,50 @@ class ActionListValidationOperator(ValidationOperator):
             evaluation_parameters=evaluation_parameters,
         )
 
+    @staticmethod
+    def _get_shared_batch_groups(batches) -> Dict[int, List[int]]:
+        """Groups the Validators that share an execution engine and a batch (e.g. those returned by
+        DataContext.get_validators), so that each group is validated in a single pass over the batch, which computes
+        the metrics their suites share only once.
+
+        Suites that depend on evaluation parameters from other validations are validated on their own, once the
+        actions of the validations before them (which may store those parameters) have run.
+
+        Returns:
+            The indexes of the batches of each group of two or more, by the index of its first batch
+        """
+        groups = OrderedDict()
+        for idx, batch in enumerate(batches):
+            if (
+                isinstance(batch, Validator)
+                and not batch._expectation_suite.get_evaluation_parameter_dependencies()
+            ):
+                key = (id(batch.execution_engine), tuple(sorted(batch.batches)))
+                groups.setdefault(key, []).append(idx)
+        return {idxs[0]: idxs for idxs in groups.values() if len(idxs) > 1}
+
+    @staticmethod
+    def _validate_shared_batch(
+        batches, idxs, run_id, result_format, evaluation_parameters
+    ) -> dict:
+        """Validates the Validators with the given indexes together, returning their results by index."""
+        validators = [batches[idx] for idx in idxs]
+        suite_validation_results = validators[0].validate_suites(
+            [
+                validator.get_expectation_suite(
+                    discard_failed_expectations=False,
+                    discard_result_format_kwargs=False,
+                    discard_include_config_kwargs=False,
+                    discard_catch_exceptions_kwargs=False,
+                )
+                for validator in validators
+            ],
+            run_id=run_id,
+            result_format=result_format,
+            evaluation_parameters=evaluation_parameters,
+        )
+        return dict(zip(idxs, suite_validation_results))
+
     def _run_actions(
         self,
         batch,
@@ -359,7 +433,9 @@ class ActionListValidationOperator(ValidationOperator):
         Runs all actions configured for this operator on the result of validating one
         batch against one expectation suite.
 
-        If an action fails with an exception, the method does not continue.
+        If an action fails with an exception, the method does not continue. Actions deferred
+        by the action pipeline of the operator (if any) return results that are filled in
+        when the pipeline is flushed.
 
         :param batch:
         :param expectation_suite:
@@ -385,12 +461,21 @@ class ActionListValidationOperator(ValidationOperator):
                 batch_identifier=batch_identifier,
             )
             try:
-                action_result = self.actions[action["name"]].run(
-                    validation_result_suite_identifier=validation_result_id,
-                    validation_result_suite=batch_validation_result,
-                    data_asset=batch,
-                    payload=batch_actions_results,
-                )
+                if self._action_pipeline is None:
+                    action_result = self.actions[action["name"]].run(
+                        validation_result_suite_identifier=validation_result_id,
+                        validation_result_suite=batch_validation_result,
+                        data_asset=batch,
+                        payload=batch_actions_results,
+                    )
+                else:
+                    action_result = self._action_pipeline.run_action(
+                        self.actions[action["name"]],
+                        validation_result_suite_identifier=validation_result_id,
+                        validation_result_suite=batch_validation_result,
+                        data_asset=batch,
+                        payload=batch_actions_results,
+                    )
 
                 # add action_result
                 batch_actions_results[action["name"]] = (
@@ -741,7 +826,10 @@ class WarningAndFailureExpectationSuitesValidationOperator(
         for item in assets_to_validate:
             batch = self._build_batch_from_item(item)
 
-            batch_id = batch.batch_id
+            if hasattr(batch, "active_batch_id"):
+                batch_id = batch.active_batch_id
+            else:
+                batch_id = batch.batch_id
             run_id = run_id
 
             assert not batch_id is None
@@ -775,29 +863,6 @@ class WarningAndFailureExpectationSuitesValidationOperator(
                     )
                 )
 
-            if failure_expectation_suite:
-                failure_run_result_obj = {"expectation_suite_severity_level": "failure"}
-                failure_validation_result = batch.validate(
-                    failure_expectation_suite,
-                    result_format=result_format
-                    if result_format
-                    else self.result_format,
-                    evaluation_parameters=evaluation_parameters,
-                )
-                failure_run_result_obj["validation_result"] = failure_validation_result
-                failure_actions_results = self._run_actions(
-                    batch,
-                    failure_expectation_suite_identifier,
-                    failure_expectation_suite,
-                    failure_validation_result,
-                    run_id,
-                )
-                failure_run_result_obj["actions_results"] = failure_actions_results
-                run_results[failure_validation_result_id] = failure_run_result_obj
-
-                if not failure_validation_result.success and self.stop_on_first_error:
-                    break
-
             warning_expectation_suite_identifier = ExpectationSuiteIdentifier(
                 expectation_suite_name=base_expectation_suite_name
                 + self.expectation_suite_name_suffixes[1]
@@ -806,7 +871,7 @@ class WarningAndFailureExpectationSuitesValidationOperator(
             warning_validation_result_id = ValidationResultIdentifier(
                 expectation_suite_identifier=warning_expectation_suite_identifier,
                 run_id=run_id,
-                batch_identifier=batch.batch_id,
+                batch_identifier=batch_id,
             )
 
             warning_expectation_suite = None
@@ -821,15 +886,62 @@ class WarningAndFailureExpectationSuitesValidationOperator(
                     )
                 )
 
-            if warning_expectation_suite:
-                warning_run_result_obj = {"expectation_suite_severity_level": "warning"}
-                warning_validation_result = batch.validate(
-                    warning_expectation_suite,
+            # A Validator validates both suites in a single pass over the batch, unless the warning suite is only to be
+            # validated if the failure suite succeeds, or depends on evaluation parameters the failure suite stores
+            failure_validation_result = None
+            warning_validation_result = None
+            if (
+                isinstance(batch, Validator)
+                and failure_expectation_suite
+                and warning_expectation_suite
+                and not self.stop_on_first_error
+                and not warning_expectation_suite.get_evaluation_parameter_dependencies()
+            ):
+                (
+                    failure_validation_result,
+                    warning_validation_result,
+                ) = batch.validate_suites(
+                    [failure_expectation_suite, warning_expectation_suite],
                     result_format=result_format
                     if result_format
                     else self.result_format,
                     evaluation_parameters=evaluation_parameters,
                 )
+
+            if failure_expectation_suite:
+                failure_run_result_obj = {"expectation_suite_severity_level": "failure"}
+                if failure_validation_result is None:
+                    failure_validation_result = batch.validate(
+                        failure_expectation_suite,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
+                    )
+                failure_run_result_obj["validation_result"] = failure_validation_result
+                failure_actions_results = self._run_actions(
+                    batch,
+                    failure_expectation_suite_identifier,
+                    failure_expectation_suite,
+                    failure_validation_result,
+                    run_id,
+                )
+                failure_run_result_obj["actions_results"] = failure_actions_results
+                run_results[failure_validation_result_id] = failure_run_result_obj
+
+                if not failure_validation_result.success and self.stop_on_first_error:
+                    break
+
+            if warning_expectation_suite:
+                warning_run_result_obj = {"expectation_suite_severity_level": "warning"}
+                if warning_validation_result is None:
+                    warning_validation_result = batch.validate(
+                        warning_expectation_suite,
+                        result_format=result_format
+                        if result_format
+                        else self.result_format,
+                        evaluation_parameters=evaluation_parameters,
+                    )
                 warning_run_result_obj["validation_result"] = warning_validation_result
                 warning_actions_results = self._run_actions(
                     batch,
@@ -1,7 +1,9 @@
 import copy
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Container, Deque, Dict, List, Optional, Set, Tuple
 
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import MetricKwargs
+from great_expectations.exceptions.metric_exceptions import MetricResolutionError
 
 
 class MetricConfiguration:
@@ -13,17 +15,27 @@ class MetricConfiguration:
         metric_dependencies: dict = None,
     ):
         self._metric_name = metric_name
-        if not isinstance(metric_domain_kwargs, IDDict):
-            metric_domain_kwargs = IDDict(metric_domain_kwargs)
+        if not isinstance(metric_domain_kwargs, MetricKwargs):
+            metric_domain_kwargs = MetricKwargs(metric_domain_kwargs)
         self._metric_domain_kwargs = metric_domain_kwargs
-        if not isinstance(metric_value_kwargs, IDDict):
+        if not isinstance(metric_value_kwargs, MetricKwargs):
             if metric_value_kwargs is None:
                 metric_value_kwargs = dict()
-            metric_value_kwargs = IDDict(metric_value_kwargs)
+            metric_value_kwargs = MetricKwargs(metric_value_kwargs)
         self._metric_value_kwargs = metric_value_kwargs
         if metric_dependencies is None:
             metric_dependencies = dict()
         self.metric_dependencies = metric_dependencies
+        self._id = None
+
+    def __deepcopy__(self, memo):
+        # copies of MetricKwargs are plain dicts, which the copy wraps again
+        return MetricConfiguration(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=copy.deepcopy(self.metric_domain_kwargs, memo),
+            metric_value_kwargs=copy.deepcopy(self.metric_value_kwargs, memo),
+            metric_dependencies=copy.deepcopy(self.metric_dependencies, memo),
+        )
 
     @property
     def metric_name(self):
@@ -47,11 +59,20 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+        # The kwargs ids are memoized, so the same id tuple is returned until the kwargs change.
+        metric_domain_kwargs_id = self.metric_domain_kwargs_id
+        metric_value_kwargs_id = self.metric_value_kwargs_id
+        if (
+            self._id is None
+            or self._id[1] is not metric_domain_kwargs_id
+            or self._id[2] is not metric_value_kwargs_id
+        ):
+            self._id = (
+                self.metric_name,
+                metric_domain_kwargs_id,
+                metric_value_kwargs_id,
+            )
+        return self._id
 
 
 class MetricEdge:
@@ -76,18 +97,112 @@ class MetricEdge:
 
 class ValidationGraph:
     def __init__(self, edges: Optional[List[MetricEdge]] = None):
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges = []
+        self._edge_ids = set()
+        # Adjacency kept alongside the edge list so that scheduling never has to rescan (or copy) the edges.
+        self._nodes: Dict[Tuple, MetricConfiguration] = {}
+        self._dependencies: Dict[Tuple, Set[Tuple]] = {}
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            for edge in edges:
+                self.add(edge)
 
     def add(self, edge: MetricEdge):
-        if edge.id not in self._edge_ids:
-            self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+        left_id = edge.left.id
+        right_id = edge.right.id if edge.right else None
+        edge_id = (left_id, right_id)
+        if edge_id in self._edge_ids:
+            return
+
+        self._edges.append(edge)
+        self._edge_ids.add(edge_id)
+
+        self._nodes.setdefault(left_id, edge.left)
+        dependencies = self._dependencies.setdefault(left_id, set())
+        if right_id is not None:
+            self._nodes.setdefault(right_id, edge.right)
+            self._dependencies.setdefault(right_id, set())
+            dependencies.add(right_id)
+
+    @property
+    def edges(self) -> List[MetricEdge]:
+        return list(self._edges)
+
+    @property
+    def nodes(self) -> Dict[Tuple, MetricConfiguration]:
+        return self._nodes
+
+    def get_dependencies(self, metric_id: Tuple) -> Set[Tuple]:
+        return self._dependencies.get(metric_id, set())
+
+
+class ValidationGraphScheduler:
+    """Releases the metrics of a ValidationGraph in dependency order.
+
+    Each metric keeps a count of its unresolved dependencies; a metric enters the ready queue once that count drops
+    to zero, so every edge is visited a constant number of times over the whole resolution.
+
+    Args:
+        graph (ValidationGraph): the graph to schedule
+        resolved_metric_ids (Container): ids of metrics that are already available (e.g. a metrics dictionary); they
+            are neither scheduled nor counted as unmet dependencies
+    """
+
+    def __init__(
+        self, graph: ValidationGraph, resolved_metric_ids: Optional[Container] = None
+    ):
+        if resolved_metric_ids is None:
+            resolved_metric_ids = ()
+
+        self._nodes = graph.nodes
+        self._unmet_dependency_counts: Dict[Tuple, int] = {}
+        self._dependents: Dict[Tuple, List[Tuple]] = {}
+        self._ready: Deque[Tuple] = deque()
+
+        for metric_id in self._nodes:
+            if metric_id in resolved_metric_ids:
+                continue
+            unmet_count = 0
+            for dependency_id in graph.get_dependencies(metric_id):
+                if dependency_id in resolved_metric_ids:
+                    continue
+                unmet_count += 1
+                self._dependents.setdefault(dependency_id, []).append(metric_id)
+            self._unmet_dependency_counts[metric_id] = unmet_count
+            if unmet_count == 0:
+                self._ready.append(metric_id)
 
     @property
-    def edges(self):
-        return copy.deepcopy(self._edges)
+    def pending_count(self) -> int:
+        """The number of metrics that have not yet been marked as resolved."""
+        return len(self._unmet_dependency_counts)
+
+    def has_ready(self) -> bool:
+        return len(self._ready) > 0
+
+    def pop_ready(self) -> List[MetricConfiguration]:
+        """Remove and return all metrics whose dependencies are currently resolved."""
+        ready_metrics = [self._nodes[metric_id] for metric_id in self._ready]
+        self._ready.clear()
+        return ready_metrics
+
+    def mark_resolved(self, metric_ids):
+        """Record the given metrics as resolved, releasing any dependents whose last unmet dependency they were."""
+        for metric_id in metric_ids:
+            if self._unmet_dependency_counts.pop(metric_id, None) is None:
+                continue
+            for dependent_id in self._dependents.pop(metric_id, ()):
+                self._unmet_dependency_counts[dependent_id] -= 1
+                if self._unmet_dependency_counts[dependent_id] == 0:
+                    self._ready.append(dependent_id)
+
+    def check_complete(self):
+        """Raise a MetricResolutionError if any metric could not be scheduled (e.g. due to a dependency cycle)."""
+        if self._unmet_dependency_counts:
+            unresolved = sorted(
+                {str(metric_id[0]) for metric_id in self._unmet_dependency_counts}
+            )
+            raise MetricResolutionError(
+                f"Unable to resolve {len(self._unmet_dependency_counts)} metric(s) because their dependencies could "
+                f"not be resolved: {', '.join(unresolved)}"
+            )
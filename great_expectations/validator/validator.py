@@ -2,12 +2,15 @@ import copy
 import datetime
 import inspect
 import json
+import keyword
 import logging
+import re
 import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Any, Dict, Iterable, List, Optional
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 from dateutil.parser import parse
@@ -45,6 +48,7 @@ from great_expectations.validator.validation_graph import (
     MetricConfiguration,
     MetricEdge,
     ValidationGraph,
+    ValidationGraphScheduler,
 )
 
 logger = logging.getLogger(__name__)
@@ -292,26 +296,45 @@ class Validator:
         """Return a dictionary with the requested metrics"""
         graph = ValidationGraph()
         resolved_metrics = {}
+        metrics = dict(metrics)
         for metric_name, metric_configuration in metrics.items():
             provider_cls, _ = get_metric_provider(
                 metric_configuration.metric_name, self.execution_engine
             )
-            for key in provider_cls.domain_keys:
-                if (
-                    key not in metric_configuration.metric_domain_kwargs
-                    and key in provider_cls.default_kwarg_values
-                ):
-                    metric_configuration.metric_domain_kwargs[
-                        key
-                    ] = provider_cls.default_kwarg_values[key]
-            for key in provider_cls.value_keys:
-                if (
-                    key not in metric_configuration.metric_value_kwargs
-                    and key in provider_cls.default_kwarg_values
-                ):
-                    metric_configuration.metric_value_kwargs[
-                        key
-                    ] = provider_cls.default_kwarg_values[key]
+            metric_domain_kwargs = {
+                key: provider_cls.default_kwarg_values[key]
+                for key in provider_cls.domain_keys
+                if key not in metric_configuration.metric_domain_kwargs
+                and key in provider_cls.default_kwarg_values
+            }
+            metric_value_kwargs = {
+                key: provider_cls.default_kwarg_values[key]
+                for key in provider_cls.value_keys
+                if key not in metric_configuration.metric_value_kwargs
+                and key in provider_cls.default_kwarg_values
+            }
+            if metric_domain_kwargs or metric_value_kwargs:
+                # metric kwargs cannot be modified: the defaults go into a new configuration
+                metrics[metric_name] = MetricConfiguration(
+                    metric_name=metric_configuration.metric_name,
+                    metric_domain_kwargs={
+                        **metric_configuration.metric_domain_kwargs,
+                        **metric_domain_kwargs,
+                    },
+                    metric_value_kwargs={
+                        **metric_configuration.metric_value_kwargs,
+                        **metric_value_kwargs,
+                    },
+                    metric_dependencies=metric_configuration.metric_dependencies,
+                )
+        # Metrics that have already been computed on the batch are served from the execution engine's metric cache
+        # without resolving their dependencies again.
+        resolved_metrics.update(
+            self._execution_engine.get_cached_metrics(metrics.values())
+        )
+        for metric_configuration in metrics.values():
+            if metric_configuration.id in resolved_metrics:
+                continue
             self.build_metric_dependency_graph(
                 graph,
                 child_node=metric_configuration,
@@ -345,6 +368,7 @@ class Validator:
         metric_impl = get_metric_provider(
             child_node.metric_name, execution_engine=execution_engine
         )[0]
+        execution_engine.check_metric_support(child_node)
         metric_dependencies = metric_impl.get_evaluation_dependencies(
             metric=child_node,
             configuration=configuration,
@@ -409,6 +433,22 @@ class Validator:
                 Returns:
                     A list of Validations, validating that all necessary metrics are available.
         """
+        return [
+            result
+            for _, result in self._graph_validate(
+                configurations,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        ]
+
+    def _graph_validate(
+        self,
+        configurations: List[ExpectationConfiguration],
+        metrics: dict = None,
+        runtime_configuration: dict = None,
+    ) -> List[Tuple[int, ExpectationValidationResult]]:
+        """Implements graph_validate, returning each result with the index of the configuration it validates."""
         graph = ValidationGraph()
         if runtime_configuration is None:
             runtime_configuration = dict()
@@ -420,7 +460,7 @@ class Validator:
 
         processed_configurations = []
         evrs = []
-        for configuration in configurations:
+        for idx, configuration in enumerate(configurations):
             # Validating
             try:
                 assert (
@@ -443,7 +483,7 @@ class Validator:
                         self._execution_engine,
                         runtime_configuration=runtime_configuration,
                     )
-                processed_configurations.append(configuration)
+                processed_configurations.append((idx, configuration))
             except Exception as err:
                 if catch_exceptions:
                     raised_exception = True
@@ -456,7 +496,7 @@ class Validator:
                             "exception_message": str(err),
                         },
                     )
-                    evrs.append(result)
+                    evrs.append((idx, result))
                 else:
                     raise err
 
@@ -464,14 +504,14 @@ class Validator:
             metrics = dict()
 
         metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
-        for configuration in processed_configurations:
+        for idx, configuration in processed_configurations:
             try:
                 result = configuration.metrics_validate(
                     metrics,
                     execution_engine=self._execution_engine,
                     runtime_configuration=runtime_configuration,
                 )
-                evrs.append(result)
+                evrs.append((idx, result))
             except Exception as err:
                 if catch_exceptions:
                     raised_exception = True
@@ -485,26 +525,40 @@ class Validator:
                             "exception_message": str(err),
                         },
                     )
-                    evrs.append(result)
+                    evrs.append((idx, result))
                 else:
                     raise err
         return evrs
 
     def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
-            metrics.update(
-                self._resolve_metrics(
+        """Resolve all metrics in the graph, one wave of ready metrics at a time.
+
+        If runtime_configuration (or, failing that, the validator config) sets "max_workers" greater than one, the
+        metrics of each wave are computed concurrently when the execution engine supports it.
+        """
+        max_workers = None
+        if runtime_configuration is not None:
+            max_workers = runtime_configuration.get("max_workers")
+        if max_workers is None:
+            max_workers = self.get_config_value("max_workers")
+
+        scheduler = ValidationGraphScheduler(graph, resolved_metric_ids=metrics)
+        with self._execution_engine.metric_resolution_executor(
+            max_workers=max_workers
+        ) as executor:
+            while scheduler.has_ready():
+                ready_metrics = scheduler.pop_ready()
+                resolved_metrics = self._resolve_metrics(
                     execution_engine=self._execution_engine,
                     metrics_to_resolve=ready_metrics,
                     metrics=metrics,
                     runtime_configuration=runtime_configuration,
+                    executor=executor,
                 )
-            )
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
+                metrics.update(resolved_metrics)
+                scheduler.mark_resolved(resolved_metrics.keys())
 
+        scheduler.check_complete()
         return metrics
 
     def _parse_validation_graph(self, validation_graph, metrics):
@@ -534,11 +588,12 @@ class Validator:
         metrics_to_resolve: Iterable[MetricConfiguration],
         metrics: Dict,
         runtime_configuration: dict = None,
+        executor: Optional[Executor] = None,
     ):
         """A means of accessing the Execution Engine's resolve_metrics method, where missing metric configurations are
         resolved"""
         return execution_engine.resolve_metrics(
-            metrics_to_resolve, metrics, runtime_configuration
+            metrics_to_resolve, metrics, runtime_configuration, executor=executor
         )
 
     def _initialize_expectations(
@@ -1030,6 +1085,63 @@ class Validator:
         Raises:
            AttributeError - if 'catch_exceptions'=None and an expectation throws an AttributeError
         """
+        return self._validate(
+            expectation_suites=[expectation_suite],
+            run_id=run_id,
+            data_context=data_context,
+            evaluation_parameters=evaluation_parameters,
+            catch_exceptions=catch_exceptions,
+            result_format=result_format,
+            only_return_failures=only_return_failures,
+            run_name=run_name,
+            run_time=run_time,
+        )[0]
+
+    def validate_suites(
+        self,
+        expectation_suites: List[ExpectationSuite],
+        run_id=None,
+        data_context=None,
+        evaluation_parameters=None,
+        catch_exceptions=True,
+        result_format=None,
+        only_return_failures=False,
+        run_name=None,
+        run_time=None,
+    ) -> List[ExpectationSuiteValidationResult]:
+        """Validates the active batch against several expectation suites in a single pass.
+
+        The expectations of all of the suites are added to a single validation graph, so that the metrics they share
+        (row counts, null counts, ...) are only computed once, and the results are split into one validation result
+        per suite. Arguments are as for validate, which is equivalent to validating each suite on its own.
+
+        Returns:
+            A list of ExpectationSuiteValidationResult, in the order of expectation_suites
+        """
+        return self._validate(
+            expectation_suites=expectation_suites,
+            run_id=run_id,
+            data_context=data_context,
+            evaluation_parameters=evaluation_parameters,
+            catch_exceptions=catch_exceptions,
+            result_format=result_format,
+            only_return_failures=only_return_failures,
+            run_name=run_name,
+            run_time=run_time,
+        )
+
+    def _validate(
+        self,
+        expectation_suites: List[Optional[ExpectationSuite]],
+        run_id=None,
+        data_context=None,
+        evaluation_parameters=None,
+        catch_exceptions=True,
+        result_format=None,
+        only_return_failures=False,
+        run_name=None,
+        run_time=None,
+    ) -> list:
         try:
             validation_time = datetime.datetime.now(datetime.timezone.utc).strftime(
                 "%Y%m%dT%H%M%S.%fZ"
@@ -1066,132 +1178,101 @@ class Validator:
                 # temporarily set self._data_context so it is used inside the expectation decorator
                 self._data_context = data_context
 
-            if expectation_suite is None:
-                expectation_suite = self.get_expectation_suite(
-                    discard_failed_expectations=False,
-                    discard_result_format_kwargs=False,
-                    discard_include_config_kwargs=False,
-                    discard_catch_exceptions_kwargs=False,
-                )
-            elif isinstance(expectation_suite, str):
-                try:
-                    with open(expectation_suite) as infile:
-                        expectation_suite = expectationSuiteSchema.loads(infile.read())
-                except ValidationError:
-                    raise
-                except OSError:
-                    raise GreatExpectationsError(
-                        "Unable to load expectation suite: IO error while reading %s"
-                        % expectation_suite
+            expectation_suites = list(expectation_suites)
+            for idx, expectation_suite in enumerate(expectation_suites):
+                if expectation_suite is None:
+                    expectation_suites[idx] = self.get_expectation_suite(
+                        discard_failed_expectations=False,
+                        discard_result_format_kwargs=False,
+                        discard_include_config_kwargs=False,
+                        discard_catch_exceptions_kwargs=False,
                     )
-            elif not isinstance(expectation_suite, ExpectationSuite):
-                logger.error(
-                    "Unable to validate using the provided value for expectation suite; does it need to be "
-                    "loaded from a dictionary?"
-                )
-                if getattr(data_context, "_usage_statistics_handler", None):
-                    handler = data_context._usage_statistics_handler
-                    handler.send_usage_message(
-                        event="data_asset.validate",
-                        event_payload=handler._batch_anonymizer.anonymize_batch_info(
-                            self
-                        ),
-                        success=False,
+                elif isinstance(expectation_suite, str):
+                    try:
+                        with open(expectation_suite) as infile:
+                            expectation_suites[idx] = expectationSuiteSchema.loads(
+                                infile.read()
+                            )
+                    except ValidationError:
+                        raise
+                    except OSError:
+                        raise GreatExpectationsError(
+                            "Unable to load expectation suite: IO error while reading %s"
+                            % expectation_suite
+                        )
+                elif not isinstance(expectation_suite, ExpectationSuite):
+                    logger.error(
+                        "Unable to validate using the provided value for expectation suite; does it need to be "
+                        "loaded from a dictionary?"
                     )
-                return ExpectationValidationResult(success=False)
-            # Evaluation parameter priority is
-            # 1. from provided parameters
-            # 2. from expectation configuration
-            # 3. from data context
-            # So, we load them in reverse order
-
-            if data_context is not None:
-                runtime_evaluation_parameters = (
-                    data_context.evaluation_parameter_store.get_bind_params(run_id)
+                    if getattr(data_context, "_usage_statistics_handler", None):
+                        handler = data_context._usage_statistics_handler
+                        handler.send_usage_message(
+                            event="data_asset.validate",
+                            event_payload=handler._batch_anonymizer.anonymize_batch_info(
+                                self
+                            ),
+                            success=False,
+                        )
+                    return [
+                        ExpectationValidationResult(success=False)
+                        for _ in expectation_suites
+                    ]
+
+            suites_runtime_evaluation_parameters = []
+            suites_expectations_to_evaluate = []
+            for expectation_suite in expectation_suites:
+                runtime_evaluation_parameters = self._get_runtime_evaluation_parameters(
+                    expectation_suite=expectation_suite,
+                    data_context=data_context,
+                    run_id=run_id,
+                    evaluation_parameters=evaluation_parameters,
                 )
-            else:
-                runtime_evaluation_parameters = {}
-
-            if expectation_suite.evaluation_parameters:
-                runtime_evaluation_parameters.update(
-                    expectation_suite.evaluation_parameters
+                suites_runtime_evaluation_parameters.append(
+                    runtime_evaluation_parameters
                 )
-
-            if evaluation_parameters is not None:
-                runtime_evaluation_parameters.update(evaluation_parameters)
-
-            # Convert evaluation parameters to be json-serializable
-            runtime_evaluation_parameters = recursively_convert_to_json_serializable(
-                runtime_evaluation_parameters
-            )
-
-            # Warn if our version is different from the version in the configuration
-            # TODO: Deprecate "great_expectations.__version__"
-            suite_ge_version = expectation_suite.meta.get(
-                "great_expectations_version"
-            ) or expectation_suite.meta.get("great_expectations.__version__")
-
-            # Group expectations by column
-            columns = {}
-
-            for expectation in expectation_suite.expectations:
-                expectation.process_evaluation_parameters(
-                    evaluation_parameters=runtime_evaluation_parameters,
-                    interactive_evaluation=self.interactive_evaluation,
-                    data_context=self._data_context,
+                suites_expectations_to_evaluate.append(
+                    self._get_expectations_to_evaluate(
+                        expectation_suite=expectation_suite,
+                        runtime_evaluation_parameters=runtime_evaluation_parameters,
+                    )
                 )
-                if "column" in expectation.kwargs and isinstance(
-                    expectation.kwargs["column"], Hashable
-                ):
-                    column = expectation.kwargs["column"]
-                else:
-                    column = "_nocolumn"
-                if column not in columns:
-                    columns[column] = []
-                columns[column].append(expectation)
 
+            # Validate the expectations of all of the suites at once, and attribute each result to its suite
             expectations_to_evaluate = []
-            for col in columns:
-                expectations_to_evaluate.extend(columns[col])
-
-            results = self.graph_validate(
+            suite_indexes = []
+            for suite_idx, suite_expectations in enumerate(
+                suites_expectations_to_evaluate
+            ):
+                expectations_to_evaluate.extend(suite_expectations)
+                suite_indexes.extend([suite_idx] * len(suite_expectations))
+            suites_results = [[] for _ in expectation_suites]
+            for configuration_idx, expectation_result in self._graph_validate(
                 expectations_to_evaluate,
                 runtime_configuration={
                     "catch_exceptions": catch_exceptions,
                     "result_format": result_format,
                 },
-            )
-            statistics = _calc_validation_statistics(results)
-
-            if only_return_failures:
-                abbrev_results = []
-                for exp in results:
-                    if not exp.success:
-                        abbrev_results.append(exp)
-                results = abbrev_results
-
-            expectation_suite_name = expectation_suite.expectation_suite_name
-
-            result = ExpectationSuiteValidationResult(
-                results=results,
-                success=statistics.success,
-                statistics={
-                    "evaluated_expectations": statistics.evaluated_expectations,
-                    "successful_expectations": statistics.successful_expectations,
-                    "unsuccessful_expectations": statistics.unsuccessful_expectations,
-                    "success_percent": statistics.success_percent,
-                },
-                evaluation_parameters=runtime_evaluation_parameters,
-                meta={
-                    "great_expectations_version": ge_version,
-                    "expectation_suite_name": expectation_suite_name,
-                    "run_id": run_id,
-                    "batch_spec": self.active_batch_spec,
-                    "batch_markers": self.active_batch_markers,
-                    "active_batch_definition": self.active_batch_definition,
-                    "validation_time": validation_time,
-                },
-            )
+            ):
+                suites_results[suite_indexes[configuration_idx]].append(
+                    expectation_result
+                )
+
+            results = [
+                self._build_suite_validation_result(
+                    expectation_suite=expectation_suite,
+                    results=suite_results,
+                    runtime_evaluation_parameters=runtime_evaluation_parameters,
+                    run_id=run_id,
+                    validation_time=validation_time,
+                    only_return_failures=only_return_failures,
+                )
+                for expectation_suite, suite_results, runtime_evaluation_parameters in zip(
+                    expectation_suites,
+                    suites_results,
+                    suites_runtime_evaluation_parameters,
+                )
+            ]
 
             self._data_context = validate__data_context
         except Exception as e:
@@ -1213,7 +1294,103 @@ class Validator:
                 event_payload=handler._batch_anonymizer.anonymize_batch_info(self),
                 success=True,
             )
-        return result
+        return results
+
+    @staticmethod
+    def _get_runtime_evaluation_parameters(
+        expectation_suite: ExpectationSuite, data_context, run_id, evaluation_parameters
+    ) -> dict:
+        # Evaluation parameter priority is
+        # 1. from provided parameters
+        # 2. from expectation configuration
+        # 3. from data context
+        # So, we load them in reverse order
+
+        if data_context is not None:
+            runtime_evaluation_parameters = (
+                data_context.evaluation_parameter_store.get_bind_params(run_id)
+            )
+        else:
+            runtime_evaluation_parameters = {}
+
+        if expectation_suite.evaluation_parameters:
+            runtime_evaluation_parameters.update(
+                expectation_suite.evaluation_parameters
+            )
+
+        if evaluation_parameters is not None:
+            runtime_evaluation_parameters.update(evaluation_parameters)
+
+        # Convert evaluation parameters to be json-serializable
+        return recursively_convert_to_json_serializable(runtime_evaluation_parameters)
+
+    def _get_expectations_to_evaluate(
+        self, expectation_suite: ExpectationSuite, runtime_evaluation_parameters: dict
+    ) -> List[ExpectationConfiguration]:
+        # Group expectations by column
+        columns = {}
+
+        for expectation in expectation_suite.expectations:
+            expectation.process_evaluation_parameters(
+                evaluation_parameters=runtime_evaluation_parameters,
+                interactive_evaluation=self.interactive_evaluation,
+                data_context=self._data_context,
+            )
+            if "column" in expectation.kwargs and isinstance(
+                expectation.kwargs["column"], Hashable
+            ):
+                column = expectation.kwargs["column"]
+            else:
+                column = "_nocolumn"
+            if column not in columns:
+                columns[column] = []
+            columns[column].append(expectation)
+
+        expectations_to_evaluate = []
+        for col in columns:
+            expectations_to_evaluate.extend(columns[col])
+        return expectations_to_evaluate
+
+    def _build_suite_validation_result(
+        self,
+        expectation_suite: ExpectationSuite,
+        results: List[ExpectationValidationResult],
+        runtime_evaluation_parameters: dict,
+        run_id: RunIdentifier,
+        validation_time: str,
+        only_return_failures: bool,
+    ) -> ExpectationSuiteValidationResult:
+        statistics = _calc_validation_statistics(results)
+
+        if only_return_failures:
+            abbrev_results = []
+            for exp in results:
+                if not exp.success:
+                    abbrev_results.append(exp)
+            results = abbrev_results
+
+        expectation_suite_name = expectation_suite.expectation_suite_name
+
+        return ExpectationSuiteValidationResult(
+            results=results,
+            success=statistics.success,
+            statistics={
+                "evaluated_expectations": statistics.evaluated_expectations,
+                "successful_expectations": statistics.successful_expectations,
+                "unsuccessful_expectations": statistics.unsuccessful_expectations,
+                "success_percent": statistics.success_percent,
+            },
+            evaluation_parameters=runtime_evaluation_parameters,
+            meta={
+                "great_expectations_version": ge_version,
+                "expectation_suite_name": expectation_suite_name,
+                "run_id": run_id,
+                "batch_spec": self.active_batch_spec,
+                "batch_markers": self.active_batch_markers,
+                "active_batch_definition": self.active_batch_definition,
+                "validation_time": validation_time,
+            },
+        )
 
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """
@@ -1339,6 +1516,68 @@ def _calc_validation_statistics(validation_results):
     )
 
 
+# Expectations that only need the batch's row count or the columns of its source, both of which remain available when
+# the batch is loaded with a column projection.
+COLUMN_PROJECTION_SAFE_EXPECTATION_TYPES = {
+    "expect_column_to_exist",
+    "expect_table_row_count_to_equal",
+    "expect_table_row_count_to_be_between",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+}
+
+_ROW_CONDITION_TOKEN_PATTERN = re.compile(
+    r"`([^`]+)`|\"([^\"]+)\"|'([^']+)'|([A-Za-z_][A-Za-z0-9_]*)"
+)
+
+
+def get_column_projection(expectation_suite: ExpectationSuite) -> Optional[List[str]]:
+    """
+    Return the sorted list of columns referenced by the domain kwargs of an expectation suite's expectations, so
+    that a batch validated against the suite only needs to load those columns.
+
+    Every identifier and quoted string in a row_condition is included, since the execution engine ignores projected
+    columns that are absent from the source. None is returned if the suite contains an expectation whose columns
+    cannot be determined (a column given as an evaluation parameter, or a table-level expectation that needs the
+    batch's data), in which case the batch must be loaded in full.
+    """
+    columns = set()
+    for expectation in expectation_suite.expectations:
+        if expectation.expectation_type in COLUMN_PROJECTION_SAFE_EXPECTATION_TYPES:
+            continue
+
+        kwargs = expectation.kwargs
+        domain_columns = [
+            kwargs[key] for key in ("column", "column_A", "column_B") if key in kwargs
+        ]
+        if isinstance(kwargs.get("column_list"), list):
+            domain_columns.extend(kwargs["column_list"])
+        if not domain_columns or not all(
+            isinstance(column, str) for column in domain_columns
+        ):
+            return None
+        columns.update(domain_columns)
+
+        row_condition = kwargs.get("row_condition")
+        if row_condition:
+            if not isinstance(row_condition, str):
+                return None
+            for (
+                backquoted,
+                double_quoted,
+                single_quoted,
+                identifier,
+            ) in _ROW_CONDITION_TOKEN_PATTERN.findall(row_condition):
+                token = backquoted or double_quoted or single_quoted
+                if not token and not keyword.iskeyword(identifier):
+                    token = identifier
+                if token:
+                    columns.add(token)
+    return sorted(columns)
+
+
 class BridgeValidator:
     """This is currently helping bridge APIs"""
 
@@ -12,6 +12,7 @@ import great_expectations as ge
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.data_context.data_context import DataContext
 from great_expectations.data_context.types.base import CheckpointConfig
 from great_expectations.data_context.types.resource_identifiers import (
@@ -1010,6 +1011,319 @@ def test_newstyle_checkpoint_instantiates_and_produces_a_validation_result_when_
     assert len(context.validations_store.list_keys()) == 1
 
 
+def test_newstyle_checkpoint_runs_validations_concurrently(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    context.create_expectation_suite("my_expectation_suite")
+    data_asset_names = ["Titanic_1911", "Titanic_1912", "Titanic_19120414_1313"]
+    checkpoint_config = CheckpointConfig(
+        name="my_checkpoint",
+        config_version=1,
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+            {
+                "name": "update_data_docs",
+                "action": {
+                    "class_name": "UpdateDataDocsAction",
+                },
+            },
+        ],
+        runtime_configuration={"max_concurrent_validations": 3},
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in data_asset_names
+        ],
+    )
+    checkpoint_config_key = ConfigurationIdentifier(
+        configuration_key=checkpoint_config.name
+    )
+    context.checkpoint_store.set(key=checkpoint_config_key, value=checkpoint_config)
+    checkpoint = context.get_checkpoint(checkpoint_config.name)
+
+    results = checkpoint.run()
+    assert len(context.validations_store.list_keys()) == 3
+    # Results are gathered in the order of the validations
+    assert [
+        result["validation_result"].meta["active_batch_definition"]["data_asset_name"]
+        for result in results.run_results.values()
+    ] == data_asset_names
+
+    # A failing validation does not prevent the others from completing
+    with pytest.raises(
+        ge_exceptions.DataContextError, match=r"expectation_suite .* not found"
+    ):
+        checkpoint.run(
+            validations=[
+                {
+                    "batch_request": {
+                        "datasource_name": "my_datasource",
+                        "data_connector_name": "my_basic_data_connector",
+                        "data_asset_name": "Titanic_1911",
+                    },
+                    "expectation_suite_name": "not_a_suite",
+                }
+            ],
+            run_name="partially_failing_run",
+        )
+    assert len(context.validations_store.list_keys()) == 6
+
+
+def test_newstyle_checkpoint_validates_suites_of_the_same_batch_in_a_single_pass(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    for expectation_suite_name in ["my_failure_suite", "my_warning_suite"]:
+        suite = context.create_expectation_suite(expectation_suite_name)
+        suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "Age"},
+            )
+        )
+        context.save_expectation_suite(suite)
+    batch_request = {
+        "datasource_name": "my_datasource",
+        "data_connector_name": "my_basic_data_connector",
+        "data_asset_name": "Titanic_1911",
+    }
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "my_failure_suite",
+            },
+            {
+                "batch_request": batch_request,
+                "expectation_suite_name": "my_warning_suite",
+            },
+        ],
+    )
+
+    with mock.patch.object(
+        context, "get_batch", wraps=context.get_batch
+    ) as get_batch_mock:
+        results = checkpoint.run()
+    # Both suites are validated against a single load of the batch
+    assert get_batch_mock.call_count == 1
+    assert len(context.validations_store.list_keys()) == 2
+    assert [
+        result["validation_result"].meta["expectation_suite_name"]
+        for result in results.run_results.values()
+    ] == ["my_failure_suite", "my_warning_suite"]
+
+
+@pytest.mark.parametrize(
+    "runtime_configuration,expected_column_projection",
+    [
+        ({}, None),
+        ({"column_projection": False}, None),
+        ({"column_projection": True}, ["Age"]),
+    ],
+)
+def test_newstyle_checkpoint_projects_columns_only_when_configured(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+    runtime_configuration,
+    expected_column_projection,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "Age"},
+        )
+    )
+    context.save_expectation_suite(suite)
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        runtime_configuration=runtime_configuration,
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": "Titanic_1911",
+                }
+            }
+        ],
+    )
+
+    results = checkpoint.run()
+    batch_spec = list(results.run_results.values())[0]["validation_result"].meta[
+        "batch_spec"
+    ]
+    assert batch_spec.get("column_projection") == expected_column_projection
+
+
+def test_newstyle_checkpoint_does_not_share_batches_of_requests_with_custom_filter_functions(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    for expectation_suite_name in ["my_failure_suite", "my_warning_suite"]:
+        context.create_expectation_suite(expectation_suite_name)
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": "Titanic_1911",
+                    "partition_request": {
+                        "custom_filter_function": lambda partition_definition: True
+                    },
+                },
+                "expectation_suite_name": "my_failure_suite",
+            },
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": "Titanic_1911",
+                    "partition_request": {
+                        "custom_filter_function": lambda partition_definition: True
+                    },
+                },
+                "expectation_suite_name": "my_warning_suite",
+            },
+        ],
+    )
+    # Both filters are named "<lambda>", so their batch requests have the same id
+    assert (
+        Checkpoint._get_validation_groups(
+            substituted_runtime_config=checkpoint.config,
+            validations=checkpoint.config.validations,
+        )
+        == [[0], [1]]
+    )
+
+    with mock.patch.object(
+        context, "get_batch", wraps=context.get_batch
+    ) as get_batch_mock:
+        checkpoint.run()
+    assert get_batch_mock.call_count == 2
+    assert len(context.validations_store.list_keys()) == 2
+
+
+def test_newstyle_checkpoint_defers_actions_with_async_actions(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    context.create_expectation_suite("my_expectation_suite")
+    data_asset_names = ["Titanic_1911", "Titanic_1912", "Titanic_19120414_1313"]
+    checkpoint_config = CheckpointConfig(
+        name="my_checkpoint",
+        config_version=1,
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+            {
+                "name": "update_data_docs",
+                "action": {
+                    "class_name": "UpdateDataDocsAction",
+                },
+            },
+            {
+                "name": "send_slack_notification",
+                "action": {
+                    "class_name": "SlackNotificationAction",
+                    "slack_webhook": "https://hooks.slack.com/services/test",
+                    "renderer": {
+                        "module_name": "great_expectations.render.renderer.slack_renderer",
+                        "class_name": "SlackRenderer",
+                    },
+                },
+            },
+        ],
+        runtime_configuration={"async_actions": True},
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in data_asset_names
+        ],
+    )
+    checkpoint_config_key = ConfigurationIdentifier(
+        configuration_key=checkpoint_config.name
+    )
+    context.checkpoint_store.set(key=checkpoint_config_key, value=checkpoint_config)
+    checkpoint = context.get_checkpoint(checkpoint_config.name)
+
+    with mock.patch.object(
+        context, "build_data_docs", wraps=context.build_data_docs
+    ) as build_data_docs_mock, mock.patch(
+        "great_expectations.checkpoint.action_pipeline.send_slack_notification",
+        return_value="Slack notification succeeded.",
+    ) as send_slack_notification_mock:
+        results = checkpoint.run()
+
+    assert len(context.validations_store.list_keys()) == 3
+    # The pages of all of the validations are built at once, and the Slack messages are sent as one
+    assert build_data_docs_mock.call_count == 1
+    assert len(build_data_docs_mock.call_args[1]["resource_identifiers"]) == 3 + 1
+    assert send_slack_notification_mock.call_count == 1
+    for result in results.run_results.values():
+        assert result["actions_results"]["send_slack_notification"] == {
+            "slack_notification_result": "Slack notification succeeded.",
+            "class": "SlackNotificationAction",
+        }
+        assert "local_site" in result["actions_results"]["update_data_docs"]
+
+
 def test_newstyle_checkpoint_config_substitution_simple(
     titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_templates,
     monkeypatch,
@@ -1559,3 +1873,96 @@ def test_newstyle_checkpoint_config_substitution_nested(
     monkeypatch.delenv("VAR")
     monkeypatch.delenv("MY_PARAM")
     monkeypatch.delenv("OLD_PARAM")
+
+
+def test_newstyle_checkpoint_raises_validation_errors_over_deferred_action_errors(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store,
+):
+    context = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        action_list=[
+            {
+                "name": "update_data_docs",
+                "action": {
+                    "class_name": "UpdateDataDocsAction",
+                },
+            },
+        ],
+        runtime_configuration={"async_actions": True},
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": "Titanic_1911",
+                },
+                "expectation_suite_name": "not_a_suite",
+            }
+        ],
+    )
+
+    with mock.patch(
+        "great_expectations.checkpoint.checkpoint.ActionPipeline.close",
+        side_effect=ValueError("Unable to flush actions"),
+    ) as close_mock:
+        with pytest.raises(
+            ge_exceptions.DataContextError, match=r"expectation_suite .* not found"
+        ):
+            checkpoint.run()
+    assert close_mock.call_count == 1
+
+
+def test_newstyle_checkpoint_runs_sql_validations_concurrently(
+    data_context_with_sql_datasource_for_testing_get_batch,
+):
+    context = data_context_with_sql_datasource_for_testing_get_batch
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "id"},
+        )
+    )
+    context.save_expectation_suite(suite)
+    dates = ["2020-01-15", "2020-01-16", "2020-01-17", "2020-01-18"]
+    checkpoint_config = CheckpointConfig(
+        name="my_checkpoint",
+        config_version=1,
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        runtime_configuration={"max_concurrent_validations": 4},
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_sqlite_db",
+                    "data_connector_name": "daily",
+                    "data_asset_name": "table_partitioned_by_date_column__A",
+                    "partition_request": {"partition_identifiers": {"date": date}},
+                }
+            }
+            for date in dates
+        ],
+    )
+    context.checkpoint_store.set(
+        key=ConfigurationIdentifier(configuration_key=checkpoint_config.name),
+        value=checkpoint_config,
+    )
+    checkpoint = context.get_checkpoint(checkpoint_config.name)
+
+    results = checkpoint.run()
+    assert results.success
+    assert len(context.validations_store.list_keys()) == 4
+    # The batches were bound to connections of the threads that validated them, which closed them
+    execution_engine = context.datasources["my_sqlite_db"].execution_engine
+    assert execution_engine._session_connections == {}
+    assert execution_engine.temp_table_manager.temp_table_names == []
@@ -117,6 +117,7 @@ def test_cli_init_on_new_project(
         config_variables.yml
         data_docs/
             local_site/
+                .ge_site_manifest.json
                 index.html
                 expectations/
                     Titanic/
@@ -625,6 +626,7 @@ def test_cli_init_on_new_project_with_broken_excel_file_try_again_with_different
         config_variables.yml
         data_docs/
             local_site/
+                .ge_site_manifest.json
                 index.html
                 expectations/
                     Titanic/
@@ -144,6 +144,7 @@ great_expectations/
         config_variables.yml
         data_docs/
             local_site/
+                .ge_site_manifest.json
                 index.html
                 expectations/
                     warning.html
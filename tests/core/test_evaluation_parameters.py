@@ -3,6 +3,7 @@ from timeit import timeit
 import pytest
 
 from great_expectations.core.evaluation_parameters import (
+    _compile_evaluation_parameter_expression,
     _deduplicate_evaluation_parameter_dependencies,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
@@ -184,3 +185,22 @@ def test_deduplicate_evaluation_parameter_dependencies():
             }
         ]
     } == deduplicated
+
+
+def test_parse_evaluation_parameter_parses_each_expression_once():
+    _compile_evaluation_parameter_expression.cache_clear()
+    assert parse_evaluation_parameter("trunc(a * 0.9) + b", {"a": 11, "b": 1}) == 10
+    assert parse_evaluation_parameter("trunc(a * 0.9) + b", {"a": 21, "b": 2}) == 20
+    assert find_evaluation_parameter_dependencies("trunc(a * 0.9) + b") == {
+        "urns": set(),
+        "other": {"a", "b"},
+    }
+    cache_info = _compile_evaluation_parameter_expression.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+    # Parse failures are cached too
+    for _ in range(2):
+        with pytest.raises(EvaluationParameterError, match="Parse Failure"):
+            parse_evaluation_parameter("a +* b", {"a": 1, "b": 2})
+    assert _compile_evaluation_parameter_expression.cache_info().misses == 2
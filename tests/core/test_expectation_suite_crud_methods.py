@@ -428,3 +428,44 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+def test_expectation_index_stays_consistent(
+    exp1, exp2, exp4, exp5, exp6, empty_suite, domain_success_runtime_suite
+):
+    # Lookups after adding, replacing and removing expectations through the suite
+    empty_suite.add_expectation(exp1)
+    empty_suite.add_expectation(exp2)
+    assert empty_suite.find_expectation_indexes(exp2, "runtime") == [1]
+    empty_suite.add_expectation(exp4, match_type="domain")
+    assert empty_suite.expectations == [exp1, exp4]
+    assert empty_suite.find_expectation_indexes(exp2, "runtime") == []
+    assert empty_suite.find_expectation_indexes(exp4, "runtime") == [1]
+    empty_suite.remove_expectation(exp1)
+    assert empty_suite.find_expectation_indexes(exp4, "runtime") == [0]
+
+    # ... after changing the list of expectations directly
+    empty_suite.expectations.insert(0, exp1)
+    assert empty_suite.find_expectation_indexes(exp4, "runtime") == [1]
+    empty_suite.expectations[1] = exp2
+    assert empty_suite.find_expectation_indexes(exp4, "runtime") == []
+    assert empty_suite.find_expectation_indexes(exp2, "runtime") == [1]
+    empty_suite.expectations = [exp4]
+    assert empty_suite.find_expectation_indexes(exp4, "runtime") == [0]
+
+    # ... and after patching an expectation
+    domain_success_runtime_suite.patch_expectation(
+        exp5, op="replace", path="/value_set", value=[1, 2], match_type="runtime"
+    )
+    assert domain_success_runtime_suite.find_expectation_indexes(exp6, "success") == [4]
+
+    # Expectations with unhashable kwargs are still found
+    exp_with_unhashable_kwargs = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": [bytearray(b"a")]},
+    )
+    empty_suite.add_expectation(exp_with_unhashable_kwargs, match_type="runtime")
+    assert empty_suite.find_expectation_indexes(
+        exp_with_unhashable_kwargs, "runtime"
+    ) == [1]
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == [1]
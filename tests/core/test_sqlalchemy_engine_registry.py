@@ -0,0 +1,47 @@
+import pytest
+
+from great_expectations.core.sqlalchemy_engine_registry import SqlAlchemyEngineRegistry
+from great_expectations.data_context.store.database_store_backend import (
+    DatabaseStoreBackend,
+)
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+
+@pytest.mark.skipif(sa is None, reason="sqlalchemy is not installed")
+def test_engines_are_shared_by_url_and_options(tmp_path):
+    registry = SqlAlchemyEngineRegistry()
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+
+    engine = registry.get_engine(url)
+    assert registry.get_engine(url) is engine
+    assert registry.get_engine(sa.engine.url.make_url(url)) is engine
+    # Different pool options need a different engine
+    assert registry.get_engine(url, pool_pre_ping=True) is not engine
+    assert registry.get_engine(url, pool_pre_ping=True) is registry.get_engine(
+        url, pool_pre_ping=True
+    )
+
+    registry.dispose()
+    assert registry.get_engine(url) is not engine
+
+
+@pytest.mark.skipif(sa is None, reason="sqlalchemy is not installed")
+def test_in_memory_sqlite_engines_are_not_shared():
+    registry = SqlAlchemyEngineRegistry()
+    assert registry.get_engine("sqlite://") is not registry.get_engine("sqlite://")
+
+
+@pytest.mark.skipif(sa is None, reason="sqlalchemy is not installed")
+def test_execution_engines_and_stores_share_engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    execution_engine = SqlAlchemyExecutionEngine(url=url)
+    store_backend = DatabaseStoreBackend(
+        url=url, table_name="test_table", key_columns=["k1"]
+    )
+    assert store_backend.engine is execution_engine.engine
+    assert SqlAlchemyExecutionEngine(url=url).engine is execution_engine.engine
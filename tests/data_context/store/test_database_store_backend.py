@@ -7,7 +7,11 @@ import pytest
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import (
+    StoreBackendBulkOperationError,
+    StoreBackendError,
+    StoreError,
+)
 
 
 def test_database_store_backend_schema_spec(caplog, sa, test_backends):
@@ -106,6 +110,50 @@ def test_database_store_backend_duplicate_key_violation(caplog, sa, test_backend
     assert "Integrity error" in str(exc.value)
 
 
+def test_database_store_backend_set_many_and_get_many(sa, tmp_path):
+    # Use sqlite so we don't require postgres for this test.
+    store_backend = DatabaseStoreBackend(
+        url=f"sqlite:///{tmp_path / 'store.db'}",
+        table_name="test_database_store_backend_set_many",
+        key_columns=["k1", "k2"],
+    )
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(store_backend.engine, "before_cursor_execute", count_statement)
+    try:
+        items = [((str(i % 10), str(i)), f"value_{i}") for i in range(2000)]
+        store_backend.set_many(items)
+        assert len(statements) == 1
+
+        keys = [key for key, _ in reversed(items)]
+        assert store_backend.get_many(keys) == [value for _, value in reversed(items)]
+        # each query fetches as many keys as fit in its parameters
+        assert len(statements) == 6
+    finally:
+        sa.event.remove(store_backend.engine, "before_cursor_execute", count_statement)
+
+    # only the value of the row with the same key, and not of the rows sharing its first key column, is updated
+    store_backend.set(("1", "1"), "updated")
+    store_backend.set_many([(("2", "2"), "updated"), (("new", "new"), "new")])
+    assert store_backend.get_many(
+        [("1", "1"), ("1", "11"), ("2", "2"), ("new", "new")]
+    ) == [
+        "updated",
+        "value_11",
+        "updated",
+        "new",
+    ]
+
+    with pytest.raises(StoreBackendBulkOperationError) as exc_info:
+        store_backend.get_many([("1", "1"), ("1", "missing")])
+    assert exc_info.value.results == ["updated", None]
+    assert isinstance(exc_info.value.errors[("1", "missing")], StoreError)
+
+
 def test_database_store_backend_url_instantiation(caplog, sa, test_backends):
     if "postgresql" not in test_backends:
         pytest.skip("test_database_store_backend_get_url_for_key requires postgresql")
@@ -1,5 +1,6 @@
 import datetime
 import os
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -247,3 +248,56 @@ def test_database_evaluation_parameter_store_get_bind_params(param_store):
         "urn:great_expectations:validations:asset2.warning:"
         "expect_column_values_to_match_regex.result.unexpected_percent:column=mycol": 12.3456789,
     }
+
+
+def test_evaluation_parameter_store_get_bind_params_fetches_all_values_at_once(sa):
+    # Use sqlite so we don't require postgres for this test.
+    param_store = instantiate_class_from_config(
+        config={
+            "class_name": "EvaluationParameterStore",
+            "store_backend": {
+                "class_name": "DatabaseStoreBackend",
+                "credentials": {"drivername": "sqlite"},
+            },
+        },
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={},
+    )
+    run_id = RunIdentifier(run_name="my_run")
+    for metric_name, metric_value in [
+        ("expect_table_row_count_to_be_between.result.observed_value", 512),
+        ("expect_column_values_to_be_unique.result.unexpected_percent", 1.5),
+    ]:
+        param_store.set(
+            ValidationMetricIdentifier(
+                run_id=run_id,
+                data_asset_name=None,
+                expectation_suite_identifier="asset.warning",
+                metric_name=metric_name,
+                metric_kwargs_id=None,
+            ),
+            metric_value,
+        )
+    param_store.set(
+        ValidationMetricIdentifier(
+            run_id=RunIdentifier(run_name="other_run"),
+            data_asset_name=None,
+            expectation_suite_identifier="asset.warning",
+            metric_name="expect_table_row_count_to_be_between.result.observed_value",
+            metric_kwargs_id=None,
+        ),
+        1024,
+    )
+
+    with mock.patch.object(
+        param_store.store_backend, "_get", side_effect=AssertionError
+    ):
+        params = param_store.get_bind_params(run_id)
+    assert params == {
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_table_row_count_to_be_between.result.observed_value": 512,
+        "urn:great_expectations:validations:asset.warning:"
+        "expect_column_values_to_be_unique.result.unexpected_percent": 1.5,
+    }
@@ -1,8 +1,15 @@
+import datetime
 import os
 
+import pandas as pd
 import pytest
 
 import tests.test_utils as test_utils
+from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -92,3 +99,114 @@ def test_metric_store_store_backend_id(in_memory_param_store):
     assert in_memory_param_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(in_memory_param_store.store_backend_id)
+
+
+@pytest.fixture(
+    params=[
+        {"class_name": "InMemoryStoreBackend"},
+        # Use sqlite so we don't require postgres for this test.
+        {"class_name": "DatabaseStoreBackend", "credentials": {"drivername": "sqlite"}},
+        {"class_name": "ParquetStoreBackend"},
+    ]
+)
+def metric_history_store(request, tmp_path):
+    if request.param["class_name"] == "ParquetStoreBackend":
+        pytest.importorskip("pyarrow")
+
+    store = instantiate_class_from_config(
+        config={"class_name": "MetricStore", "store_backend": dict(request.param)},
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    metrics = []
+    for day in range(1, 11):
+        run_id = RunIdentifier(
+            run_name=f"run_{day}", run_time=datetime.datetime(2021, 1, day)
+        )
+        for data_asset_name, row_count in [("orders", 100 * day), ("users", day)]:
+            metrics.append(
+                (
+                    ValidationMetricIdentifier(
+                        run_id=run_id,
+                        data_asset_name=data_asset_name,
+                        expectation_suite_identifier=ExpectationSuiteIdentifier(
+                            f"{data_asset_name}.warning"
+                        ),
+                        metric_name="expect_table_row_count_to_be_between.result.observed_value",
+                        metric_kwargs_id=None,
+                    ),
+                    row_count,
+                )
+            )
+            metrics.append(
+                (
+                    ValidationMetricIdentifier(
+                        run_id=run_id,
+                        data_asset_name=data_asset_name,
+                        expectation_suite_identifier=ExpectationSuiteIdentifier(
+                            f"{data_asset_name}.warning"
+                        ),
+                        metric_name="statistics.success_percent",
+                        metric_kwargs_id=None,
+                    ),
+                    100.0,
+                )
+            )
+    store.set_many(metrics)
+    return store
+
+
+def test_metric_store_get_metric_history(metric_history_store):
+    history = metric_history_store.get_metric_history(
+        metric_name="expect_table_row_count_to_be_between.result.observed_value",
+        data_asset_name="orders",
+        limit=3,
+    )
+    assert list(history.columns) == [
+        "run_name",
+        "run_time",
+        "data_asset_name",
+        "expectation_suite_name",
+        "metric_name",
+        "metric_kwargs_id",
+        "value",
+    ]
+    # the most recent values, in chronological order
+    assert history["run_name"].tolist() == ["run_8", "run_9", "run_10"]
+    assert history["value"].tolist() == [800, 900, 1000]
+    assert history["run_time"].iloc[-1] == pd.Timestamp("2021-01-10", tz="UTC")
+    assert history["expectation_suite_name"].unique().tolist() == ["orders.warning"]
+    assert history["metric_kwargs_id"].isnull().all()
+
+    history = metric_history_store.get_metric_history(
+        expectation_suite_name="users.warning",
+        start_time=datetime.datetime(2021, 1, 3),
+        end_time="2021-01-04T00:00:00+00:00",
+    )
+    assert len(history) == 4
+    assert set(history["run_name"]) == {"run_3", "run_4"}
+    assert set(history["metric_name"]) == {
+        "expect_table_row_count_to_be_between.result.observed_value",
+        "statistics.success_percent",
+    }
+
+    # a metric that is set again has its new value
+    metric_history_store.set(
+        ValidationMetricIdentifier(
+            run_id=RunIdentifier(
+                run_name="run_10", run_time=datetime.datetime(2021, 1, 10)
+            ),
+            data_asset_name="users",
+            expectation_suite_identifier=ExpectationSuiteIdentifier("users.warning"),
+            metric_name="statistics.success_percent",
+            metric_kwargs_id=None,
+        ),
+        50.0,
+    )
+    history = metric_history_store.get_metric_history(
+        metric_name="statistics.success_percent", data_asset_name="users", limit=1
+    )
+    assert history["value"].tolist() == [50.0]
+    assert len(metric_history_store.get_metric_history()) == 40
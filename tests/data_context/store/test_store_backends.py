@@ -12,6 +12,7 @@ import tests.test_utils as test_utils
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import (
     InMemoryStoreBackend,
+    ParquetStoreBackend,
     StoreBackend,
     TupleAzureBlobStoreBackend,
     TupleFilesystemStoreBackend,
@@ -22,7 +23,12 @@ from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.exceptions import InvalidKeyError, StoreBackendError, StoreError
+from great_expectations.exceptions import (
+    InvalidKeyError,
+    StoreBackendBulkOperationError,
+    StoreBackendError,
+    StoreError,
+)
 from great_expectations.util import gen_directory_tree_str
 
 
@@ -288,11 +294,67 @@ def test_InMemoryStoreBackend():
     assert my_store.has_key(("A",)) is True
     assert my_store.has_key(("C",)) is False
     assert my_store.list_keys() == [(".ge_store_backend_id",), ("A",), ("B",)]
+    assert my_store.get_all(("B",)) == {("B",): {"x": 1}}
 
     with pytest.raises(StoreError):
         my_store.get_url_for_key(my_key)
 
 
+def test_ParquetStoreBackend(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    my_store = ParquetStoreBackend(
+        base_directory="metrics",
+        root_directory=str(tmp_path),
+        key_columns=["k1", "k2"],
+        partition_by="k2",
+    )
+    store_backend_id = my_store.store_backend_id
+    assert test_utils.validate_uuid4(store_backend_id)
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get(("A", "x"))
+
+    my_store.set(("A", "x"), "aaa")
+    my_store.set_many([(("B", "x"), "bbb"), (("A", "y/z"), "ccc")])
+    my_store.set(("A", "x"), "aaa2")
+    assert my_store.get(("A", "x")) == "aaa2"
+    assert my_store.has_key(("A", "y/z")) is True
+    assert my_store.has_key(("B", "y/z")) is False
+    assert sorted(my_store.list_keys()) == [("A", "x"), ("A", "y/z"), ("B", "x")]
+    assert my_store.get_all(("A",)) == {("A", "x"): "aaa2", ("A", "y/z"): "ccc"}
+    assert sorted(os.listdir(tmp_path / "metrics")) == [
+        ".ge_store_backend_id",
+        "k2=x",
+        "k2=y%2Fz",
+    ]
+
+    with pytest.raises(StoreBackendBulkOperationError) as exc_info:
+        my_store.get_many([("B", "x"), ("C", "x")])
+    assert exc_info.value.results == ["bbb", None]
+    assert list(exc_info.value.errors.keys()) == [("C", "x")]
+
+    assert my_store.remove_key(("A", "x")) is True
+    assert my_store.remove_key(("A", "x")) is False
+    assert sorted(my_store.list_keys()) == [("A", "y/z"), ("B", "x")]
+    assert len(os.listdir(tmp_path / "metrics" / "k2=x")) == 1
+
+    my_store.move(("A", "y/z"), ("C", "x"))
+    assert sorted(my_store.list_keys()) == [("B", "x"), ("C", "x")]
+    assert my_store.get(("C", "x")) == "ccc"
+    with pytest.raises(InvalidKeyError):
+        my_store.move(("A", "y/z"), ("D", "x"))
+
+    # a new backend on the same directory finds the values and the id of the store
+    my_store = ParquetStoreBackend(
+        base_directory=str(tmp_path / "metrics"),
+        key_columns=["k1", "k2"],
+        partition_by="k2",
+    )
+    assert my_store.store_backend_id == store_backend_id
+    assert my_store.get(("B", "x")) == "bbb"
+
+
 def test_tuple_filesystem_store_filepath_prefix_error(tmp_path_factory):
     path = str(
         tmp_path_factory.mktemp("test_tuple_filesystem_store_filepath_prefix_error")
@@ -465,6 +527,15 @@ def test_TupleS3StoreBackend_with_prefix():
     assert my_store.get(("BBB",)) == "bbb"
 
     assert set(my_store.list_keys()) == {("AAA",), ("BBB",), (".ge_store_backend_id",)}
+    # versions are the ETags of the listing, which change when a value is rewritten
+    versions = my_store.list_keys_with_versions()
+    assert set(versions.keys()) == set(my_store.list_keys())
+    my_store.set(("BBB",), "bbb2")
+    new_versions = my_store.list_keys_with_versions()
+    assert new_versions[("AAA",)] == versions[("AAA",)]
+    assert new_versions[("BBB",)] != versions[("BBB",)]
+    my_store.set(("BBB",), "bbb")
+
     assert {
         s3_object_info["Key"]
         for s3_object_info in boto3.client("s3").list_objects_v2(
@@ -748,6 +819,63 @@ def test_TupleS3StoreBackend_with_empty_prefixes():
     )
 
 
+@mock_s3
+def test_TupleS3StoreBackend_get_many_and_set_many():
+    """
+    What does this test test and why?
+
+    get_many and set_many read and write keys concurrently: their results must still come back in the order of the
+    keys, and a key that fails must not prevent the others from being read.
+    """
+    bucket = "leakybucket"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix="this_is_a_test_prefix",
+    )
+
+    keys = [(f"{i:03d}",) for i in range(40)]
+    object_keys = my_store.set_many(
+        [(key, f"value_{key[0]}") for key in keys], max_workers=8
+    )
+    assert object_keys == [f"this_is_a_test_prefix/my_file_{key[0]}" for key in keys]
+
+    assert my_store.get_many(list(reversed(keys)), max_workers=8) == [
+        f"value_{key[0]}" for key in reversed(keys)
+    ]
+    assert my_store.get_all() == {
+        **{key: f"value_{key[0]}" for key in keys},
+        (".ge_store_backend_id",): f"store_backend_id = {my_store.store_backend_id}",
+    }
+
+    with pytest.raises(StoreBackendBulkOperationError) as exc_info:
+        my_store.get_many([("001",), ("missing",), ("002",)])
+    assert exc_info.value.results == ["value_001", None, "value_002"]
+    assert list(exc_info.value.errors.keys()) == [("missing",)]
+    assert isinstance(exc_info.value.errors[("missing",)], InvalidKeyError)
+
+    # the store keeps using the client it created first
+    assert my_store._get_s3_client() is my_store._get_s3_client()
+
+    # the threads of the store, and the S3 resources they created, are kept across calls
+    bulk_executor = my_store._bulk_executor
+    thread_count = len(bulk_executor._threads)
+    with patch.object(
+        my_store, "_create_resource", wraps=my_store._create_resource
+    ) as mock_create_resource:
+        for _ in range(3):
+            assert my_store.get_many(keys, max_workers=8) == [
+                f"value_{key[0]}" for key in keys
+            ]
+    assert my_store._bulk_executor is bulk_executor
+    # only threads started by these calls may create a resource
+    assert mock_create_resource.call_count <= len(bulk_executor._threads) - thread_count
+
+
 def test_TupleGCSStoreBackend_base_public_path():
     """
     What does this test and why?
@@ -834,6 +962,32 @@ def test_TupleGCSStoreBackend():
             b"aaa", content_type="text/html"
         )
 
+        mock_blob = mock_bucket.get_blob.return_value
+        mock_str = mock_blob.download_as_string.return_value
+
+        my_store.get(("BBB",))
+
+        # the client and the bucket are reused by every call of the store
+        mock_gcs_client.assert_called_once_with("dummy-project")
+        mock_client.get_bucket.assert_called_once_with("leakybucket")
+        mock_bucket.get_blob.assert_called_with("this_is_a_test_prefix/my_file_BBB")
+        mock_blob.download_as_string.assert_called()
+        mock_str.decode.assert_called_with("utf-8")
+
+        my_store.list_keys()
+
+        mock_client.list_blobs.assert_called_once_with(
+            "leakybucket", prefix="this_is_a_test_prefix"
+        )
+
+        my_store.remove_key("leakybucket")
+
+        mock_bucket.delete_blobs.assert_called_once()
+
+        mock_bucket.get_blob.return_value = None
+        with pytest.raises(InvalidKeyError):
+            my_store.get(("non_existent_key",))
+
     with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
         mock_client = mock_gcs_client.return_value
         mock_bucket = mock_client.get_bucket.return_value
@@ -855,47 +1009,6 @@ def test_TupleGCSStoreBackend():
             b"aaa", content_type="image/png"
         )
 
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-
-        mock_client = mock_gcs_client.return_value
-        mock_bucket = mock_client.get_bucket.return_value
-        mock_blob = mock_bucket.get_blob.return_value
-        mock_str = mock_blob.download_as_string.return_value
-
-        my_store.get(("BBB",))
-
-        mock_gcs_client.assert_called_once_with("dummy-project")
-        mock_client.get_bucket.assert_called_once_with("leakybucket")
-        mock_bucket.get_blob.assert_called_once_with(
-            "this_is_a_test_prefix/my_file_BBB"
-        )
-        mock_blob.download_as_string.assert_called_once()
-        mock_str.decode.assert_called_once_with("utf-8")
-
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-
-        mock_client = mock_gcs_client.return_value
-
-        my_store.list_keys()
-
-        mock_client.list_blobs.assert_called_once_with(
-            "leakybucket", prefix="this_is_a_test_prefix"
-        )
-
-        my_store.remove_key("leakybucket")
-
-        from google.cloud.exceptions import NotFound
-
-        try:
-            mock_client.get_bucket.assert_called_once_with("leakybucket")
-        except NotFound:
-            pass
-
-    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
-        mock_gcs_client.side_effect = InvalidKeyError("Hi I am an InvalidKeyError")
-        with pytest.raises(InvalidKeyError):
-            my_store.get(("non_existent_key",))
-
     run_id = RunIdentifier("my_run_id", datetime.datetime.utcnow())
     key = ValidationResultIdentifier(
         ExpectationSuiteIdentifier(expectation_suite_name="my_suite_name"),
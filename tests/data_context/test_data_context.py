@@ -596,6 +596,7 @@ project_path/
         == """\
 data_docs/
     local_site/
+        .ge_site_manifest.json
         index.html
         expectations/
             random/
@@ -1909,6 +1910,74 @@ data_connectors:
     assert my_validator.expectation_suite_name == "A_expectation_suite"
 
 
+def test_get_validator_with_column_projection(empty_data_context, tmp_path_factory):
+    context = empty_data_context
+
+    base_directory = str(
+        tmp_path_factory.mktemp("test_get_validator_with_column_projection")
+    )
+    pd.DataFrame(
+        {"a": [1, 2, 3], "b": [4, 5, 6], "c": [7, 8, 9], "d": ["x", "y", "z"]}
+    ).to_csv(os.path.join(base_directory, "some_file.csv"), index=False)
+
+    yaml_config = f"""
+class_name: Datasource
+
+execution_engine:
+    class_name: PandasExecutionEngine
+
+data_connectors:
+    my_filesystem_data_connector:
+        class_name: ConfiguredAssetFilesystemDataConnector
+        base_directory: {base_directory}
+        default_regex:
+            pattern: (.+)\\.csv
+            group_names:
+                - alphanumeric
+        assets:
+            A:
+"""
+
+    config = yaml.load(yaml_config)
+    context.add_datasource(
+        "my_directory_datasource",
+        **config,
+    )
+
+    suite = ExpectationSuite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "min_value": 0,
+                "row_condition": "c > 7",
+                "condition_parser": "pandas",
+            },
+        )
+    )
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["a", "b", "c", "d"]},
+        )
+    )
+
+    my_validator = context.get_validator(
+        datasource_name="my_directory_datasource",
+        data_connector_name="my_filesystem_data_connector",
+        data_asset_name="A",
+        partition_identifiers={
+            "alphanumeric": "some_file",
+        },
+        expectation_suite=suite,
+        column_projection=True,
+    )
+    assert my_validator.active_batch_spec["column_projection"] == ["a", "c"]
+    assert list(my_validator.active_batch.data.dataframe.columns) == ["a", "c"]
+    assert my_validator.validate().success
+
+
 def test_get_batch_multiple_datasources_do_not_scan_all(
     data_context_with_bad_datasource,
 ):
@@ -3,6 +3,10 @@ import pytest
 
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    estimate_metric_value_size,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -167,3 +171,86 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_metrics_uses_metric_cache():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    max_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+
+    assert engine.resolve_metrics(metrics_to_resolve=(max_metric,)) == {
+        max_metric.id: 3
+    }
+    assert engine.resolve_metrics(metrics_to_resolve=(max_metric,)) == {
+        max_metric.id: 3
+    }
+    assert engine.get_cached_metrics([max_metric]) == {max_metric.id: 3}
+    stats = engine.metric_cache_stats["column.max"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["latency"] > 0
+
+    # Reloading the batch invalidates the values computed on it
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [10, 20], "b": [1, 2]}))
+    assert engine.get_cached_metrics([max_metric]) == {}
+    assert engine.resolve_metrics(metrics_to_resolve=(max_metric,)) == {
+        max_metric.id: 20
+    }
+
+    engine = PandasExecutionEngine(caching=False, batch_data_dict={"my_id": df})
+    engine.resolve_metrics(metrics_to_resolve=(max_metric,))
+    assert engine.get_cached_metrics([max_metric]) == {}
+    assert engine.metric_cache_stats == {}
+
+
+def test_metric_cache_evicts_least_recently_used_values():
+    value = list(range(100))
+    value_bytes = estimate_metric_value_size(value)
+    cache = MetricCache(max_bytes=2 * value_bytes)
+
+    cache.set(("batch_1", 1), ("metric", "a", ()), value)
+    cache.set(("batch_1", 1), ("metric", "b", ()), value)
+    assert cache.get(("batch_1", 1), ("metric", "a", ())) == (True, value)
+    cache.set(("batch_2", 1), ("metric", "c", ()), value)
+    assert len(cache) == 2
+    assert cache.size_bytes == 2 * value_bytes
+    assert cache.get(("batch_1", 1), ("metric", "b", ())) == (False, None)
+
+    cache.invalidate("batch_1")
+    assert cache.get(("batch_1", 1), ("metric", "a", ())) == (False, None)
+    assert cache.get(("batch_2", 1), ("metric", "c", ())) == (True, value)
+    assert cache.stats == {"metric": {"hits": 2, "misses": 2, "latency": 0.0}}
+
+
+def test_resolve_metrics_does_not_share_mutable_cached_values():
+    df = pd.DataFrame({"a": [1, 2, 2, 3]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    value_counts_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "value", "collate": None},
+    )
+    distinct_values_metric = MetricConfiguration(
+        metric_name="column.distinct_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    value_counts = engine.resolve_metrics(metrics_to_resolve=(value_counts_metric,))[
+        value_counts_metric.id
+    ]
+    value_counts[:] = 0
+    distinct_values = engine.resolve_metrics(
+        metrics_to_resolve=(distinct_values_metric,)
+    )[distinct_values_metric.id]
+    distinct_values.add(99)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(value_counts_metric, distinct_values_metric)
+    )
+    assert results[value_counts_metric.id].tolist() == [1, 2, 1]
+    assert results[distinct_values_metric.id] == {1, 2, 3}
+    assert engine.metric_cache_stats["column.value_counts"]["hits"] == 1
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import List
 
 import boto3
+import numpy as np
 import pandas as pd
 import pytest
 from botocore.errorfactory import ClientError
@@ -21,6 +22,7 @@ from great_expectations.core.id_dict import PartitionDefinition
 from great_expectations.datasource.data_connector import ConfiguredAssetS3DataConnector
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
@@ -174,6 +176,59 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_caches_row_condition_data():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    row_condition_bytes = int(
+        df.query("b > 2", parser="pandas")
+        .reset_index(drop=True)
+        .memory_usage(deep=False)
+        .sum()
+    )
+    engine = PandasExecutionEngine(
+        compute_domain_cache_max_bytes=2 * row_condition_bytes
+    )
+    assert engine.config["compute_domain_cache_max_bytes"] == 2 * row_condition_bytes
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    for domain_type in ["table", "identity"]:
+        cached_data, _, _ = engine.get_compute_domain(
+            domain_kwargs, domain_type=domain_type
+        )
+        assert list(cached_data["a"]) == [2, 3]
+    assert (
+        engine.get_compute_domain(
+            {**domain_kwargs, "column": "a"}, domain_type="column"
+        )[0]
+        is data
+    )
+    assert engine.compute_domain_cache_stats == {
+        "hits": 3,
+        "misses": 1,
+        "entries": 1,
+        "bytes": row_condition_bytes,
+        "max_bytes": 2 * row_condition_bytes,
+    }
+
+    # The least recently used DataFrame is evicted once the byte budget is exceeded
+    engine.get_compute_domain(
+        {"row_condition": "a < 3", "condition_parser": "pandas"}, domain_type="table"
+    )
+    engine.get_compute_domain(domain_kwargs, domain_type="table")
+    engine.get_compute_domain(
+        {"row_condition": "a > 2", "condition_parser": "pandas"}, domain_type="table"
+    )
+    assert engine.compute_domain_cache_stats["entries"] == 2
+    assert engine.get_compute_domain(domain_kwargs, domain_type="table")[0] is data
+    assert engine.compute_domain_cache_stats["misses"] == 3
+
+    # Reloading the batch invalidates its cached DataFrames
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert engine.compute_domain_cache_stats["entries"] == 0
+    assert engine.compute_domain_cache_stats["bytes"] == 0
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = PandasExecutionEngine()
@@ -230,6 +285,95 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metrics_with_executor():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.max", "column.min"]
+        for column in ["a", "b"]
+    ]
+    with engine.metric_resolution_executor(max_workers=4) as executor:
+        assert executor is not None
+        metrics = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, executor=executor
+        )
+
+    assert metrics == engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+    assert metrics[("column.max", "column=b", ())] == 7
+    assert metrics[("column.min", "column=a", ())] == 1
+
+    with engine.metric_resolution_executor(max_workers=1) as executor:
+        assert executor is None
+
+
+def test_get_column_domain_values_reuses_materialized_domain():
+    df = pd.DataFrame({"a": [1, None, 3, 4, None], "b": [5, 6, 7, 8, 9]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    domain_kwargs = {
+        "column": "a",
+        "row_condition": "b>5",
+        "condition_parser": "pandas",
+    }
+
+    values, compute_kwargs, accessor_kwargs = engine.get_column_domain_values(
+        domain_kwargs, filter_column_isnull=True
+    )
+    assert list(values) == [3, 4]
+    assert list(values.index) == [1, 2]
+    assert compute_kwargs == {"row_condition": "b>5", "condition_parser": "pandas"}
+    assert accessor_kwargs == {"column": "a"}
+
+    # The filtered domain is shared by every column, and the null mask by every metric on the column
+    values, _, _ = engine.get_column_domain_values(
+        {**domain_kwargs, "column": "b"}, filter_column_isnull=True
+    )
+    assert list(values) == [6, 7, 8, 9]
+    # (the filtered domain and the non-null positions of both columns)
+    assert len(engine._compute_domain_cache) == 3
+
+    values, _, _ = engine.get_column_domain_values(
+        domain_kwargs, filter_column_isnull=True, positions=np.array([1])
+    )
+    assert list(values) == [4]
+    rows = engine.get_column_domain_rows(
+        domain_kwargs, filter_column_isnull=True, positions=np.array([1])
+    )
+    assert rows.to_dict(orient="list") == {"a": [4], "b": [8]}
+
+    # Reloading the batch invalidates the materialized domains
+    engine.load_batch_data(
+        "made-up-id", pd.DataFrame({"a": [10, 11, 12, 13], "b": [5, 6, 7, 8]})
+    )
+    assert len(engine._compute_domain_cache) == 0
+    values, _, _ = engine.get_column_domain_values(
+        domain_kwargs, filter_column_isnull=True
+    )
+    assert list(values) == [11, 12, 13]
+
+
+def test_nonnull_positions_count_towards_compute_domain_cache_budget():
+    df = pd.DataFrame({"a": [1, None, 3, 4, None], "b": [5, None, 7, None, 9]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"made-up-id": df}, compute_domain_cache_max_bytes=30
+    )
+    for column, expected_values in [("a", [1, 3, 4]), ("b", [5, 7, 9])]:
+        values, _, _ = engine.get_column_domain_values(
+            {"column": column}, filter_column_isnull=True
+        )
+        assert list(values) == expected_values
+    # The positions of each column take 24 bytes: those of "a" were evicted for those of "b"
+    assert engine.compute_domain_cache_stats["bytes"] == 24
+    assert list(engine._compute_domain_cache.keys()) == [
+        ("made-up-id", "nonnull_positions", (), "b")
+    ]
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -467,6 +611,202 @@ def test_get_batch_s3_compressed_files(test_s3_files_compressed, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+@pytest.mark.parametrize("reader_method", ["read_csv", "read_parquet"])
+def test_get_batch_with_column_projection(reader_method, test_df, tmpdir):
+    path = str(Path(tmpdir) / "test_file")
+    if reader_method == "read_csv":
+        test_df.to_csv(path, index=False)
+    else:
+        test_df.to_parquet(path, index=False)
+
+    engine = PandasExecutionEngine()
+    batch_data = engine.get_batch_data(
+        PathBatchSpec(
+            path=path,
+            reader_method=reader_method,
+            column_projection=["id", "batch_id", "not_a_column"],
+        )
+    )
+    assert list(batch_data.dataframe.columns) == ["id", "batch_id"]
+    assert batch_data.dataframe.shape == (120, 2)
+    assert batch_data.source_columns == list(test_df.columns)
+
+    # table-level metrics still see every column of the source
+    engine.load_batch_data("projected_batch", batch_data)
+    table_columns = MetricConfiguration(
+        "table.columns",
+        metric_domain_kwargs={"batch_id": "projected_batch"},
+        metric_value_kwargs=dict(),
+    )
+    table_columns.metric_dependencies = {
+        "table.column_types": MetricConfiguration(
+            "table.column_types",
+            metric_domain_kwargs={"batch_id": "projected_batch"},
+            metric_value_kwargs={"include_nested": True},
+        )
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(table_columns.metric_dependencies["table.column_types"],)
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(table_columns,), metrics=results
+    )
+    assert results[table_columns.id] == list(test_df.columns)
+
+    # a projection that matches no column keeps the first one, so that the batch keeps its rows
+    batch_data = engine.get_batch_data(
+        PathBatchSpec(
+            path=path, reader_method=reader_method, column_projection=["not_a_column"]
+        )
+    )
+    assert batch_data.dataframe.shape == (120, 1)
+
+
+def test_get_batch_s3_compressed_files_with_column_projection(
+    test_s3_files_compressed, test_df_small
+):
+    bucket, keys = test_s3_files_compressed
+    full_path = f"s3a://{os.path.join(bucket, keys[0])}"
+
+    batch_spec = S3BatchSpec(
+        path=full_path, reader_method="read_csv", column_projection=["col2"]
+    )
+    batch_data = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+    assert batch_data.dataframe.equals(test_df_small[["col2"]])
+    assert batch_data.source_columns == ["col1", "col2"]
+
+
+@pytest.mark.parametrize("reader_method", ["read_csv", "read_parquet"])
+def test_get_batch_with_chunk_size(reader_method, test_df, tmpdir):
+    path = str(Path(tmpdir) / "test_file")
+    if reader_method == "read_csv":
+        test_df.to_csv(path, index=False)
+    else:
+        test_df.to_parquet(path, index=False)
+
+    batch_data = PandasExecutionEngine().get_batch_data(
+        PathBatchSpec(
+            path=path,
+            reader_method=reader_method,
+            chunk_size=50,
+            sampling_method="_sample_using_mod",
+            sampling_kwargs={"column_name": "id", "mod": 2, "value": 0},
+        )
+    )
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        batch_data.dataframe
+
+    chunks = list(batch_data.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [25, 25, 10]
+    # chunks are sampled independently, and keep the position of their rows in the source as their index
+    assert list(pd.concat(chunks).id) == list(test_df.id[test_df.id % 2 == 0])
+    assert list(chunks[1].index) == list(range(50, 100, 2))
+    # the source is read again on every pass over the batch
+    assert sum(len(chunk) for chunk in batch_data.iter_chunks()) == 60
+
+
+def test_get_batch_with_chunk_size_and_unsupported_reader(test_df, tmpdir):
+    path = str(Path(tmpdir) / "test_file.json")
+    test_df.to_json(path)
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        PandasExecutionEngine().get_batch_data(PathBatchSpec(path=path, chunk_size=50))
+
+
+def test_get_batch_s3_compressed_files_with_chunk_size(
+    test_s3_files_compressed, test_df_small
+):
+    bucket, keys = test_s3_files_compressed
+    full_path = f"s3a://{os.path.join(bucket, keys[0])}"
+
+    batch_spec = S3BatchSpec(path=full_path, reader_method="read_csv", chunk_size=2)
+    batch_data = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+    chunks = list(batch_data.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks).equals(test_df_small)
+
+
+def test_resolve_metrics_on_chunked_batch(test_df, tmpdir):
+    path = str(Path(tmpdir) / "test_file.csv")
+    test_df.to_csv(path, index=False)
+
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(
+        "chunked_batch", engine.get_batch_data(PathBatchSpec(path=path, chunk_size=7))
+    )
+    column_domain = {"batch_id": "chunked_batch", "column": "id"}
+    row_count = MetricConfiguration(
+        "table.row_count", metric_domain_kwargs={"batch_id": "chunked_batch"}
+    )
+    column_mean = MetricConfiguration("column.mean", column_domain)
+    column_sd = MetricConfiguration("column.standard_deviation", column_domain)
+    column_max = MetricConfiguration("column.max", column_domain)
+    value_counts = MetricConfiguration(
+        "column.value_counts",
+        {"batch_id": "chunked_batch", "column": "batch_id"},
+        {"sort": "value", "collate": None},
+    )
+    condition = MetricConfiguration(
+        "column_values.between.condition",
+        column_domain,
+        {"min_value": 10, "max_value": 100, "strict_min": False, "strict_max": False},
+    )
+    unexpected_count = MetricConfiguration(
+        "column_values.between.unexpected_count",
+        column_domain,
+        condition.metric_value_kwargs,
+    )
+    unexpected_count.metric_dependencies = {"unexpected_condition": condition}
+    unexpected_values = MetricConfiguration(
+        "column_values.between.unexpected_values",
+        column_domain,
+        {
+            **condition.metric_value_kwargs,
+            "result_format": {
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": 20,
+            },
+        },
+    )
+    unexpected_values.metric_dependencies = {"unexpected_condition": condition}
+
+    # conditions are only computed on each chunk by the metrics that depend on them
+    results = engine.resolve_metrics(metrics_to_resolve=(condition,))
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            row_count,
+            column_mean,
+            column_sd,
+            column_max,
+            value_counts,
+            unexpected_count,
+            unexpected_values,
+        ),
+        metrics=results,
+    )
+    assert results[row_count.id] == 120
+    assert results[column_mean.id] == pytest.approx(test_df.id.mean())
+    assert results[column_sd.id] == pytest.approx(test_df.id.std())
+    assert results[column_max.id] == 119
+    assert results[value_counts.id].equals(
+        test_df.batch_id.value_counts()
+        .sort_index()
+        .rename("count")
+        .rename_axis("value")
+    )
+    assert results[unexpected_count.id] == 29
+    assert results[unexpected_values.id] == list(range(10)) + list(range(101, 111))
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        engine.check_metric_support(MetricConfiguration("column.median", column_domain))
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        engine.resolve_metrics(
+            metrics_to_resolve=(
+                MetricConfiguration("column_values.unique.condition", column_domain),
+            )
+        )
+
+
 def test_get_batch_with_split_on_column_value(test_df):
     split_df = PandasExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -622,6 +962,17 @@ def test_sample_using_random(test_df):
     assert sampled_df.dataframe.shape == (13, 10)
 
 
+def test_sample_using_random_draws_like_random_module(test_df):
+    random.seed(2)
+    expected_mask = [random.random() < 0.5 for _ in range(len(test_df))]
+    next_random_value = random.random()
+
+    random.seed(2)
+    sampled_df = PandasExecutionEngine._sample_using_random(test_df, p=0.5)
+    assert sampled_df.equals(test_df[expected_mask])
+    assert random.random() == next_random_value
+
+
 def test_sample_using_mod(test_df):
     sampled_df = PandasExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import pytest
 
 from great_expectations.core.batch import BatchSpec
 from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
 try:
@@ -119,3 +122,169 @@ def test_instantiation_with_and_without_temp_table(sqlite_view_engine, sa):
     )
     res = engine.get_batch_data_and_markers(batch_spec=my_batch_spec)
     assert len(res) == 2
+
+
+def test_temp_table_reuse_within_ttl(sqlite_view_engine, sa):
+    engine = SqlAlchemyExecutionEngine(engine=sqlite_view_engine, temp_table_ttl=600)
+    selectable = sa.select("*").select_from(sa.text("main.test_table"))
+
+    batch_data = SqlAlchemyBatchData(execution_engine=engine, selectable=selectable)
+    engine.load_batch_data("my_batch", batch_data)
+    # Loading the same query again (e.g. in a later checkpoint run) reuses its temporary table
+    reloaded_batch_data = SqlAlchemyBatchData(
+        execution_engine=engine, selectable=selectable
+    )
+    engine.load_batch_data("my_batch", reloaded_batch_data)
+    assert reloaded_batch_data.selectable.name == batch_data.selectable.name
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 2
+
+    # Another query gets its own temporary table
+    other_batch_data = SqlAlchemyBatchData(
+        execution_engine=engine,
+        selectable=selectable.where(sa.column("a") > 1),
+    )
+    assert other_batch_data.selectable.name != batch_data.selectable.name
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 3
+
+    # Unloaded batches keep their temporary table until the ttl expires or the engine is closed
+    engine.unload_batch_data("my_batch")
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 3
+    engine.close()
+    assert engine.temp_table_manager.temp_table_names == []
+
+
+def test_temp_tables_dropped_when_batches_are_unloaded(sqlite_view_engine, sa):
+    engine = SqlAlchemyExecutionEngine(engine=sqlite_view_engine)
+    selectable = sa.select("*").select_from(sa.text("main.test_table"))
+
+    batch_data = SqlAlchemyBatchData(execution_engine=engine, selectable=selectable)
+    engine.load_batch_data("my_batch", batch_data)
+    reloaded_batch_data = SqlAlchemyBatchData(
+        execution_engine=engine, selectable=selectable
+    )
+    assert reloaded_batch_data.selectable.name != batch_data.selectable.name
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 3
+
+    # Without a ttl, temporary tables are not reused, and are dropped as soon as their batch is replaced or unloaded
+    engine.load_batch_data("my_batch", reloaded_batch_data)
+    assert get_sqlite_temp_table_names(sqlite_view_engine) == {
+        "test_temp_view",
+        reloaded_batch_data.selectable.name,
+    }
+    engine.unload_batch_data("my_batch")
+    assert get_sqlite_temp_table_names(sqlite_view_engine) == {"test_temp_view"}
+
+
+def test_temp_table_statistics_and_indexes(sqlite_view_engine, sa):
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine,
+        analyze_temp_tables=True,
+        temp_table_index_columns=["a"],
+    )
+    batch_data = SqlAlchemyBatchData(
+        execution_engine=engine,
+        selectable=sa.select("*").select_from(sa.text("main.test_table")),
+    )
+    table_name = batch_data.selectable.name
+    assert f"ix_{table_name}_a" in get_sqlite_temp_table_names(sqlite_view_engine)
+    assert "sqlite_stat1" in get_sqlite_temp_table_names(sqlite_view_engine)
+
+
+def test_temp_table_batches_are_bound_to_session_connections(sa, tmp_path):
+    db_file = str(tmp_path / "session_connections.db")
+    sa_engine = sa.create_engine(f"sqlite:///{db_file}")
+    pd.DataFrame({"a": [1, 2, 3, 4, 5, 6]}).to_sql("test", sa_engine, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=sa_engine, max_session_connections=2)
+
+    selectables = [
+        sa.select("*").select_from(sa.text("test")).where(sa.column("a") <= 2),
+        sa.select("*").select_from(sa.text("test")).where(sa.column("a") > 2),
+    ]
+    for batch_id, selectable in zip(["small", "large"], selectables):
+        engine.load_batch_data(
+            batch_id,
+            SqlAlchemyBatchData(execution_engine=engine, selectable=selectable),
+        )
+    small_batch, large_batch = (
+        engine.loaded_batch_data_dict["small"],
+        engine.loaded_batch_data_dict["large"],
+    )
+    # Each temporary table is only visible to the connection its batch is bound to, not to the pooled engine
+    assert small_batch.connection is not large_batch.connection
+    assert engine.engine is sa_engine
+    assert not engine.supports_concurrent_metric_resolution
+
+    aggregate_fns = [
+        MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+            metric_value_kwargs=dict(),
+        )
+        for batch_id in ["small", "large"]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=aggregate_fns)
+    maxima = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=aggregate_fn.metric_domain_kwargs,
+            metric_value_kwargs=dict(),
+            metric_dependencies={"metric_partial_fn": aggregate_fn},
+        )
+        for aggregate_fn in aggregate_fns
+    ]
+    results = engine.resolve_metrics(metrics_to_resolve=maxima, metrics=metrics)
+    assert [results[metric.id] for metric in maxima] == [2, 6]
+
+    engine.close()
+    assert small_batch.connection.closed and large_batch.connection.closed
+
+
+def test_threads_bind_temp_table_batches_to_session_connections_of_their_own(
+    sa, tmp_path
+):
+    db_file = str(tmp_path / "session_connections.db")
+    sa_engine = sa.create_engine(f"sqlite:///{db_file}")
+    pd.DataFrame({"a": [1, 2, 3, 4, 5, 6]}).to_sql("test", sa_engine, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=sa_engine)
+
+    def get_max(limit):
+        batch_id = f"batch_{limit}"
+        engine.load_batch_data(
+            batch_id,
+            SqlAlchemyBatchData(
+                execution_engine=engine,
+                selectable=sa.select("*")
+                .select_from(sa.text("test"))
+                .where(sa.column("a") <= limit),
+            ),
+        )
+        connection = engine.loaded_batch_data_dict[batch_id].connection
+        try:
+            aggregate_fn = MetricConfiguration(
+                metric_name="column.max.aggregate_fn",
+                metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+                metric_value_kwargs=dict(),
+            )
+            metrics = engine.resolve_metrics(metrics_to_resolve=(aggregate_fn,))
+            maximum = MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs=aggregate_fn.metric_domain_kwargs,
+                metric_value_kwargs=dict(),
+                metric_dependencies={"metric_partial_fn": aggregate_fn},
+            )
+            return (
+                engine.resolve_metrics(metrics_to_resolve=(maximum,), metrics=metrics)[
+                    maximum.id
+                ],
+                connection,
+            )
+        finally:
+            engine.close_session_connections()
+
+    # sqlite connections (like the cursors of many drivers) cannot be used by other threads than their own
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(get_max, range(1, 7)))
+    assert [maximum for maximum, _ in results] == [1, 2, 3, 4, 5, 6]
+    assert all(connection.closed for _, connection in results)
+    assert engine.loaded_batch_data_dict == {}
+    assert engine.temp_table_manager.temp_table_names == []
@@ -10,6 +10,9 @@ from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.exceptions import InvalidConfigError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
@@ -22,7 +25,7 @@ from great_expectations.expectations.metrics import (
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 # Function to test for spark dataframe equality
-from tests.test_utils import _build_sa_engine
+from tests.test_utils import _build_sa_engine, get_test_validator_with_data
 
 
 def test_instantiation_via_connection_string(sa, test_db_connection_string):
@@ -486,3 +489,285 @@ def test_resolve_metric_bundle_with_nonexistent_metric(sa):
             )
         )
         print(e)
+
+
+def test_resolve_metric_bundle_with_concurrent_queries(sa, tmp_path):
+    db_file = str(tmp_path / "concurrent_queries.db")
+    sa_engine = sa.create_engine(f"sqlite:///{db_file}")
+    pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 1, 2, 2, 2]}).to_sql(
+        "test", sa_engine
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sa_engine.connect(),
+        max_concurrent_queries=4,
+        fuse_filtered_domains=False,
+    )
+    engine.load_batch_data(
+        "my_id", SqlAlchemyBatchData(execution_engine=engine, table_name="test")
+    )
+
+    aggregate_fns = []
+    metrics_to_resolve = []
+    for b_value in [1, 2]:
+        domain_kwargs = {
+            "column": "a",
+            "row_condition": f'col("b")=={b_value}',
+            "condition_parser": "great_expectations__experimental__",
+        }
+        for metric_name in ["column.max", "column.min"]:
+            aggregate_fn = MetricConfiguration(
+                metric_name=f"{metric_name}.aggregate_fn",
+                metric_domain_kwargs=domain_kwargs,
+                metric_value_kwargs=dict(),
+            )
+            aggregate_fns.append(aggregate_fn)
+            metrics_to_resolve.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=domain_kwargs,
+                    metric_value_kwargs=dict(),
+                    metric_dependencies={"metric_partial_fn": aggregate_fn},
+                )
+            )
+    metrics = engine.resolve_metrics(metrics_to_resolve=aggregate_fns)
+
+    # sqlite keeps every query on the connection it was given
+    assert engine._get_concurrent_query_connectable([{}, {}]) is None
+    sequential_results = engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve, metrics=metrics
+    )
+
+    # A file-backed database can be read from several pooled connections at once
+    engine.engine = sa_engine
+    assert engine._get_concurrent_query_connectable([{}, {}]) is sa_engine
+    concurrent_results = engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve, metrics=metrics
+    )
+
+    assert concurrent_results == sequential_results
+    assert [concurrent_results[metric.id] for metric in metrics_to_resolve] == [
+        3,
+        1,
+        6,
+        4,
+    ]
+
+
+def test_fuse_filtered_domains_is_kept_in_config(sa):
+    sa_engine = sa.create_engine("sqlite://")
+    assert "fuse_filtered_domains" not in (
+        SqlAlchemyExecutionEngine(engine=sa_engine).config
+    )
+    assert (
+        SqlAlchemyExecutionEngine(engine=sa_engine, fuse_filtered_domains=False).config[
+            "fuse_filtered_domains"
+        ]
+        is False
+    )
+
+
+def test_resolve_metric_bundle_fuses_filtered_domains(caplog, sa):
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5, None], "b": [1, 1, 1, 2, 2, 2]})
+    fused_engine = _build_sa_engine(df)
+    unfused_engine = _build_sa_engine(df)
+    unfused_engine._fuse_filtered_domains = False
+
+    metric_domain_kwargs_list = [{"column": "a"}] + [
+        {
+            "column": "a",
+            "row_condition": row_condition,
+            "condition_parser": "great_expectations__experimental__",
+        }
+        for row_condition in ['col("b")==1', 'col("b")==2', 'col("a").notnull()']
+    ]
+    aggregate_fns = []
+    metrics_to_resolve = []
+    for metric_domain_kwargs in metric_domain_kwargs_list:
+        for metric_name in ["column.max", "column.sum"]:
+            aggregate_fn = MetricConfiguration(
+                metric_name=f"{metric_name}.aggregate_fn",
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=dict(),
+            )
+            aggregate_fns.append(aggregate_fn)
+            metrics_to_resolve.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=dict(),
+                    metric_dependencies={"metric_partial_fn": aggregate_fn},
+                )
+            )
+        aggregate_fn = MetricConfiguration(
+            metric_name="table.row_count.aggregate_fn",
+            metric_domain_kwargs={
+                key: value
+                for key, value in metric_domain_kwargs.items()
+                if key != "column"
+            },
+            metric_value_kwargs=dict(),
+        )
+        aggregate_fns.append(aggregate_fn)
+        metrics_to_resolve.append(
+            MetricConfiguration(
+                metric_name="table.row_count",
+                metric_domain_kwargs=aggregate_fn.metric_domain_kwargs,
+                metric_value_kwargs=dict(),
+                metric_dependencies={"metric_partial_fn": aggregate_fn},
+            )
+        )
+
+    unfused_results = unfused_engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve,
+        metrics=unfused_engine.resolve_metrics(metrics_to_resolve=aggregate_fns),
+    )
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    fused_results = fused_engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve,
+        metrics=fused_engine.resolve_metrics(metrics_to_resolve=aggregate_fns),
+    )
+
+    assert fused_results == unfused_results
+    assert [fused_results[metric.id] for metric in metrics_to_resolve] == [
+        5,
+        15,
+        6,
+        3,
+        6,
+        3,
+        5,
+        9,
+        3,
+        5,
+        15,
+        5,
+    ]
+    # All twelve metrics were computed in a single scan of the table
+    assert [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SqlAlchemyExecutionEngine computed")
+    ] == ["SqlAlchemyExecutionEngine computed 12 metrics on domain_id ()"]
+
+
+def test_resolve_metric_bundle_with_histograms_medians_and_value_counts(caplog, sa):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, 5, None], "b": [1, 1, 1, 2, 2, 2]})
+    )
+    statements = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    nonnull_counts = {
+        "a": MetricConfiguration("column_values.nonnull.count", {"column": "a"}),
+        "b": MetricConfiguration("column_values.nonnull.count", {"column": "b"}),
+    }
+    metrics = {nonnull_counts["a"].id: 5, nonnull_counts["b"].id: 6}
+    metric_kwargs = [
+        ("column.histogram", "a", {"bins": (0, 2, 4, 6)}),
+        ("column.histogram", "b", {"bins": (1, 1.5, 2)}),
+        ("column.median", "a", dict()),
+        ("column.median", "b", dict()),
+        ("column.max", "a", dict()),
+        ("column.value_counts", "a", {"sort": "value", "collate": None}),
+        ("column.value_counts", "b", {"sort": "value", "collate": None}),
+    ]
+    aggregate_fns = []
+    metrics_to_resolve = []
+    for metric_name, column, metric_value_kwargs in metric_kwargs:
+        aggregate_fn = MetricConfiguration(
+            metric_name=f"{metric_name}.aggregate_fn",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=metric_value_kwargs,
+            metric_dependencies={"column_values.nonnull.count": nonnull_counts[column]},
+        )
+        aggregate_fns.append(aggregate_fn)
+        metrics_to_resolve.append(
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": column},
+                metric_value_kwargs=metric_value_kwargs,
+                metric_dependencies={"metric_partial_fn": aggregate_fn},
+            )
+        )
+    metrics.update(
+        engine.resolve_metrics(metrics_to_resolve=aggregate_fns, metrics=metrics)
+    )
+    assert statements == []
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in metrics_to_resolve[:5]] == [
+        [1, 2, 2],
+        [3, 3],
+        3,
+        1.5,
+        5,
+    ]
+    assert pd.Series(index=[1.0, 2.0, 3.0, 4.0, 5.0], data=[1, 1, 1, 1, 1]).equals(
+        results[metrics_to_resolve[5].id]
+    )
+    assert pd.Series(index=[1, 2], data=[3, 3]).equals(
+        results[metrics_to_resolve[6].id]
+    )
+    # Histograms, medians and other aggregates are computed by a single query; the value counts of both columns by
+    # another one
+    assert len(statements) == 2
+    assert [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SqlAlchemyExecutionEngine computed")
+    ] == ["SqlAlchemyExecutionEngine computed 5 metrics on domain_id ()"]
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "postgresql", "mssql"])
+def test_resolve_metric_bundle_with_value_counts_of_columns_of_different_types(
+    sa, test_backends, backend
+):
+    if backend not in test_backends:
+        pytest.skip(f"requires {backend}")
+    validator = get_test_validator_with_data(
+        backend,
+        {"a": [1, 2, 2], "b": ["x", "y", "y"], "c": [1.5, 1.5, 2.5]},
+        schemas={
+            "sqlite": {"a": "INTEGER", "b": "VARCHAR", "c": "FLOAT"},
+            "postgresql": {"a": "INTEGER", "b": "TEXT", "c": "DOUBLE_PRECISION"},
+            "mssql": {"a": "INTEGER", "b": "VARCHAR", "c": "FLOAT"},
+        },
+    )
+    engine = validator.execution_engine
+
+    aggregate_fns = [
+        MetricConfiguration(
+            metric_name="column.value_counts.aggregate_fn",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"sort": "value", "collate": None},
+        )
+        for column in ["a", "b", "c"]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=aggregate_fns)
+    value_counts = [
+        MetricConfiguration(
+            metric_name="column.value_counts",
+            metric_domain_kwargs=aggregate_fn.metric_domain_kwargs,
+            metric_value_kwargs=aggregate_fn.metric_value_kwargs,
+            metric_dependencies={"metric_partial_fn": aggregate_fn},
+        )
+        for aggregate_fn in aggregate_fns
+    ]
+    # The value counts of the three columns (each of its own type) are computed by a single UNION ALL query
+    results = engine.resolve_metrics(metrics_to_resolve=value_counts, metrics=metrics)
+    assert [results[metric.id].to_dict() for metric in value_counts] == [
+        {1: 1, 2: 2},
+        {"x": 1, "y": 2},
+        {1.5: 2, 2.5: 1},
+    ]
@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import (
@@ -294,6 +295,82 @@ def test_map_unique_pd():
     assert list(results[desired_metric.id][0]) == [False, False, True, True]
 
 
+def test_map_unique_pd_unexpected_metrics():
+    engine = _build_pandas_engine(
+        pd.DataFrame(
+            {
+                "a": [1, None, 2, 3, 3, 4, 3],
+                "b": ["foo", "bar", "baz", "qux", "fish", "fowl", "bird"],
+            }
+        )
+    )
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.unique.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+
+    result_format = {"result_format": "BASIC", "partial_unexpected_count": 2}
+    desired_metrics = {
+        metric_name: MetricConfiguration(
+            metric_name=f"column_values.unique.{metric_name}",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict()
+            if metric_name == "unexpected_count"
+            else {"result_format": result_format},
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        for metric_name in [
+            "unexpected_count",
+            "unexpected_values",
+            "unexpected_index_list",
+            "unexpected_rows",
+        ]
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics.values(), metrics=metrics
+    )
+    assert results[desired_metrics["unexpected_count"].id] == 3
+    assert results[desired_metrics["unexpected_values"].id] == [3, 3]
+    assert results[desired_metrics["unexpected_index_list"].id] == [3, 4]
+    assert list(results[desired_metrics["unexpected_rows"].id]["b"]) == [
+        "qux",
+        "fish",
+    ]
+
+
+def test_map_json_metrics_pd():
+    engine = _build_pandas_engine(
+        pd.DataFrame(
+            {"a": ['{"a": 1}', '{"a": "b"}', "not json", '{"a": 1}', '{"a": "b"}']}
+        )
+    )
+    json_parseable = MetricConfiguration(
+        metric_name="column_values.json_parseable.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(json_parseable,))
+    assert list(results[json_parseable.id][0]) == [False, False, True, False, False]
+
+    matches_json_schema = MetricConfiguration(
+        metric_name="column_values.match_json_schema.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "json_schema": {
+                "type": "object",
+                "properties": {"a": {"type": "integer"}},
+            }
+        },
+    )
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": ['{"a": 1}', '{"a": "b"}', '{"a": 1}', "{}"]})
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(matches_json_schema,))
+    assert list(results[matches_json_schema.id][0]) == [False, True, False, False]
+
+
 def test_map_unique_spark(spark_session):
     engine = _build_spark_engine(
         pd.DataFrame(
@@ -717,19 +794,37 @@ def test_distinct_metric_sa(sa):
         pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
     )
 
+    partial_metric = MetricConfiguration(
+        metric_name="column.value_counts.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "value", "collate": None},
+    )
+    partial_metric_b = MetricConfiguration(
+        metric_name="column.value_counts.aggregate_fn",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"sort": "value", "collate": None},
+    )
+    metrics = engine.resolve_metrics(
+        metrics_to_resolve=(partial_metric, partial_metric_b)
+    )
+
     desired_metric = MetricConfiguration(
         metric_name="column.value_counts",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={"sort": "value", "collate": None},
+        metric_dependencies={"metric_partial_fn": partial_metric},
     )
     desired_metric_b = MetricConfiguration(
         metric_name="column.value_counts",
         metric_domain_kwargs={"column": "b"},
         metric_value_kwargs={"sort": "value", "collate": None},
+        metric_dependencies={"metric_partial_fn": partial_metric_b},
     )
 
-    metrics = engine.resolve_metrics(
-        metrics_to_resolve=(desired_metric, desired_metric_b)
+    metrics.update(
+        engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric, desired_metric_b), metrics=metrics
+        )
     )
     assert pd.Series(index=[1, 2, 3], data=[2, 2, 2]).equals(metrics[desired_metric.id])
     assert pd.Series(index=[4], data=[6]).equals(metrics[desired_metric_b.id])
@@ -955,3 +1050,68 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
         ):
             found_message = True
     assert found_message
+
+
+def test_distinct_values_approx_count_metric_pd():
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": [i % 1000 for i in range(5000)] + [None]})
+    )
+    sketch_metric = MetricConfiguration(
+        metric_name="column.hll_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_error": 0.01},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.approx_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate": 0.01},
+        metric_dependencies={"column.hll_sketch": sketch_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == pytest.approx(1000, rel=0.03)
+
+
+def test_distinct_values_approx_count_metric_sa(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 1, 3, None]}), sa)
+
+    partial_metric = MetricConfiguration(
+        metric_name="column.distinct_values.approx_count.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate": True},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(partial_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.approx_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate": True},
+        metric_dependencies={"metric_partial_fn": partial_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    # sqlite has no approximate distinct count, and counts distinct values exactly
+    assert results == {desired_metric.id: 3}
+
+
+def test_quantile_values_metric_pd_allow_relative_error():
+    values = np.random.RandomState(0).uniform(size=10000)
+    engine = _build_pandas_engine(pd.DataFrame({"a": values}))
+    sketch_metric = MetricConfiguration(
+        metric_name="column.kll_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_error": 0.01},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.25, 0.75], "allow_relative_error": 0.01},
+        metric_dependencies={"column.kll_sketch": sketch_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == pytest.approx([0.25, 0.75], abs=0.02)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.sketches import (
+    DEFAULT_SKETCH_RELATIVE_ERROR,
+    HyperLogLog,
+    KLLSketch,
+    get_sketch_relative_error,
+)
+
+
+def test_get_sketch_relative_error():
+    assert get_sketch_relative_error(False) is None
+    assert get_sketch_relative_error(None) is None
+    assert get_sketch_relative_error(True) == DEFAULT_SKETCH_RELATIVE_ERROR
+    assert get_sketch_relative_error(0.05) == 0.05
+    with pytest.raises(ValueError):
+        get_sketch_relative_error(2)
+
+
+@pytest.mark.parametrize("num_distinct_values", [10, 1000, 100000])
+def test_hyperloglog_count(num_distinct_values):
+    sketch = HyperLogLog.for_relative_error(0.01)
+    sketch.update(pd.Series(np.arange(num_distinct_values).repeat(3)))
+    assert sketch.count() == pytest.approx(num_distinct_values, rel=0.03)
+
+
+def test_hyperloglog_merge():
+    sketch = HyperLogLog().update(pd.Series(["a", "b", "c"] * 10))
+    other_sketch = HyperLogLog().update(pd.Series(["c", "d"]))
+    assert sketch.merge(other_sketch).count() == 4
+    assert HyperLogLog().count() == 0
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLog(precision=10))
+
+
+def test_hyperloglog_merges_sketches_of_values_read_with_different_dtypes():
+    sketch = HyperLogLog().update(pd.Series([1, 2, 3], dtype="int64"))
+    other_sketch = HyperLogLog().update(pd.Series([2.0, 3.0, 4.0, -0.0]))
+    object_sketch = HyperLogLog().update(pd.Series([4, 5.0], dtype=object))
+    assert sketch.merge(other_sketch).count() == 5
+    assert sketch.merge(other_sketch).merge(object_sketch).count() == 6
+
+    mixed_sketch = HyperLogLog().update(pd.Series([1, "a"], dtype=object))
+    other_mixed_sketch = HyperLogLog().update(pd.Series([1.0, "a"], dtype=object))
+    assert mixed_sketch.merge(other_mixed_sketch).count() == 2
+
+
+def test_kll_sketch_quantiles():
+    values = np.random.RandomState(0).normal(size=200000)
+    sketch = KLLSketch.for_relative_error(0.01)
+    for chunk in np.array_split(values, 17):
+        sketch.update(chunk)
+    assert sketch.count == len(values)
+
+    quantiles = [0.0, 0.1, 0.5, 0.9, 1.0]
+    estimates = sketch.quantiles(quantiles)
+    assert estimates[0] == values.min()
+    assert estimates[-1] == values.max()
+    for quantile, estimate in zip(quantiles[1:-1], estimates[1:-1]):
+        assert (values < estimate).mean() == pytest.approx(quantile, abs=0.01)
+    # The sketch stays much smaller than the values it summarizes
+    assert sum(len(items) for items in sketch._levels) < 1000
+
+
+def test_kll_sketch_merge():
+    values = np.random.RandomState(1).uniform(size=100000)
+    sketch = KLLSketch().update(values[:30000])
+    other_sketch = KLLSketch().update(values[30000:])
+    merged = sketch.merge(other_sketch)
+    assert merged.count == len(values)
+    assert (values < merged.quantiles([0.5])[0]).mean() == pytest.approx(0.5, abs=0.01)
+    assert KLLSketch().quantiles([0.5]) == [None]
@@ -1,6 +1,7 @@
 import os
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -16,7 +17,10 @@ from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
-from great_expectations.render.renderer.site_builder import SiteBuilder
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteSectionBuilder,
+    SiteBuilder,
+)
 
 
 def assert_how_to_buttons(
@@ -494,6 +498,146 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+def test_site_builder_only_renders_new_or_changed_resources(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+
+    def build_site():
+        site_builder = SiteBuilder(
+            data_context=context,
+            runtime_environment={"root_directory": context.root_directory},
+            **local_site_config
+        )
+        with mock.patch(
+            "great_expectations.render.renderer.site_builder.DefaultSiteSectionBuilder._get_manifest_entry",
+            side_effect=DefaultSiteSectionBuilder._get_manifest_entry,
+        ) as mock_get_manifest_entry, mock.patch.object(
+            context,
+            "get_validation_result",
+            wraps=context.get_validation_result,
+        ) as mock_get_validation_result, mock.patch.object(
+            expectations_store_backend,
+            "get_many",
+            wraps=expectations_store_backend.get_many,
+        ) as mock_get_many_expectations, mock.patch.object(
+            validations_store_backend,
+            "get_many",
+            wraps=validations_store_backend.get_many,
+        ) as mock_get_many_validations:
+            _, index_links_dict = site_builder.build()
+        rendered_resources = [
+            call[0][0] for call in mock_get_manifest_entry.call_args_list
+        ]
+        fetched_keys = {
+            key
+            for mock_get_many in [mock_get_many_expectations, mock_get_many_validations]
+            for call in mock_get_many.call_args_list
+            for key in call[0][0]
+        }
+        return (
+            site_builder,
+            index_links_dict,
+            rendered_resources,
+            mock_get_validation_result.call_count,
+            fetched_keys,
+        )
+
+    expectations_store_backend = context.stores["expectations_store"].store_backend
+    validations_store_backend = context.stores["validations_store"].store_backend
+    site_builder, index_links_dict, rendered_resources, _, _ = build_site()
+    validation_result_keys = context.stores["validations_store"].list_keys()
+    assert set(rendered_resources) == set(
+        context.stores["expectations_store"].list_keys()
+    ) | set(validation_result_keys)
+    site_manifest = site_builder.target_store.get_site_manifest()
+    assert set(site_manifest["sections"]["profiling"]) | set(
+        site_manifest["sections"]["validations"]
+    ) == {
+        site_builder.target_store.manifest_key_for_resource(key)
+        for key in validation_result_keys
+    }
+
+    # a new site builder reads the persisted manifest: nothing is fetched or rendered again and the index page is
+    # built without loading any validation result
+    (
+        _,
+        rebuilt_index_links_dict,
+        rendered_resources,
+        get_validation_result_call_count,
+        fetched_keys,
+    ) = build_site()
+    assert rendered_resources == []
+    assert fetched_keys == set()
+    assert get_validation_result_call_count == 0
+    assert rebuilt_index_links_dict == index_links_dict
+
+    # a resource rewritten with the same content is fetched, as its version changed, but not rendered again
+    validation_result_key = context.stores["validations_store"].list_keys()[0]
+    validation_result_path = os.path.join(
+        validations_store_backend.full_base_directory,
+        validations_store_backend._convert_key_to_filepath(
+            validation_result_key.to_tuple()
+        ),
+    )
+    os.utime(validation_result_path, ns=(0, 0))
+    _, _, rendered_resources, _, fetched_keys = build_site()
+    assert rendered_resources == []
+    assert fetched_keys == {validation_result_key.to_tuple()}
+    _, _, rendered_resources, _, fetched_keys = build_site()
+    assert fetched_keys == set()
+
+    # changed resources and missing pages are rendered again
+    expectation_suite_key = context.stores["expectations_store"].list_keys()[0]
+    expectation_suite = context.stores["expectations_store"].get(expectation_suite_key)
+    expectation_suite.meta["notes"] = "changed"
+    context.stores["expectations_store"].set(expectation_suite_key, expectation_suite)
+    validation_result_key = context.stores["validations_store"].list_keys()[0]
+    site_builder.target_store.store_backends[ValidationResultIdentifier].remove_key(
+        validation_result_key.to_tuple()
+    )
+    _, _, rendered_resources, _, fetched_keys = build_site()
+    assert set(rendered_resources) == {expectation_suite_key, validation_result_key}
+    assert fetched_keys == {
+        expectation_suite_key.to_tuple(),
+        validation_result_key.to_tuple(),
+    }
+
+
+def test_site_builder_fetches_resources_in_chunks(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    validations_store_backend = context.stores["validations_store"].store_backend
+    with mock.patch.object(
+        type(validations_store_backend),
+        "bulk_max_workers",
+        new_callable=mock.PropertyMock,
+        return_value=2,
+    ), mock.patch.object(
+        validations_store_backend,
+        "get_many",
+        wraps=validations_store_backend.get_many,
+    ) as mock_get_many:
+        site_builder.build()
+
+    fetched_keys = [key for call in mock_get_many.call_args_list for key in call[0][0]]
+    assert len(fetched_keys) > 2
+    assert all(len(call[0][0]) <= 2 for call in mock_get_many.call_args_list)
+    assert set(fetched_keys) == {
+        key.to_tuple() for key in context.stores["validations_store"].list_keys()
+    }
+
+
 @pytest.mark.rendered_output
 def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder_data_context_with_html_store_titanic_random,
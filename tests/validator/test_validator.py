@@ -1,16 +1,29 @@
+import copy
+from unittest import mock
+
+import numpy as np
 import pandas as pd
 import pytest
 
 import great_expectations.expectations.metrics
 from great_expectations.core import IDDict
 from great_expectations.core.batch import Batch, BatchRequest, PartitionRequest
+from great_expectations.core.batch_spec import PathBatchSpec
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
-from great_expectations.exceptions import InvalidDataContextKeyError
-from great_expectations.exceptions.metric_exceptions import MetricProviderError
+from great_expectations.exceptions import (
+    ExecutionEngineError,
+    InvalidDataContextKeyError,
+)
+from great_expectations.exceptions.metric_exceptions import (
+    MetricProviderError,
+    MetricResolutionError,
+)
 from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
 from great_expectations.expectations.core import ExpectColumnMaxToBeBetween
 from great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than import (
     ExpectColumnValueZScoresToBeLessThan,
@@ -18,9 +31,11 @@ from great_expectations.expectations.core.expect_column_value_z_scores_to_be_les
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.validator.validation_graph import (
     MetricConfiguration,
+    MetricEdge,
     ValidationGraph,
+    ValidationGraphScheduler,
 )
-from great_expectations.validator.validator import Validator
+from great_expectations.validator.validator import Validator, get_column_projection
 
 
 def test_parse_validation_graph():
@@ -93,6 +108,90 @@ def test_parse_validation_graph_with_bad_metrics_args():
     assert len(ready_metrics) == 4 and len(needed_metrics) == 5
 
 
+def test_metric_configuration_id_is_memoized():
+    metric = MetricConfiguration(
+        "column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": "1234"},
+        metric_value_kwargs={"parse_strings_as_datetimes": False},
+    )
+    metric_id = metric.id
+    assert metric.id is metric_id
+    assert metric_id == (
+        "column.max",
+        IDDict({"column": "a", "batch_id": "1234"}).to_id(),
+        "parse_strings_as_datetimes=False",
+    )
+    assert (
+        MetricConfiguration("column.max", {"batch_id": "1234", "column": "a"}).id[1]
+        is metric_id[1]
+    )
+
+    # The kwargs, including the containers nested in them, cannot be changed, so the id never goes stale
+    with pytest.raises(TypeError):
+        metric.metric_value_kwargs["parse_strings_as_datetimes"] = True
+    with pytest.raises(TypeError):
+        metric.metric_domain_kwargs.pop("batch_id")
+    value_set = [1, 2]
+    metric = MetricConfiguration(
+        "column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": value_set},
+    )
+    metric_id = metric.id
+    value_set.append(3)
+    with pytest.raises(TypeError):
+        metric.metric_value_kwargs["value_set"].append(3)
+    assert metric.metric_value_kwargs["value_set"] == [1, 2]
+    assert metric.id is metric_id
+
+    # Copies can be changed
+    value_kwargs = copy.deepcopy(metric.metric_value_kwargs)
+    value_kwargs["value_set"].append(3)
+    assert (
+        MetricConfiguration(
+            "column_values.in_set.condition",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=value_kwargs,
+        ).metric_value_kwargs_id
+        == "value_set=[1, 2, 3]"
+    )
+    assert copy.deepcopy(metric).id == metric_id
+
+
+def test_get_column_projection():
+    suite = ExpectationSuite("projection_suite")
+    for expectation_type, kwargs in [
+        ("expect_column_values_to_not_be_null", {"column": "b"}),
+        (
+            "expect_column_pair_values_A_to_be_greater_than_B",
+            {"column_A": "c", "column_B": "a"},
+        ),
+        (
+            "expect_multicolumn_values_to_be_unique",
+            {
+                "column_list": ["d", "e"],
+                "row_condition": 'f == "x" and `g h` > 0',
+                "condition_parser": "pandas",
+            },
+        ),
+        ("expect_table_columns_to_match_set", {"column_set": ["z"]}),
+        ("expect_table_row_count_to_equal", {"value": 3}),
+    ]:
+        suite.add_expectation(
+            ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+        )
+    assert get_column_projection(suite) == ["a", "b", "c", "d", "e", "f", "g h", "x"]
+
+    # a table-level expectation that reads the data requires the full batch
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal_other_table",
+            kwargs={"other_table_name": "other"},
+        )
+    )
+    assert get_column_projection(suite) is None
+
+
 def test_populate_dependencies():
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
     expectationConfiguration = ExpectationConfiguration(
@@ -126,6 +225,51 @@ def test_populate_dependencies():
     assert len(graph.edges) == 10
 
 
+def test_validation_graph_scheduler_releases_metrics_in_dependency_order():
+    table_row_count = MetricConfiguration("table.row_count", {})
+    column_min = MetricConfiguration("column.min", {"column": "a"})
+    column_max = MetricConfiguration("column.max", {"column": "a"})
+    column_mean = MetricConfiguration("column.mean", {"column": "a"})
+    graph = ValidationGraph()
+    graph.add(MetricEdge(table_row_count, None))
+    graph.add(MetricEdge(column_min, None))
+    graph.add(MetricEdge(column_max, None))
+    graph.add(MetricEdge(column_mean, column_min))
+    graph.add(MetricEdge(column_mean, column_max))
+    graph.add(MetricEdge(column_mean, table_row_count))
+
+    scheduler = ValidationGraphScheduler(
+        graph, resolved_metric_ids={table_row_count.id: 6}
+    )
+    assert scheduler.pending_count == 3
+
+    ready_metrics = scheduler.pop_ready()
+    assert {metric.id for metric in ready_metrics} == {column_min.id, column_max.id}
+    assert not scheduler.has_ready()
+
+    scheduler.mark_resolved([column_min.id])
+    assert not scheduler.has_ready()
+    scheduler.mark_resolved([column_max.id])
+    assert [metric.id for metric in scheduler.pop_ready()] == [column_mean.id]
+
+    scheduler.mark_resolved([column_mean.id])
+    assert scheduler.pending_count == 0
+    scheduler.check_complete()
+
+
+def test_validation_graph_scheduler_detects_unresolvable_metrics():
+    metric_a = MetricConfiguration("metric.a", {})
+    metric_b = MetricConfiguration("metric.b", {})
+    graph = ValidationGraph()
+    graph.add(MetricEdge(metric_a, metric_b))
+    graph.add(MetricEdge(metric_b, metric_a))
+
+    scheduler = ValidationGraphScheduler(graph)
+    assert not scheduler.has_ready()
+    with pytest.raises(MetricResolutionError):
+        scheduler.check_complete()
+
+
 def test_populate_dependencies_with_incorrect_metric_name():
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
     expectationConfiguration = ExpectationConfiguration(
@@ -219,6 +363,341 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+def test_graph_validate_with_max_workers(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        BatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "batch_data": df,
+                "partition_request": PartitionRequest(
+                    **{
+                        "partition_identifiers": {
+                            "pipeline_stage_name": 0,
+                            "airflow_run_id": 0,
+                            "custom_key_0": 0,
+                        }
+                    }
+                ),
+            }
+        )
+    )
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={
+                "column": column,
+                "mostly": 0.9,
+                "threshold": 4,
+                "double_sided": True,
+            },
+        )
+        for column in ["a", "b"]
+    ]
+    # Without the metric cache, both runs compute every metric
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(caching=False), batches=[batch]
+    )
+    sequential_result = validator.graph_validate(
+        configurations=expectation_configurations
+    )
+    concurrent_result = validator.graph_validate(
+        configurations=expectation_configurations,
+        runtime_configuration={"max_workers": 4},
+    )
+    assert concurrent_result == sequential_result
+    assert all(result.success for result in concurrent_result)
+
+
+def test_get_metric_uses_metric_cache(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        BatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "batch_data": df,
+                "partition_request": PartitionRequest(
+                    **{
+                        "partition_identifiers": {
+                            "pipeline_stage_name": 0,
+                            "airflow_run_id": 0,
+                            "custom_key_0": 0,
+                        }
+                    }
+                ),
+            }
+        )
+    )
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine, batches=[batch])
+    metric = MetricConfiguration(
+        "column.standard_deviation", metric_domain_kwargs={"column": "b"}
+    )
+    standard_deviation = validator.get_metric(metric)
+    assert engine.metric_cache_stats["column.standard_deviation"]["misses"] == 1
+
+    with mock.patch.object(
+        Validator, "build_metric_dependency_graph"
+    ) as build_metric_dependency_graph:
+        assert validator.get_metric(metric) == standard_deviation
+    build_metric_dependency_graph.assert_not_called()
+    assert engine.metric_cache_stats["column.standard_deviation"]["hits"] == 1
+
+
+def test_graph_validate_chunked_batch(tmp_path):
+    df = pd.DataFrame(
+        {
+            "a": [float(i % 17) if i % 5 else None for i in range(100)],
+            "b": [["x", "y", "z"][i % 3] for i in range(100)],
+        }
+    )
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "a", "min_value": 2, "max_value": 12},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "b",
+                "value_set": ["x", "y"],
+                "row_condition": "a>5",
+                "condition_parser": "pandas",
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_stdev_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_proportion_of_unique_values_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 1},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_most_common_value_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal", kwargs={"value": 100}
+        ),
+    ]
+    for configuration in expectation_configurations:
+        configuration.kwargs["result_format"] = "COMPLETE"
+
+    def graph_validate(batch_spec):
+        engine = PandasExecutionEngine()
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+        validator = Validator(
+            execution_engine=engine,
+            batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+        )
+        return validator.graph_validate(configurations=expectation_configurations)
+
+    results = graph_validate(PathBatchSpec(path=path))
+    chunked_results = graph_validate(PathBatchSpec(path=path, chunk_size=30))
+    assert len(chunked_results) == len(results)
+    for chunked_result, result in zip(chunked_results, results):
+        assert chunked_result.success == result.success
+        if isinstance(result.result.get("observed_value"), float):
+            assert chunked_result.result["observed_value"] == pytest.approx(
+                result.result["observed_value"]
+            )
+        else:
+            assert chunked_result.result == result.result
+
+    # metrics that need all of the rows of the batch at once fail before any chunk is read
+    engine = PandasExecutionEngine()
+    validator = Validator(
+        execution_engine=engine,
+        batches=[
+            Batch(data=engine.get_batch_data(PathBatchSpec(path=path, chunk_size=30)))
+        ],
+    )
+    with mock.patch.object(
+        ChunkedPandasBatchData, "iter_chunks"
+    ) as iter_chunks, pytest.raises(ExecutionEngineError):
+        validator.graph_validate(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_unique",
+                    kwargs={"column": "a"},
+                )
+            ],
+            runtime_configuration={"catch_exceptions": False},
+        )
+    iter_chunks.assert_not_called()
+
+
+def test_graph_validate_approximate_expectations(tmp_path):
+    random_state = np.random.RandomState(0)
+    df = pd.DataFrame(
+        {
+            "a": random_state.randint(0, 2000, size=10000).astype(float),
+            "b": random_state.normal(size=10000),
+        }
+    )
+    df.loc[::7, "a"] = None
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": "a", "approximate": True},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_proportion_of_unique_values_to_be_between",
+            kwargs={"column": "a", "approximate": 0.02},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_quantile_values_to_be_between",
+            kwargs={
+                "column": "b",
+                "quantile_ranges": {
+                    "quantiles": [0.1, 0.5, 0.9],
+                    "value_ranges": [[None, None], [None, None], [None, None]],
+                },
+                "allow_relative_error": True,
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_median_to_be_between",
+            kwargs={"column": "b", "allow_relative_error": 0.01},
+        ),
+    ]
+    exact_values = [
+        df["a"].nunique(),
+        df["a"].nunique() / df["a"].notnull().sum(),
+        df["b"].quantile([0.1, 0.5, 0.9]).tolist(),
+        df["b"].median(),
+    ]
+
+    # sketches are merged across chunks, so that approximate metrics are also supported on chunked batches
+    for batch_spec in [
+        PathBatchSpec(path=path),
+        PathBatchSpec(path=path, chunk_size=3000),
+    ]:
+        engine = PandasExecutionEngine()
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+        validator = Validator(
+            execution_engine=engine,
+            batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+        )
+        results = validator.graph_validate(
+            configurations=expectation_configurations,
+            runtime_configuration={"catch_exceptions": False},
+        )
+        observed_values = [result.result["observed_value"] for result in results]
+        assert all(result.success for result in results)
+        assert observed_values[0] == pytest.approx(exact_values[0], rel=0.03)
+        assert observed_values[1] == pytest.approx(exact_values[1], rel=0.06)
+        assert observed_values[2]["values"] == pytest.approx(exact_values[2], abs=0.05)
+        assert observed_values[3] == pytest.approx(exact_values[3], abs=0.05)
+
+
+def test_graph_validate_approximate_expectations_on_chunks_of_mixed_dtypes(tmp_path):
+    df = pd.DataFrame({"a": np.arange(1000, dtype=float)})
+    # Only the first chunk has a null: it reads "a" as float64, and the others as int64
+    df.loc[0, "a"] = None
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False, float_format="%.0f")
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_unique_value_count_to_be_between",
+        kwargs={"column": "a", "approximate": True},
+    )
+
+    observed_values = []
+    for batch_spec in [
+        PathBatchSpec(path=path),
+        PathBatchSpec(path=path, chunk_size=100),
+    ]:
+        engine = PandasExecutionEngine()
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+        validator = Validator(
+            execution_engine=engine,
+            batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+        )
+        results = validator.graph_validate(
+            configurations=[expectation_configuration],
+            runtime_configuration={"catch_exceptions": False},
+        )
+        observed_values.append(results[0].result["observed_value"])
+    assert observed_values[0] == pytest.approx(999, rel=0.03)
+    assert observed_values[1] == observed_values[0]
+
+
+def test_validate_suites_in_a_single_pass():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    failure_suite = ExpectationSuite(
+        expectation_suite_name="failure",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 30},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b", "mostly": 0.8},
+            ),
+        ],
+    )
+    warning_suite = ExpectationSuite(
+        expectation_suite_name="warning",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 10},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b"},
+            ),
+        ],
+    )
+    engine = PandasExecutionEngine(caching=False)
+    validator = Validator(execution_engine=engine, batches=[Batch(data=df)])
+
+    resolved_metric_ids = []
+    resolve_metrics = engine.resolve_metrics
+
+    def counting_resolve_metrics(metrics_to_resolve, *args, **kwargs):
+        resolved = resolve_metrics(metrics_to_resolve, *args, **kwargs)
+        resolved_metric_ids.extend(resolved.keys())
+        return resolved
+
+    with mock.patch.object(engine, "resolve_metrics", counting_resolve_metrics):
+        failure_result, warning_result = validator.validate_suites(
+            [failure_suite, warning_suite]
+        )
+    # Metrics the suites share are only computed once
+    assert len(resolved_metric_ids) == len(set(resolved_metric_ids))
+
+    assert failure_result.meta["expectation_suite_name"] == "failure"
+    assert failure_result.success
+    assert failure_result.statistics["evaluated_expectations"] == 2
+    assert warning_result.meta["expectation_suite_name"] == "warning"
+    assert not warning_result.success
+    assert warning_result.statistics["unsuccessful_expectations"] == 2
+
+    for expectation_suite, suite_result in [
+        (failure_suite, failure_result),
+        (warning_suite, warning_result),
+    ]:
+        assert validator.validate(expectation_suite).results == suite_result.results
+
+
 # this might indicate that we need to validate configuration a little more strictly prior to actually validating
 def test_graph_validate_with_bad_config(basic_datasource):
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})